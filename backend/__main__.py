@@ -1,5 +1,7 @@
 """Briefcase entrypoint for the backend service."""
 
+import multiprocessing
+
 from icloudbridge.scripts.menubar_backend import run
 
 
@@ -8,4 +10,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # The frozen binary re-enters here for worker processes (rich notes export)
+    multiprocessing.freeze_support()
     main()
@@ -24,6 +24,7 @@ a = Analysis(
         'icloudbridge.scripts.menubar_backend',
         'icloudbridge.api.app',
         'fastapi',
+        'orjson',
         'uvicorn',
         'uvicorn.logging',
         'uvicorn.loops',
@@ -52,6 +53,9 @@ a = Analysis(
         'aiosqlite',
         'apscheduler',
         'apscheduler.schedulers.asyncio',
+        'ijson',
+        'ijson.backends.yajl2_c',
+        'ijson.backends.python',
         'markdown_it',
         'html_to_markdown',
         'email_validator',
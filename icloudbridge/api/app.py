@@ -17,7 +17,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -28,7 +28,7 @@ from icloudbridge.api.exceptions import (
     validation_exception_handler,
 )
 from icloudbridge.core.config import load_config
-from icloudbridge.utils.db import SettingsDB
+from icloudbridge.utils.db import SettingsDB, import_legacy_state
 from icloudbridge.utils.logging import (
     attach_websocket_log_handler,
     set_logging_level,
@@ -77,27 +77,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         set_logging_level(stored_level)
 
     attach_websocket_log_handler(asyncio.get_running_loop(), config)
-    logger.info(f"Configuration loaded from {config.general.config_file or 'defaults'}")
+    logger.info("Configuration loaded from %s", config.general.config_file or "defaults")
 
     # Ensure data directory exists
     config.ensure_data_dir()
-    logger.info(f"Data directory: {config.general.data_dir}")
+    logger.info("Data directory: %s", config.general.data_dir)
+
+    # Sync logs and schedules share state.db; pull in rows from the old per-table files
+    await import_legacy_state(config.state_db_path)
 
     # Initialize scheduler
     from icloudbridge.api.scheduler import SchedulerManager
     global scheduler
     scheduler = SchedulerManager(config)
     await scheduler.start()
+    app.state.scheduler = scheduler
+
+    # EventKit is macOS-only; share one Reminders adapter across requests when available.
+    # Access is still requested lazily (and cached by the adapter) so startup never
+    # blocks on the permission prompt.
+    app.state.reminders_adapter = None
+    try:
+        from icloudbridge.sources.reminders.eventkit import RemindersAdapter
+
+        app.state.reminders_adapter = RemindersAdapter()
+    except Exception as e:
+        logger.debug("EventKit unavailable, Apple Reminders endpoints disabled: %s", e)
     logger.info("Scheduler initialized and started")
 
     yield
 
     # Shutdown
     logger.info("iCloudBridge API shutting down...")
+    from icloudbridge.api.background import cancel_background_syncs
+    await cancel_background_syncs()
     if scheduler:
         await scheduler.stop()
         logger.info("Scheduler stopped")
 
+    # Close pooled connections cleanly; the last one to close checkpoints each WAL file
+    from icloudbridge.utils.db import close_pools
+    await close_pools()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
@@ -113,6 +134,7 @@ def create_app() -> FastAPI:
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
@@ -129,10 +151,10 @@ def create_app() -> FastAPI:
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         """Log all incoming requests."""
-        logger.debug(f"{request.method} {request.url.path}")
+        logger.debug("%s %s", request.method, request.url.path)
         response = await call_next(request)
         logger.debug(
-            f"{request.method} {request.url.path} - {response.status_code}"
+            "%s %s - %s", request.method, request.url.path, response.status_code
         )
         return response
 
@@ -162,6 +184,9 @@ def create_app() -> FastAPI:
     app.include_router(settings.router, prefix="/api/settings", tags=["Settings"])
     app.include_router(system.router, prefix="/api/system", tags=["System"])
 
+    # Added last so it is outermost: health/version probes skip the stack above
+    app.add_middleware(health.ProbeMiddleware, prefix="/api")
+
     # WebSocket endpoint
     from icloudbridge.api.websocket import websocket_endpoint
     app.add_api_websocket_route("/api/ws", websocket_endpoint)
@@ -29,50 +29,64 @@ logger = logging.getLogger(__name__)
 AUTH_ENABLED = False
 
 
-async def verify_token(
-    authorization: Annotated[str | None, Header()] = None,
-    config: AppConfig = Depends(get_config),
-) -> dict:
-    """Verify JWT token from Authorization header.
+# Template for the mock user returned while authentication is disabled
+_LOCAL_USER = {
+    "user_id": "local",
+    "username": "local",
+    "roles": ["admin"],
+}
 
-    Args:
-        authorization: Authorization header value (Bearer token)
-        config: Application configuration
 
-    Returns:
-        dict: User information from token payload
+if AUTH_ENABLED:
 
-    Raises:
-        AuthenticationError: If auth is enabled and token is invalid/missing
+    async def verify_token(
+        authorization: Annotated[str | None, Header()] = None,
+        config: AppConfig = Depends(get_config),
+    ) -> dict:
+        """Verify JWT token from Authorization header.
 
-    Note:
-        This is scaffolding for future JWT authentication.
-        Currently returns a mock user when auth is disabled.
-    """
-    if not AUTH_ENABLED:
-        # Auth disabled - return mock user for development
-        return {
-            "user_id": "local",
-            "username": "local",
-            "roles": ["admin"],
-        }
-
-    # Future JWT authentication logic
-    if not authorization:
-        raise AuthenticationError("Authorization header missing")
-
-    if not authorization.startswith("Bearer "):
-        raise AuthenticationError("Invalid authorization header format")
-
-    token = authorization.replace("Bearer ", "")
-
-    # TODO: Implement JWT validation
-    # - Verify token signature
-    # - Check expiration
-    # - Extract user info from payload
-    # - Return user dict
-
-    raise AuthenticationError("Authentication not yet implemented")
+        Args:
+            authorization: Authorization header value (Bearer token)
+            config: Application configuration
+
+        Returns:
+            dict: User information from token payload
+
+        Raises:
+            AuthenticationError: If token is invalid/missing
+
+        Note:
+            This is scaffolding for future JWT authentication.
+        """
+        # Future JWT authentication logic
+        if not authorization:
+            raise AuthenticationError("Authorization header missing")
+
+        if not authorization.startswith("Bearer "):
+            raise AuthenticationError("Invalid authorization header format")
+
+        token = authorization.replace("Bearer ", "")
+
+        # TODO: Implement JWT validation
+        # - Verify token signature
+        # - Check expiration
+        # - Extract user info from payload
+        # - Return user dict
+
+        raise AuthenticationError("Authentication not yet implemented")
+
+else:
+
+    async def verify_token() -> dict:
+        """Return the local mock user.
+
+        Auth is disabled, so this takes no parameters and FastAPI resolves no
+        header or config dependencies for it.
+
+        Returns:
+            dict: A fresh copy of the mock user information
+        """
+        return {**_LOCAL_USER, "roles": list(_LOCAL_USER["roles"])}
 
 
 async def require_auth(user: dict = Depends(verify_token)) -> dict:
@@ -0,0 +1,134 @@
+"""Background execution for long-running sync requests.
+
+Sync endpoints normally hold the HTTP request open until the engine finishes.
+When a client asks for a background sync, the endpoint records a ``queued``
+sync log, hands the work to this module and returns ``202 Accepted`` with the
+log ID. The client then polls the log for the outcome.
+
+Concurrent background syncs are bounded so a burst of requests cannot start
+an unlimited number of sync engines at once.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from icloudbridge.api.dependencies import invalidate_status
+from icloudbridge.utils.db import SyncLogsDB
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKGROUND_SYNCS = 2
+
+_sync_slots: asyncio.Semaphore | None = None
+_tasks: set[asyncio.Task] = set()
+
+
+def start_background_sync(
+    sync_logs_db: SyncLogsDB,
+    log_id: int,
+    run: Callable[[], Awaitable[Any]],
+    failed_status: str = "failed",
+) -> dict:
+    """Run a sync in the background once a worker slot is free.
+
+    Args:
+        sync_logs_db: Sync logs database holding the queued log entry
+        log_id: ID of the queued sync log entry
+        run: Coroutine factory performing the sync and recording its outcome
+        failed_status: Status the owning service records for a failed sync,
+            used if the sync is cancelled before it finishes
+
+    Returns:
+        Response body for the 202 Accepted reply
+    """
+    global _sync_slots
+    if _sync_slots is None:
+        _sync_slots = asyncio.Semaphore(MAX_BACKGROUND_SYNCS)
+    slots = _sync_slots
+
+    async def worker() -> None:
+        try:
+            async with slots:
+                await sync_logs_db.update_log(log_id=log_id, status="running")
+                invalidate_status()
+                try:
+                    await run()
+                except HTTPException:
+                    # The sync has already written the failure to its log entry
+                    pass
+                except Exception:
+                    logger.exception("Background sync %s failed", log_id)
+        except asyncio.CancelledError:
+            # Don't leave the log stuck in queued/running for clients polling it
+            await sync_logs_db.update_log(
+                log_id=log_id,
+                status=failed_status,
+                error_message="Sync cancelled before it finished (server shutting down)",
+            )
+            invalidate_status()
+            raise
+
+    task = asyncio.get_running_loop().create_task(worker())
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+    return {"status": "accepted", "log_id": log_id}
+
+
+async def cancel_background_syncs() -> None:
+    """Cancel background syncs that are still queued or running (on shutdown).
+
+    Each cancelled sync marks its log entry as failed before this returns.
+    """
+    tasks = list(_tasks)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def get_sync_job(sync_logs_db: SyncLogsDB, service: str, log_id: int) -> dict:
+    """Get the current state of a sync started by the given service.
+
+    Args:
+        sync_logs_db: Sync logs database
+        service: Service that owns the log entry
+        log_id: Sync log ID returned when the sync was accepted
+
+    Returns:
+        Dictionary with the sync status, timing, stats and error message
+    """
+    log = await sync_logs_db.get_log(log_id)
+    if not log or log["service"] != service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sync {log_id} not found",
+        )
+
+    stats = {}
+    if log.get("stats_json"):
+        try:
+            stats = json.loads(log["stats_json"])
+        except json.JSONDecodeError:
+            pass
+
+    return {
+        "id": log["id"],
+        "service": log["service"],
+        "status": log["status"],
+        "started_at": datetime.fromtimestamp(log["started_at"]).isoformat() if log.get("started_at") else None,
+        "completed_at": (
+            datetime.fromtimestamp(log["completed_at"]).isoformat()
+            if log.get("completed_at") and log["status"] not in ("queued", "running")
+            else None
+        ),
+        "duration_seconds": log.get("duration_seconds"),
+        "stats": stats,
+        "error_message": log.get("error_message"),
+    }
@@ -7,24 +7,76 @@ This module provides reusable dependencies for:
 - Authentication (when enabled)
 """
 
+import asyncio
 import logging
+import time
 from functools import lru_cache
-from typing import Annotated
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from icloudbridge.core.config import AppConfig, load_config
 from icloudbridge.core.passwords_sync import PasswordsSyncEngine
 from icloudbridge.core.photos_sync import PhotoSyncEngine
 from icloudbridge.core.reminders_sync import RemindersSyncEngine
 from icloudbridge.core.sync import NotesSyncEngine
-from icloudbridge.utils.db import NotesDB, PasswordsDB, RemindersDB
+from icloudbridge.utils.credentials import CredentialStore
+from icloudbridge.utils.db import (
+    NotesDB,
+    PasswordsDB,
+    RemindersDB,
+    SchedulesDB,
+    SettingsDB,
+    SyncLogsDB,
+)
 from icloudbridge.utils.photos_db import PhotosDB
 
+if TYPE_CHECKING:
+    from icloudbridge.api.scheduler import SchedulerManager
+    from icloudbridge.sources.reminders.eventkit import RemindersAdapter
+
 logger = logging.getLogger(__name__)
 
 
-@lru_cache
+# Bumped whenever the on-disk config changes; used as the cache key below
+_CONFIG_GEN = 0
+
+# Shared SyncLogsDB instances keyed by database path; the lock keeps concurrent
+# first requests from initializing the schema twice
+_sync_logs_dbs: dict[Path, SyncLogsDB] = {}
+_sync_logs_db_lock = asyncio.Lock()
+
+# Shared SchedulesDB instances keyed by database path, initialized the same way
+_schedules_dbs: dict[Path, SchedulesDB] = {}
+_schedules_db_lock = asyncio.Lock()
+
+# Shared SettingsDB instances keyed by database path; the lock keeps concurrent
+# first requests from initializing the schema twice
+_settings_dbs: dict[Path, SettingsDB] = {}
+_settings_db_lock = asyncio.Lock()
+
+# Bumped whenever sync state changes; cached status payloads from an older
+# generation are ignored. Entries are (generation, monotonic deadline, payload).
+_STATUS_GEN = 0
+_status_cache: dict[str, tuple[int, float, Any]] = {}
+
+# Keyring lookups are slow and password presence only changes through our own
+# handlers, so cache it per username: username -> (has_password, monotonic deadline)
+_CALDAV_PASSWORD_TTL = 60.0
+_caldav_password_cache: dict[str, tuple[bool, float]] = {}
+
+
+@lru_cache(maxsize=4)
+def _load_config(generation: int) -> AppConfig:
+    """Load the application configuration for a given config generation."""
+    # Load config from the path stored in settings database
+    from icloudbridge.utils.settings_db import get_config_path
+
+    config_path = get_config_path()
+    return load_config(config_path)
+
+
 def get_config() -> AppConfig:
     """Get the application configuration.
 
@@ -33,13 +85,88 @@ def get_config() -> AppConfig:
 
     Note:
         This is cached to avoid reloading config on every request.
-        Cache is cleared on config updates via the API.
+        Call invalidate_config() after config updates via the API.
     """
-    # Load config from the path stored in settings database
-    from icloudbridge.utils.settings_db import get_config_path
+    return _load_config(_CONFIG_GEN)
 
-    config_path = get_config_path()
-    return load_config(config_path)
+
+def invalidate_config() -> None:
+    """Force the next get_config() call to reload configuration from disk.
+
+    Also drops cached database handles, since the data directory may have
+    moved or been deleted.
+    """
+    global _CONFIG_GEN
+    _CONFIG_GEN += 1
+    _sync_logs_dbs.clear()
+    _settings_dbs.clear()
+    _schedules_dbs.clear()
+    invalidate_status()
+
+
+def get_cached_status(key: str) -> Any | None:
+    """Return a cached status payload if it is still fresh.
+
+    Args:
+        key: Name of the status endpoint
+
+    Returns:
+        The cached payload, or None if missing, expired or invalidated
+    """
+    entry = _status_cache.get(key)
+    if entry is None:
+        return None
+    generation, deadline, payload = entry
+    if generation != _STATUS_GEN or time.monotonic() >= deadline:
+        return None
+    return payload
+
+
+def cache_status(key: str, payload: Any, ttl: float) -> None:
+    """Cache a status payload for ``ttl`` seconds (disabled when ttl <= 0)."""
+    if ttl > 0:
+        _status_cache[key] = (_STATUS_GEN, time.monotonic() + ttl, payload)
+
+
+def invalidate_status() -> None:
+    """Drop cached status payloads after a sync or reset changes sync state."""
+    global _STATUS_GEN
+    _STATUS_GEN += 1
+
+
+@lru_cache(maxsize=1)
+def get_credential_store() -> CredentialStore:
+    """Get the shared keyring-backed credential store.
+
+    Returns:
+        CredentialStore: Process-wide credential store instance
+    """
+    return CredentialStore()
+
+
+async def has_caldav_password(credential_store: CredentialStore, username: str) -> bool:
+    """Check the keyring for a CalDAV password off the event loop, with a short cache.
+
+    Args:
+        credential_store: Credential store to query
+        username: CalDAV username
+
+    Returns:
+        True if a password is stored for the username
+    """
+    cached = _caldav_password_cache.get(username)
+    now = time.monotonic()
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    has_password = await asyncio.to_thread(credential_store.has_caldav_password, username)
+    _caldav_password_cache[username] = (has_password, now + _CALDAV_PASSWORD_TTL)
+    return has_password
+
+
+def forget_caldav_password(username: str) -> None:
+    """Drop the cached password presence after the keyring entry changes."""
+    _caldav_password_cache.pop(username, None)
 
 
 async def get_notes_sync_engine(config: Annotated[AppConfig, Depends(get_config)]) -> NotesSyncEngine:
@@ -168,6 +295,69 @@ async def get_passwords_db(config: Annotated[AppConfig, Depends(get_config)]) ->
     return db
 
 
+async def get_sync_logs_db(config: Annotated[AppConfig, Depends(get_config)]) -> SyncLogsDB:
+    """Get the shared sync logs database.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        SyncLogsDB: Sync logs database instance, initialized on first use
+    """
+    db_path = config.state_db_path
+    db = _sync_logs_dbs.get(db_path)
+    if db is None:
+        async with _sync_logs_db_lock:
+            db = _sync_logs_dbs.get(db_path)
+            if db is None:
+                db = SyncLogsDB(db_path)
+                await db.initialize()
+                _sync_logs_dbs[db_path] = db
+    return db
+
+
+async def get_schedules_db(config: Annotated[AppConfig, Depends(get_config)]) -> SchedulesDB:
+    """Get the shared schedules database.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        SchedulesDB: Schedules database instance, initialized on first use
+    """
+    db_path = config.state_db_path
+    db = _schedules_dbs.get(db_path)
+    if db is None:
+        async with _schedules_db_lock:
+            db = _schedules_dbs.get(db_path)
+            if db is None:
+                db = SchedulesDB(db_path)
+                await db.initialize()
+                _schedules_dbs[db_path] = db
+    return db
+
+
+async def get_settings_db(config: Annotated[AppConfig, Depends(get_config)]) -> SettingsDB:
+    """Get the shared settings database.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        SettingsDB: Settings database instance, initialized on first use
+    """
+    db_path = config.general.data_dir / "settings.db"
+    db = _settings_dbs.get(db_path)
+    if db is None:
+        async with _settings_db_lock:
+            db = _settings_dbs.get(db_path)
+            if db is None:
+                db = SettingsDB(db_path)
+                await db.initialize()
+                _settings_dbs[db_path] = db
+    return db
+
+
 async def get_photos_db(config: Annotated[AppConfig, Depends(get_config)]) -> PhotosDB:
     """Get a photos database connection."""
 
@@ -177,8 +367,27 @@ async def get_photos_db(config: Annotated[AppConfig, Depends(get_config)]) -> Ph
     return db
 
 
+def get_scheduler(request: Request) -> "SchedulerManager | None":
+    """Get the scheduler started by the application lifespan.
+
+    Returns:
+        SchedulerManager, or None if the scheduler is not running
+    """
+    return getattr(request.app.state, "scheduler", None)
+
+
+def get_reminders_adapter(request: Request) -> "RemindersAdapter | None":
+    """Get the shared EventKit Reminders adapter created at startup.
+
+    Returns:
+        RemindersAdapter, or None if EventKit is unavailable on this system
+    """
+    return getattr(request.app.state, "reminders_adapter", None)
+
+
 # Type aliases for dependency injection
 ConfigDep = Annotated[AppConfig, Depends(get_config)]
+CredentialStoreDep = Annotated[CredentialStore, Depends(get_credential_store)]
 NotesSyncEngineDep = Annotated[NotesSyncEngine, Depends(get_notes_sync_engine)]
 RemindersSyncEngineDep = Annotated[RemindersSyncEngine, Depends(get_reminders_sync_engine)]
 PasswordsSyncEngineDep = Annotated[PasswordsSyncEngine, Depends(get_passwords_sync_engine)]
@@ -187,3 +396,8 @@ NotesDBDep = Annotated[NotesDB, Depends(get_notes_db)]
 RemindersDBDep = Annotated[RemindersDB, Depends(get_reminders_db)]
 PasswordsDBDep = Annotated[PasswordsDB, Depends(get_passwords_db)]
 PhotosDBDep = Annotated[PhotosDB, Depends(get_photos_db)]
+SyncLogsDBDep = Annotated[SyncLogsDB, Depends(get_sync_logs_db)]
+SchedulesDBDep = Annotated[SchedulesDB, Depends(get_schedules_db)]
+SettingsDBDep = Annotated[SettingsDB, Depends(get_settings_db)]
+SchedulerDep = Annotated["SchedulerManager | None", Depends(get_scheduler)]
+RemindersAdapterDep = Annotated["RemindersAdapter | None", Depends(get_reminders_adapter)]
@@ -1,52 +1,66 @@
-"""Utility for issuing temporary download tokens for generated files."""
+"""Utility for issuing temporary download tokens for generated files.
+
+Token lookups in ``consume``/``invalidate`` rely on ``dict.pop`` being atomic
+under the CPython GIL and therefore skip the manager's lock. The lock only
+guards the shared random pool and the expiration heap.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import heapq
 import os
+import secrets
 import time
-import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+
+# Number of 16-byte tokens drawn from each random pool refill.
+_RAND_POOL_TOKENS = 256
 
 
 class DownloadTokenManager:
     """Manage short-lived download tokens mapped to local files."""
 
     def __init__(self) -> None:
-        self._tokens: Dict[str, Tuple[str, float, str]] = {}
-        self._expiry_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._tokens: dict[str, tuple[str, float, str]] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Single timer armed for the earliest pending expiration
+        self._expiry_handle: asyncio.TimerHandle | None = None
+        self._expiry_at = 0.0
+        # Reference to the running sweep so the task isn't garbage-collected mid-run
+        self._expiry_task: asyncio.Task | None = None
         self._lock = asyncio.Lock()
+        self._rand_pool = b""
+        self._rand_off = 0
 
-    async def register(self, path: Path, filename: str | None = None, ttl_seconds: int = 300) -> Tuple[str, float]:
+    async def register(self, path: Path, filename: str | None = None, ttl_seconds: int = 300) -> tuple[str, float]:
         """Register a file for download and return (token, expires_at)."""
 
-        if not path.exists():
-            raise FileNotFoundError(path)
+        # Raises FileNotFoundError if the file is missing
+        os.stat(path)
 
         await self._cleanup()
         async with self._lock:
-            token = uuid.uuid4().hex
-            expires_at = time.time() + ttl_seconds
+            token = self._next_token()
+            now = time.time()
+            expires_at = now + ttl_seconds
             safe_name = filename or path.name
             self._tokens[token] = (str(path), expires_at, safe_name)
-            self._schedule_expiration(token, ttl_seconds)
+            heapq.heappush(self._expiry_heap, (expires_at, token))
+            self._schedule_expiration()
             return token, expires_at
 
-    async def consume(self, token: str) -> Tuple[Path, str]:
+    async def consume(self, token: str) -> tuple[Path, str]:
         """Retrieve file path for download and remove the token."""
 
-        await self._cleanup()
-        async with self._lock:
-            info = self._tokens.pop(token, None)
-            handle = self._expiry_handles.pop(token, None)
-            if handle:
-                handle.cancel()
-            if not info:
-                raise KeyError("token not found")
+        # Expired tokens still in the map are caught below; the timer sweeps the rest
+        info = self._tokens.pop(token, None)
+        if not info:
+            raise KeyError("token not found")
 
         file_path, expires_at, filename = info
-        if time.time() > expires_at:
+        now = time.time()
+        if now > expires_at:
             self._safe_delete(Path(file_path))
             raise KeyError("token expired")
 
@@ -55,46 +69,69 @@ class DownloadTokenManager:
     async def invalidate(self, token: str, delete_file: bool = True) -> None:
         """Invalidate a token and optionally delete its file."""
 
-        async with self._lock:
-            info = self._tokens.pop(token, None)
-            handle = self._expiry_handles.pop(token, None)
-            if handle:
-                handle.cancel()
+        info = self._tokens.pop(token, None)
 
         if info and delete_file:
             self._safe_delete(Path(info[0]))
 
     async def _cleanup(self) -> None:
         async with self._lock:
-            expired = [tok for tok, (_, expires_at, _) in self._tokens.items() if time.time() > expires_at]
-            for token in expired:
-                path_str, _, _ = self._tokens.pop(token)
-                handle = self._expiry_handles.pop(token, None)
-                if handle:
-                    handle.cancel()
-                self._safe_delete(Path(path_str))
-
-    def _schedule_expiration(self, token: str, ttl_seconds: int) -> None:
-        loop = asyncio.get_running_loop()
-
-        async def expire() -> None:
-            async with self._lock:
+            now = time.time()
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                _, token = heapq.heappop(heap)
                 info = self._tokens.pop(token, None)
-                handle = self._expiry_handles.pop(token, None)
-                if handle:
-                    handle.cancel()
-            if info:
+                if info is None:
+                    # Already consumed or invalidated; drop the stale heap entry
+                    continue
                 self._safe_delete(Path(info[0]))
 
-        handle = loop.call_later(ttl_seconds, lambda: asyncio.create_task(expire()))
-        self._expiry_handles[token] = handle
+    def _next_token(self) -> str:
+        """Return a random 128-bit hex token from the pooled random buffer.
+
+        Must be called with ``self._lock`` held.
+        """
+        if self._rand_off + 16 > len(self._rand_pool):
+            self._rand_pool = secrets.token_bytes(16 * _RAND_POOL_TOKENS)
+            self._rand_off = 0
+        token = self._rand_pool[self._rand_off:self._rand_off + 16].hex()
+        self._rand_off += 16
+        return token
+
+    def _schedule_expiration(self) -> None:
+        """Arm one timer for the earliest expiration in the heap.
+
+        Expired tokens are swept from the heap by ``_cleanup``, so only a
+        single TimerHandle is live no matter how many tokens are registered.
+        """
+        if not self._expiry_heap:
+            return
+        next_expiry = self._expiry_heap[0][0]
+        if self._expiry_handle is not None:
+            if self._expiry_at <= next_expiry:
+                return
+            self._expiry_handle.cancel()
+
+        loop = asyncio.get_running_loop()
+        delay = max(0.0, next_expiry - time.time())
+        self._expiry_at = next_expiry
+        self._expiry_handle = loop.call_later(delay, self._expire_tokens)
+
+    def _expire_tokens(self) -> None:
+        """Timer callback: sweep expired tokens in a task."""
+        self._expiry_handle = None
+        self._expiry_task = asyncio.create_task(self._expire())
+
+    async def _expire(self) -> None:
+        await self._cleanup()
+        self._schedule_expiration()
 
     @staticmethod
     def _safe_delete(path: Path) -> None:
         try:
-            if path.exists():
-                os.remove(path)
+            os.unlink(path)
         except OSError:
+            # Missing files (already cleaned up by another consumer) land here too
             pass
 
 
@@ -7,14 +7,29 @@ This module provides:
 """
 
 import logging
-from typing import Any, Dict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for exceptions raised without details
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+# Constant parts of the generic error payloads
+_VALIDATION_ERROR_SHELL = {
+    "error": "Validation error",
+    "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
+}
+_INTERNAL_ERROR_SHELL = {
+    "error": "Internal server error",
+    "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
 
 class ICBException(Exception):
     """Base exception for iCloudBridge API errors.
@@ -22,25 +37,25 @@ class ICBException(Exception):
     Attributes:
         message: Human-readable error message
         status_code: HTTP status code
-        details: Additional error details (optional)
+        details: Additional error details (read-only empty mapping if omitted)
     """
 
     def __init__(
         self,
         message: str,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        details: Dict[str, Any] | None = None,
+        details: dict[str, Any] | None = None,
     ):
         self.message = message
         self.status_code = status_code
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY_DETAILS
         super().__init__(self.message)
 
 
 class ConfigurationError(ICBException):
     """Raised when there's a configuration error."""
 
-    def __init__(self, message: str, details: Dict[str, Any] | None = None):
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
         super().__init__(
             message=message,
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,7 +66,7 @@ class ConfigurationError(ICBException):
 class SyncError(ICBException):
     """Raised when a sync operation fails."""
 
-    def __init__(self, message: str, details: Dict[str, Any] | None = None):
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
         super().__init__(
             message=message,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -62,7 +77,7 @@ class SyncError(ICBException):
 class DatabaseError(ICBException):
     """Raised when a database operation fails."""
 
-    def __init__(self, message: str, details: Dict[str, Any] | None = None):
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
         super().__init__(
             message=message,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -73,7 +88,7 @@ class DatabaseError(ICBException):
 class NotFoundError(ICBException):
     """Raised when a resource is not found."""
 
-    def __init__(self, message: str, details: Dict[str, Any] | None = None):
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
         super().__init__(
             message=message,
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,7 +99,7 @@ class NotFoundError(ICBException):
 class AuthenticationError(ICBException):
     """Raised when authentication fails."""
 
-    def __init__(self, message: str = "Authentication required", details: Dict[str, Any] | None = None):
+    def __init__(self, message: str = "Authentication required", details: dict[str, Any] | None = None):
         super().__init__(
             message=message,
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -95,7 +110,7 @@ class AuthenticationError(ICBException):
 class AuthorizationError(ICBException):
     """Raised when authorization fails."""
 
-    def __init__(self, message: str = "Insufficient permissions", details: Dict[str, Any] | None = None):
+    def __init__(self, message: str = "Insufficient permissions", details: dict[str, Any] | None = None):
         super().__init__(
             message=message,
             status_code=status.HTTP_403_FORBIDDEN,
@@ -103,7 +118,7 @@ class AuthorizationError(ICBException):
         )
 
 
-async def icb_exception_handler(request: Request, exc: ICBException) -> JSONResponse:
+async def icb_exception_handler(request: Request, exc: ICBException) -> ORJSONResponse:
     """Handle ICBException and its subclasses.
 
     Args:
@@ -111,25 +126,31 @@ async def icb_exception_handler(request: Request, exc: ICBException) -> JSONResp
         exc: ICBException instance
 
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
+    path = request.url.path
     logger.error(
-        f"ICBException: {exc.message} (status={exc.status_code}, "
-        f"path={request.url.path}, details={exc.details})"
+        "ICBException: %s (status=%s, path=%s, details=%s)",
+        exc.message,
+        exc.status_code,
+        path,
+        exc.details,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.message,
             "status_code": exc.status_code,
-            "details": exc.details,
-            "path": str(request.url.path),
+            # orjson only serializes real dicts, and details may be any mapping
+            # (including the shared read-only default), so copy it
+            "details": dict(exc.details),
+            "path": path,
         },
     )
 
 
-async def validation_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle validation errors and unexpected exceptions.
 
     Args:
@@ -137,29 +158,29 @@ async def validation_exception_handler(request: Request, exc: Exception) -> JSON
         exc: Exception instance
 
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
+    path = request.url.path
     if isinstance(exc, ValidationError):
         # Handle Pydantic validation errors
-        logger.warning(f"Validation error on {request.url.path}: {exc.errors()}")
-        return JSONResponse(
+        errors = exc.errors()
+        logger.warning("Validation error on %s: %s", path, errors)
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
-                "error": "Validation error",
-                "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
-                "details": {"validation_errors": exc.errors()},
-                "path": str(request.url.path),
+                **_VALIDATION_ERROR_SHELL,
+                "details": {"validation_errors": errors},
+                "path": path,
             },
         )
 
     # Handle unexpected exceptions
-    logger.exception(f"Unexpected exception on {request.url.path}: {exc}")
-    return JSONResponse(
+    logger.exception("Unexpected exception on %s", path)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
-            "error": "Internal server error",
-            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            **_INTERNAL_ERROR_SHELL,
             "details": {"message": str(exc)} if logger.level == logging.DEBUG else {},
-            "path": str(request.url.path),
+            "path": path,
         },
     )
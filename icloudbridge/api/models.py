@@ -1,12 +1,17 @@
 """Pydantic models for API request/response validation."""
 
+import platform
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal, TypedDict
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 from icloudbridge.core.models import SyncStatus
 
+# Process-invariant runtime details, computed once at import
+_PYTHON_VERSION = platform.python_version()
+_PLATFORM = platform.platform()
+
 
 class SyncRequest(BaseModel):
     """Request model for synchronization operations."""
@@ -81,11 +86,19 @@ class HealthResponse(BaseModel):
     timestamp: str
 
 
+class ReadinessResponse(BaseModel):
+    """Response model for readiness check."""
+
+    status: str = "ready"
+    databases: dict[str, bool]
+
+
 class VersionResponse(BaseModel):
     """Response model for version information."""
 
     version: str
-    python_version: str
+    python_version: str = Field(default_factory=lambda: _PYTHON_VERSION)
+    platform: str = Field(default_factory=lambda: _PLATFORM)
 
 
 class ConfigResponse(BaseModel):
@@ -196,6 +209,10 @@ class NotesSyncRequest(BaseModel):
         default=None,
         description="Override shortcut pipeline preference (None = use config default, True/False = override)"
     )
+    background: bool = Field(
+        default=False,
+        description="Return 202 with a log_id immediately and run the sync in the background"
+    )
 
 
 class NotesAllFoldersResponse(BaseModel):
@@ -227,6 +244,7 @@ class RemindersSyncRequest(BaseModel):
     dry_run: bool = False
     skip_deletions: bool = False
     deletion_threshold: int = 5
+    background: bool = False
 
 
 class PhotoSyncRequest(BaseModel):
@@ -240,6 +258,10 @@ class PhotoSyncRequest(BaseModel):
     initial_scan: bool = Field(default=False, description="Initial scan to build database without importing")
     skip_deletions: bool = False
     deletion_threshold: int = 5
+    background: bool = Field(
+        default=False,
+        description="Return 202 with a log_id immediately and run the sync in the background",
+    )
 
 
 class PasswordsSyncRequest(BaseModel):
@@ -277,12 +299,21 @@ class ScheduleCreate(BaseModel):
         description="Deprecated single-service field. Prefer 'services'."
     )
     name: str = Field(..., description="User-friendly schedule name")
-    schedule_type: str = Field(..., description="Schedule type (interval or datetime)")
+    schedule_type: Literal["interval", "datetime"] = Field(..., description="Schedule type (interval or datetime)")
     interval_minutes: int | None = Field(None, description="Interval in minutes")
     cron_expression: str | None = Field(None, description="Cron expression")
     config_json: str | dict | None = Field(None, description="JSON sync configuration")
     enabled: bool = True
 
+    @model_validator(mode="after")
+    def check_trigger_fields(self) -> "ScheduleCreate":
+        """Require the trigger field that matches the schedule type."""
+        if self.schedule_type == "interval" and not self.interval_minutes:
+            raise ValueError("interval_minutes required for interval type")
+        if self.schedule_type == "datetime" and not self.cron_expression:
+            raise ValueError("cron_expression required for datetime type")
+        return self
+
 
 class ScheduleUpdate(BaseModel):
     """Request model for updating a schedule."""
@@ -353,3 +384,36 @@ class SetupVerificationResponse(BaseModel):
     notes_folder: NotesFolderStatus
     is_localhost: bool
     all_ready: bool
+
+
+# Plain response shapes for hot list endpoints. These are returned through
+# ORJSONResponse directly, so no Pydantic model is built per row.
+
+class SyncLogEntry(TypedDict):
+    """Sync history row as returned by the service history endpoints."""
+
+    id: int
+    service: str
+    operation: str
+    status: str
+    message: str
+    started_at: str | None
+    completed_at: str | None
+    duration_seconds: float | None
+    stats: dict[str, Any]
+    error_message: str | None
+
+
+class NoteFolderEntry(TypedDict):
+    """Apple Notes folder as returned by the folder listing endpoint."""
+
+    name: str
+    uuid: str
+    note_count: int
+
+
+class ReminderListEntry(TypedDict):
+    """Apple Reminders list as returned by the calendar listing endpoint."""
+
+    name: str
+    reminder_count: int
@@ -1,20 +1,63 @@
 """Configuration management endpoints."""
 
+import asyncio
 import logging
+import shutil
 from functools import lru_cache
+from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, status
 
-from icloudbridge.api.dependencies import ConfigDep
+from icloudbridge.api import dependencies
+from icloudbridge.api.dependencies import (
+    ConfigDep,
+    CredentialStoreDep,
+    forget_caldav_password,
+    invalidate_config,
+)
 from icloudbridge.api.models import ConfigResponse, ConfigUpdateRequest
-from icloudbridge.core.config import FolderMapping, PhotoSourceConfig, PasswordsConfig
-from icloudbridge.utils.credentials import CredentialStore
+from icloudbridge.core.config import (
+    AppConfig,
+    FolderMapping,
+    PasswordsConfig,
+    PhotoSourceConfig,
+    load_config,
+)
+from icloudbridge.sources.passwords.providers import NextcloudPasswordsProvider
+from icloudbridge.sources.passwords.vaultwarden_api import VaultwardenAPIClient
 from icloudbridge.sources.reminders.caldav_adapter import CalDAVAdapter
+from icloudbridge.utils.db import close_pools
+from icloudbridge.utils.settings_db import get_config_path, set_config_path
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Serializes config writes so files land in the order their snapshots were taken
+_save_lock = asyncio.Lock()
+
+
+async def _save_config(config: AppConfig) -> None:
+    """Write ``config`` to disk before the request returns.
+
+    The snapshot is taken on the event loop, so a concurrent request changing the
+    cached AppConfig can't alter it mid-write. The cached config is dropped either
+    way: the next request reloads the saved file, or the last good one if the save
+    failed, which this request reports as a 500.
+    """
+    snapshot = config.model_copy(deep=True)
+    async with _save_lock:
+        try:
+            await asyncio.to_thread(snapshot.save_to_file, snapshot.default_config_path)
+        except Exception as e:
+            logger.exception("Failed to save configuration")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to save configuration: {e}",
+            )
+        finally:
+            invalidate_config()
+
 
 def _serialize_folder_mappings(mappings: dict[str, FolderMapping]) -> dict[str, dict[str, str]]:
     """Convert FolderMapping objects into primitive dicts for responses."""
@@ -37,37 +80,43 @@ def _serialize_photo_sources(sources: dict[str, PhotoSourceConfig]) -> dict[str,
     return serialized
 
 
-@router.get("", response_model=ConfigResponse)
+@router.get("", responses={200: {"model": ConfigResponse}})
 async def get_config(config: ConfigDep):
     """Get current configuration.
 
     Returns the current configuration without sensitive data (passwords).
+    The payload matches ``ConfigResponse`` but is returned as a plain dict
+    to skip response model validation on this frequently polled endpoint.
     """
-    return ConfigResponse(
-        data_dir=str(config.general.data_dir),
-        config_file=str(config.default_config_path) if config.default_config_path else None,
-        notes_enabled=config.notes.enabled,
-        reminders_enabled=config.reminders.enabled,
-        passwords_enabled=config.passwords.enabled,
-        photos_enabled=config.photos.enabled,
-        notes_remote_folder=str(config.notes.remote_folder) if config.notes.remote_folder else None,
-        notes_folder_mappings=_serialize_folder_mappings(config.notes.folder_mappings),
-        reminders_caldav_url=config.reminders.caldav_url,
-        reminders_caldav_username=config.reminders.caldav_username,
-        reminders_sync_mode=config.reminders.sync_mode,
-        reminders_calendar_mappings=config.reminders.calendar_mappings or {},
-        passwords_provider=config.passwords.provider,
-        passwords_vaultwarden_url=config.passwords.vaultwarden_url,
-        passwords_vaultwarden_email=config.passwords.vaultwarden_email,
-        passwords_nextcloud_url=config.passwords.nextcloud_url,
-        passwords_nextcloud_username=config.passwords.nextcloud_username,
-        photos_default_album=config.photos.default_album,
-        photo_sources=_serialize_photo_sources(config.photos.sources),
-    )
-
-
-@router.put("", response_model=ConfigResponse)
-async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
+    return {
+        "data_dir": str(config.general.data_dir),
+        "config_file": str(config.default_config_path) if config.default_config_path else None,
+        "notes_enabled": config.notes.enabled,
+        "reminders_enabled": config.reminders.enabled,
+        "passwords_enabled": config.passwords.enabled,
+        "photos_enabled": config.photos.enabled,
+        "notes_remote_folder": str(config.notes.remote_folder) if config.notes.remote_folder else None,
+        "notes_folder_mappings": _serialize_folder_mappings(config.notes.folder_mappings),
+        "reminders_caldav_url": config.reminders.caldav_url,
+        "reminders_caldav_username": config.reminders.caldav_username,
+        "reminders_sync_mode": config.reminders.sync_mode,
+        "reminders_calendar_mappings": config.reminders.calendar_mappings or {},
+        "passwords_provider": config.passwords.provider,
+        "passwords_vaultwarden_url": config.passwords.vaultwarden_url,
+        "passwords_vaultwarden_email": config.passwords.vaultwarden_email,
+        "passwords_nextcloud_url": config.passwords.nextcloud_url,
+        "passwords_nextcloud_username": config.passwords.nextcloud_username,
+        "photos_default_album": config.photos.default_album,
+        "photo_sources": _serialize_photo_sources(config.photos.sources),
+    }
+
+
+@router.put("", responses={200: {"model": ConfigResponse}})
+async def update_config(
+    update: ConfigUpdateRequest,
+    config: ConfigDep,
+    credential_store: CredentialStoreDep,
+):
     """Update configuration.
 
     Updates the configuration and saves to disk. Passwords are stored
@@ -81,15 +130,10 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
     """
     # Debug: Log the entire update request
     print(f"[DEBUG] Received config update request: {update.model_dump(exclude_none=False)}")
-    logger.info(f"Received config update request: {update.model_dump(exclude_none=False)}")
-
-    credential_store = CredentialStore()
+    logger.info("Received config update request: %s", update.model_dump(exclude_none=False))
 
     # Update general config
     if update.data_dir is not None:
-        from pathlib import Path
-        from icloudbridge.utils.settings_db import set_config_path
-
         config.general.data_dir = Path(update.data_dir).expanduser()
         # Store config file location in database as single source of truth
         config_path = config.general.data_dir / "config.toml"
@@ -100,7 +144,6 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
     if update.notes_enabled is not None:
         config.notes.enabled = update.notes_enabled
     if update.notes_remote_folder is not None:
-        from pathlib import Path
         config.notes.remote_folder = Path(update.notes_remote_folder).expanduser()
     if update.notes_folder_mappings is not None:
         try:
@@ -109,7 +152,7 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
                 for apple_folder, mapping in update.notes_folder_mappings.items()
             }
         except Exception as exc:
-            logger.error(f"Invalid notes folder mappings: {exc}")
+            logger.exception("Invalid notes folder mappings")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid notes folder mappings: {exc}",
@@ -118,16 +161,16 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
     # Update reminders config
     if update.reminders_enabled is not None:
         config.reminders.enabled = update.reminders_enabled
-        logger.info(f"Updated reminders enabled: {update.reminders_enabled}")
+        logger.info("Updated reminders enabled: %s", update.reminders_enabled)
     if update.reminders_caldav_url is not None:
         config.reminders.caldav_url = update.reminders_caldav_url
-        logger.info(f"Updated CalDAV URL: {update.reminders_caldav_url}")
+        logger.info("Updated CalDAV URL: %s", update.reminders_caldav_url)
     if update.reminders_caldav_username is not None:
         config.reminders.caldav_username = update.reminders_caldav_username
-        logger.info(f"Updated CalDAV username: {update.reminders_caldav_username}")
+        logger.info("Updated CalDAV username: %s", update.reminders_caldav_username)
     if update.reminders_sync_mode is not None:
         config.reminders.sync_mode = update.reminders_sync_mode
-        logger.info(f"Updated sync mode: {update.reminders_sync_mode}")
+        logger.info("Updated sync mode: %s", update.reminders_sync_mode)
     if update.reminders_calendar_mappings is not None:
         caldav_lookup: dict[str, str] = {}
         if config.reminders.caldav_url and config.reminders.caldav_username:
@@ -151,7 +194,7 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
             for apple_name, caldav_name in update.reminders_calendar_mappings.items()
         }
         config.reminders.calendar_mappings = normalized_mappings
-        logger.info(f"Updated calendar mappings: {normalized_mappings}")
+        logger.info("Updated calendar mappings: %s", normalized_mappings)
 
     # Store password AFTER username is set
     print(f"[DEBUG] Checking password field: reminders_caldav_password = {update.reminders_caldav_password!r}")
@@ -164,11 +207,12 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
             if not username:
                 raise ValueError("CalDAV username is required to store password")
             credential_store.set_caldav_password(username, update.reminders_caldav_password)
+            forget_caldav_password(username)
             print(f"[DEBUG] CalDAV password stored in keyring for user: {username}")
-            logger.info(f"CalDAV password stored in keyring for user: {username}")
+            logger.info("CalDAV password stored in keyring for user: %s", username)
         except Exception as e:
             print(f"[DEBUG] Failed to store CalDAV password in keyring: {e}")
-            logger.error(f"Failed to store CalDAV password in keyring: {e}")
+            logger.exception("Failed to store CalDAV password in keyring")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to store CalDAV password: {str(e)}"
@@ -223,9 +267,9 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
                 client_id=client_id,
                 client_secret=client_secret,
             )
-            logger.info(f"VaultWarden credentials stored in keyring for: {email}")
+            logger.info("VaultWarden credentials stored in keyring for: %s", email)
         except Exception as e:
-            logger.error(f"Failed to store VaultWarden credentials in keyring: {e}")
+            logger.exception("Failed to store VaultWarden credentials in keyring")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to store VaultWarden credentials: {str(e)}"
@@ -240,9 +284,9 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
             if not username:
                 raise ValueError("Nextcloud username is required to store app password")
             credential_store.set_nextcloud_credentials(username, update.passwords_nextcloud_app_password)
-            logger.info(f"Nextcloud credentials stored in keyring for: {username}")
+            logger.info("Nextcloud credentials stored in keyring for: %s", username)
         except Exception as e:
-            logger.error(f"Failed to store Nextcloud credentials in keyring: {e}")
+            logger.exception("Failed to store Nextcloud credentials in keyring")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to store Nextcloud credentials: {str(e)}"
@@ -261,54 +305,22 @@ async def update_config(update: ConfigUpdateRequest, config: ConfigDep):
                 for name, src in update.photo_sources.items()
             }
         except Exception as exc:
-            logger.error(f"Invalid photo sources configuration: {exc}")
+            logger.exception("Invalid photo sources configuration")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid photo sources configuration: {exc}",
             )
 
-    # Save config to disk
-    try:
-        print(f"[DEBUG SAVE] Before save - username: {config.reminders.caldav_username}")
-        print(f"[DEBUG SAVE] Before save - URL: {config.reminders.caldav_url}")
-        print(f"[DEBUG SAVE] Saving to: {config.default_config_path}")
-        config.save_to_file(config.default_config_path)
-        print(f"[DEBUG SAVE] Config saved successfully")
-
-        # Clear the cached config so next request gets updated version
-        from icloudbridge.api.dependencies import get_config
-        get_config.cache_clear()
-
-        logger.info("Configuration updated successfully")
-    except Exception as e:
-        logger.error(f"Failed to save configuration: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to save configuration: {str(e)}"
-        )
+    # Save config to disk before responding so a failed write fails this request
+    await _save_config(config)
+    logger.info("Configuration updated successfully")
 
-    return ConfigResponse(
-        data_dir=str(config.general.data_dir),
-        config_file=str(config.default_config_path) if config.default_config_path else None,
-        notes_enabled=config.notes.enabled,
-        reminders_enabled=config.reminders.enabled,
-        passwords_enabled=config.passwords.enabled,
-        photos_enabled=config.photos.enabled,
-        notes_remote_folder=str(config.notes.remote_folder) if config.notes.remote_folder else None,
-        notes_folder_mappings=_serialize_folder_mappings(config.notes.folder_mappings),
-        reminders_caldav_url=config.reminders.caldav_url,
-        reminders_caldav_username=config.reminders.caldav_username,
-        reminders_sync_mode=config.reminders.sync_mode,
-        reminders_calendar_mappings=config.reminders.calendar_mappings or {},
-        passwords_vaultwarden_url=config.passwords.vaultwarden_url,
-        passwords_vaultwarden_email=config.passwords.vaultwarden_email,
-        photos_default_album=config.photos.default_album,
-        photo_sources=_serialize_photo_sources(config.photos.sources),
-    )
+    # Reuse the GET payload rather than building a second ConfigResponse
+    return await get_config(config)
 
 
 @router.get("/validate")
-async def validate_config(config: ConfigDep):
+async def validate_config(config: ConfigDep, credential_store: CredentialStoreDep):
     """Validate current configuration.
 
     Checks if the configuration is valid and all required fields are set.
@@ -333,7 +345,6 @@ async def validate_config(config: ConfigDep):
             errors.append("Reminders CalDAV username is not configured")
 
         # Check if password is available
-        credential_store = CredentialStore()
         if not credential_store.has_caldav_password(config.reminders.caldav_username):
             errors.append("Reminders CalDAV password is not stored in keyring")
 
@@ -345,7 +356,6 @@ async def validate_config(config: ConfigDep):
             errors.append("Passwords VaultWarden email is not configured")
 
         # Check if credentials are available
-        credential_store = CredentialStore()
         if not credential_store.has_vaultwarden_credentials(config.passwords.vaultwarden_email):
             errors.append("Passwords VaultWarden credentials are not stored in keyring")
 
@@ -356,7 +366,7 @@ async def validate_config(config: ConfigDep):
 
 
 @router.post("/reset")
-async def reset_configuration(config: ConfigDep):
+async def reset_configuration(config: ConfigDep, credential_store: CredentialStoreDep):
     """Complete configuration reset.
 
     This will:
@@ -371,14 +381,9 @@ async def reset_configuration(config: ConfigDep):
     Returns:
         Success message
     """
-    import shutil
-    from pathlib import Path
-
     logger.info("Starting complete configuration reset")
 
     try:
-        credential_store = CredentialStore()
-
         # 1. Delete passwords from keychain
         logger.info("Deleting passwords from keychain")
 
@@ -386,24 +391,28 @@ async def reset_configuration(config: ConfigDep):
         if config.reminders.caldav_username:
             try:
                 credential_store.delete_caldav_password(config.reminders.caldav_username)
-                logger.info(f"Deleted CalDAV password for: {config.reminders.caldav_username}")
+                forget_caldav_password(config.reminders.caldav_username)
+                logger.info("Deleted CalDAV password for: %s", config.reminders.caldav_username)
             except Exception as e:
-                logger.warning(f"Failed to delete CalDAV password: {e}")
+                logger.warning("Failed to delete CalDAV password: %s", e)
 
         # Delete VaultWarden credentials if email exists
         if config.passwords.vaultwarden_email:
             try:
                 credential_store.delete_vaultwarden_credentials(config.passwords.vaultwarden_email)
-                logger.info(f"Deleted VaultWarden credentials for: {config.passwords.vaultwarden_email}")
+                logger.info("Deleted VaultWarden credentials for: %s", config.passwords.vaultwarden_email)
             except Exception as e:
-                logger.warning(f"Failed to delete VaultWarden credentials: {e}")
+                logger.warning("Failed to delete VaultWarden credentials: %s", e)
 
         # 2. Get paths before we lose the config
         data_dir = Path(config.general.data_dir).expanduser()
         config_file = config.default_config_path
 
-        logger.info(f"Data directory: {data_dir}")
-        logger.info(f"Config file: {config_file}")
+        logger.info("Data directory: %s", data_dir)
+        logger.info("Config file: %s", config_file)
+
+        # Close pooled connections so nothing keeps writing to the deleted files
+        await close_pools()
 
         # 3. Delete individual database files first (in case data dir deletion fails)
         if data_dir.exists():
@@ -413,29 +422,28 @@ async def reset_configuration(config: ConfigDep):
                 if db_path.exists():
                     try:
                         db_path.unlink()
-                        logger.info(f"Deleted: {db_path}")
+                        logger.info("Deleted: %s", db_path)
                     except Exception as e:
-                        logger.warning(f"Failed to delete {db_path}: {e}")
+                        logger.warning("Failed to delete %s: %s", db_path, e)
 
         # 4. Delete the config file
         if config_file and config_file.exists():
             try:
                 config_file.unlink()
-                logger.info(f"Deleted config file: {config_file}")
+                logger.info("Deleted config file: %s", config_file)
             except Exception as e:
-                logger.warning(f"Failed to delete config file: {e}")
+                logger.warning("Failed to delete config file: %s", e)
 
         # 5. Delete the entire data directory
         if data_dir.exists():
             try:
                 shutil.rmtree(data_dir)
-                logger.info(f"Deleted data directory: {data_dir}")
+                logger.info("Deleted data directory: %s", data_dir)
             except Exception as e:
-                logger.warning(f"Failed to delete data directory: {e}")
+                logger.warning("Failed to delete data directory: %s", e)
 
         # 6. Clear the cached config so next request gets defaults
-        from icloudbridge.api.dependencies import get_config
-        get_config.cache_clear()
+        invalidate_config()
 
         logger.info("Configuration reset completed successfully")
 
@@ -445,7 +453,7 @@ async def reset_configuration(config: ConfigDep):
         }
 
     except Exception as e:
-        logger.error(f"Failed to reset configuration: {e}")
+        logger.exception("Failed to reset configuration")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset configuration: {str(e)}"
@@ -453,7 +461,7 @@ async def reset_configuration(config: ConfigDep):
 
 
 @router.post("/test-connection")
-async def test_connection(service: str, config: ConfigDep):
+async def test_connection(service: str, config: ConfigDep, credential_store: CredentialStoreDep):
     """Test connection to a service.
 
     Tests the connection to CalDAV or VaultWarden to ensure credentials
@@ -466,11 +474,7 @@ async def test_connection(service: str, config: ConfigDep):
         Connection test result
     """
     # Clear cache and reload config from database
-    from icloudbridge.api.dependencies import get_config
-    from icloudbridge.core.config import load_config
-    from icloudbridge.utils.settings_db import get_config_path
-
-    get_config.cache_clear()
+    invalidate_config()
 
     # Get config path from database - single source of truth
     config_file = get_config_path()
@@ -481,12 +485,10 @@ async def test_connection(service: str, config: ConfigDep):
         config = load_config(config_file)
     else:
         print(f"[DEBUG TEST] Config path not found or doesn't exist, using defaults")
-        config = get_config()
+        config = dependencies.get_config()
 
     if service == "reminders":
         try:
-            from icloudbridge.sources.reminders.caldav_adapter import CalDAVAdapter
-
             print(f"[DEBUG TEST] Config username: {config.reminders.caldav_username}")
             print(f"[DEBUG TEST] Config URL: {config.reminders.caldav_url}")
             password = config.reminders.get_caldav_password()
@@ -512,7 +514,7 @@ async def test_connection(service: str, config: ConfigDep):
                 "calendars": [cal["name"] for cal in calendars],
             }
         except Exception as e:
-            logger.error(f"CalDAV connection test failed: {e}")
+            logger.exception("CalDAV connection test failed")
             return {
                 "success": False,
                 "message": f"Connection failed: {str(e)}",
@@ -520,12 +522,9 @@ async def test_connection(service: str, config: ConfigDep):
 
     elif service == "passwords":
         provider_name = (config.passwords.provider or "vaultwarden").lower()
-        credential_store = CredentialStore()
 
         if provider_name == "nextcloud":
             try:
-                from icloudbridge.sources.passwords.providers import NextcloudPasswordsProvider
-
                 username = config.passwords.nextcloud_username
                 url = config.passwords.nextcloud_url
                 if not username or not url:
@@ -554,15 +553,13 @@ async def test_connection(service: str, config: ConfigDep):
             except HTTPException:
                 raise
             except Exception as e:
-                logger.error(f"Nextcloud connection test failed: {e}")
+                logger.exception("Nextcloud connection test failed")
                 return {
                     "success": False,
                     "message": f"Connection failed: {str(e)}",
                 }
         else:
             try:
-                from icloudbridge.sources.passwords.vaultwarden_api import VaultwardenAPIClient
-
                 credentials = credential_store.get_vaultwarden_credentials(config.passwords.vaultwarden_email)
 
                 if not credentials:
@@ -591,7 +588,7 @@ async def test_connection(service: str, config: ConfigDep):
             except HTTPException:
                 raise
             except Exception as e:
-                logger.error(f"VaultWarden connection test failed: {e}")
+                logger.exception("VaultWarden connection test failed")
                 return {
                     "success": False,
                     "message": f"Connection failed: {str(e)}",
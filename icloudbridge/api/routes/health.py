@@ -1,12 +1,14 @@
 """Health check and status endpoints."""
 
+import asyncio
 import json
 import logging
-import sys
+import time
 from datetime import datetime
-from pathlib import Path
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from icloudbridge import __version__
 from icloudbridge.api.dependencies import (
@@ -15,37 +17,121 @@ from icloudbridge.api.dependencies import (
     PasswordsDBDep,
     PhotosDBDep,
     RemindersDBDep,
+    SchedulerDep,
+    SchedulesDBDep,
+    SyncLogsDBDep,
+    cache_status,
+    get_cached_status,
+)
+from icloudbridge.api.models import (
+    HealthResponse,
+    ReadinessResponse,
+    StatusResponse,
+    VersionResponse,
 )
-from icloudbridge.api.models import HealthResponse, StatusResponse, VersionResponse
-from icloudbridge.utils.db import SchedulesDB, SyncLogsDB
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Version info is process-invariant, so serialize it once at import time
+_VERSION_BYTES = orjson.dumps(VersionResponse(version=__version__).model_dump())
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+_health_cache: tuple[int, bytes] = (0, b"")
+
+
+def _health_body() -> bytes:
+    """Health check body; the timestamp is refreshed at most once per second."""
+    global _health_cache
+    second = int(time.time())
+    if _health_cache[0] != second:
+        timestamp = datetime.now().isoformat().encode()
+        _health_cache = (second, _HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX)
+    return _health_cache[1]
+
+
+class ProbeMiddleware:
+    """Answer GET /health and /version before the middleware stack and router run.
+
+    These are the most frequently polled endpoints and their bodies are
+    prebuilt, so there is nothing for routing or the HTTP middleware to add.
+    Requests carrying an Origin header fall through so CORS handling still applies.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str = "") -> None:
+        self.app = app
+        self.health_path = f"{prefix}/health"
+        self.version_path = f"{prefix}/version"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            path = scope["path"]
+            body = None
+            if path == self.health_path:
+                body = _health_body()
+            elif path == self.version_path:
+                body = _VERSION_BYTES
+
+            if body is not None and not any(name == b"origin" for name, _ in scope["headers"]):
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        await self.app(scope, receive, send)
 
-@router.get("/health", response_model=HealthResponse)
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint.
 
     Returns basic health status of the API server.
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now().isoformat(),
+    return Response(_health_body(), media_type="application/json")
+
+
+@router.get("/ready", response_model=ReadinessResponse, responses={503: {"model": ReadinessResponse}})
+async def readiness_check(
+    response: Response,
+    notes_db: NotesDBDep,
+    reminders_db: RemindersDBDep,
+    passwords_db: PasswordsDBDep,
+    sync_logs_db: SyncLogsDBDep,
+):
+    """Readiness check endpoint.
+
+    Verifies each database answers a trivial query. Unlike /status this
+    never counts rows, so it is safe for frequent probes.
+    """
+    names = ("notes", "reminders", "passwords", "sync_logs")
+    results = await asyncio.gather(
+        notes_db.liveness(),
+        reminders_db.liveness(),
+        passwords_db.liveness(),
+        sync_logs_db.liveness(),
+        return_exceptions=True,
     )
+    databases = {name: result is True for name, result in zip(names, results, strict=True)}
+    if not all(databases.values()):
+        response.status_code = 503
+        return ReadinessResponse(status="unavailable", databases=databases)
+    return ReadinessResponse(databases=databases)
 
 
-@router.get("/version", response_model=VersionResponse)
+@router.get("/version", responses={200: {"model": VersionResponse}})
 async def get_version():
     """Get version information.
 
     Returns the current version of iCloudBridge and Python runtime.
     """
-    return VersionResponse(
-        version=__version__,
-        python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.patch}",
-    )
+    return Response(_VERSION_BYTES, media_type="application/json")
 
 
 @router.get("/status", response_model=StatusResponse)
@@ -55,25 +141,34 @@ async def get_status(
     reminders_db: RemindersDBDep,
     passwords_db: PasswordsDBDep,
     photos_db: PhotosDBDep,
+    sync_logs_db: SyncLogsDBDep,
+    schedules_db: SchedulesDBDep,
+    scheduler: SchedulerDep,
 ):
     """Get overall sync status for all services.
 
     Returns:
         StatusResponse with status information for each service
     """
-    # Get sync + schedule databases
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-    schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-    await schedules_db.initialize()
-
-    # Get last sync for each service
-    notes_logs = await sync_logs_db.get_logs(service="notes", limit=1)
-    reminders_logs = await sync_logs_db.get_logs(service="reminders", limit=1)
-    passwords_logs = await sync_logs_db.get_logs(service="passwords", limit=1)
-    photos_logs = await sync_logs_db.get_logs(service="photos", limit=1)
-
-    photos_success_logs = await sync_logs_db.get_logs(service="photos", status="success", limit=1)
+    cached = get_cached_status("health")
+    if cached is not None:
+        return cached
+
+    # Last sync per service and record counts are independent reads, so issue
+    # them concurrently; each borrows a reader from its database's shared pool.
+    (
+        latest_logs,
+        photos_success_logs,
+        notes_count_result,
+        reminders_count_result,
+        passwords_count_result,
+    ) = await asyncio.gather(
+        sync_logs_db.get_latest_logs(["notes", "reminders", "passwords", "photos"]),
+        sync_logs_db.get_logs(service="photos", status="success", limit=1),
+        notes_db.get_stats(),
+        reminders_db.get_stats(),
+        passwords_db.get_stats(),
+    )
     if not photos_success_logs:
         photos_success_logs = await sync_logs_db.get_logs(service="photos", status="completed", limit=1)
     photos_pending_since = None
@@ -149,30 +244,20 @@ async def get_status(
             "error_message": log.get("error_message"),
         }
 
-    notes_last_sync = transform_log(notes_logs[0]) if notes_logs else None
-    reminders_last_sync = transform_log(reminders_logs[0]) if reminders_logs else None
-    passwords_last_sync = transform_log(passwords_logs[0]) if passwords_logs else None
-    photos_last_sync = transform_log(photos_logs[0]) if photos_logs else None
+    notes_last_sync = transform_log(latest_logs.get("notes"))
+    reminders_last_sync = transform_log(latest_logs.get("reminders"))
+    passwords_last_sync = transform_log(latest_logs.get("passwords"))
+    photos_last_sync = transform_log(latest_logs.get("photos"))
 
     # Get counts
-    notes_count_result = await notes_db.get_stats()
     notes_count = notes_count_result.get("total", 0)
-
-    reminders_count_result = await reminders_db.get_stats()
     reminders_count = reminders_count_result.get("total", 0)
-
-    passwords_count_result = await passwords_db.get_stats()
     passwords_count = passwords_count_result.get("total", 0)
 
     await photos_db.initialize()
     photos_stats = await photos_db.get_stats(pending_since=photos_pending_since)
 
-    try:
-        from icloudbridge.api.app import scheduler as app_scheduler
-    except ImportError:
-        app_scheduler = None  # pragma: no cover
-
-    scheduler_running = bool(app_scheduler and getattr(app_scheduler, "is_running", False))
+    scheduler_running = bool(scheduler and getattr(scheduler, "is_running", False))
     try:
         active_schedules = len(await schedules_db.get_schedules(enabled=True))
     except Exception:
@@ -181,7 +266,7 @@ async def get_status(
     def service_state(last_sync):
         return last_sync["status"] if isinstance(last_sync, dict) and last_sync.get("status") else "idle"
 
-    return StatusResponse(
+    response = StatusResponse(
         notes={
             "enabled": config.notes.enabled,
             "sync_count": notes_count,
@@ -210,3 +295,5 @@ async def get_status(
         scheduler_running=scheduler_running,
         active_schedules=active_schedules,
     )
+    cache_status("health", response, config.general.status_cache_ttl)
+    return response
@@ -5,11 +5,24 @@ import json
 import logging
 import time
 from datetime import datetime
+from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, status
-
-from icloudbridge.api.dependencies import ConfigDep, NotesDBDep, NotesSyncEngineDep
-from icloudbridge.api.models import NotesSyncRequest
+from fastapi.responses import ORJSONResponse
+
+from icloudbridge.api.background import get_sync_job, start_background_sync
+from icloudbridge.api.dependencies import (
+    ConfigDep,
+    NotesDBDep,
+    NotesSyncEngineDep,
+    SyncLogsDBDep,
+    cache_status,
+    get_cached_status,
+    invalidate_status,
+)
+from icloudbridge.api.models import NoteFolderEntry, NotesSyncRequest, SyncLogEntry
+from icloudbridge.core.config import AppConfig
+from icloudbridge.core.sync import NotesSyncEngine
 from icloudbridge.utils.db import SyncLogsDB
 
 logger = logging.getLogger(__name__)
@@ -79,18 +92,17 @@ async def list_folders(engine: NotesSyncEngineDep):
     """
     try:
         folders = await engine.list_folders()
-        return {
-            "folders": [
-                {
-                    "name": folder["name"],
-                    "uuid": folder.get("uuid", ""),
-                    "note_count": folder.get("note_count", 0),
-                }
-                for folder in folders
-            ]
-        }
+        entries: list[NoteFolderEntry] = [
+            {
+                "name": folder["name"],
+                "uuid": folder.get("uuid", ""),
+                "note_count": folder.get("note_count", 0),
+            }
+            for folder in folders
+        ]
+        return ORJSONResponse({"folders": entries})
     except Exception as e:
-        logger.error(f"Failed to list folders: {e}")
+        logger.exception("Failed to list folders")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list folders: {str(e)}"
@@ -117,7 +129,7 @@ async def get_all_folders(engine: NotesSyncEngineDep):
         folders_info = await engine.get_all_folders()
         return {"folders": folders_info}
     except Exception as e:
-        logger.error(f"Failed to get all folders: {e}")
+        logger.exception("Failed to get all folders")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get all folders: {str(e)}"
@@ -128,6 +140,7 @@ async def get_all_folders(engine: NotesSyncEngineDep):
 async def sync_notes(
     request: NotesSyncRequest,
     config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
 ):
     """Trigger notes synchronization.
 
@@ -144,8 +157,6 @@ async def sync_notes(
         Sync results with statistics
     """
     # Create sync engine with optional shortcut pipeline override
-    from icloudbridge.core.sync import NotesSyncEngine
-
     config.ensure_data_dir()
     db_path = config.general.data_dir / "notes.db"
     markdown_base_path = config.notes.remote_folder
@@ -164,17 +175,51 @@ async def sync_notes(
 
     # Create sync log entry ONLY if not a dry run
     log_id = None
-    sync_logs_db = None
+    run_in_background = request.background and not request.dry_run
     if not request.dry_run:
-        sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-        await sync_logs_db.initialize()
-
         log_id = await sync_logs_db.create_log(
             service="notes",
             sync_type="manual",
-            status="running",
+            status="queued" if run_in_background else "running",
         )
 
+    async def run() -> dict:
+        return await _run_notes_sync(
+            request, config, engine, sync_logs_db, log_id, db_path, markdown_base_path, prefer_shortcuts
+        )
+
+    if run_in_background:
+        return ORJSONResponse(
+            start_background_sync(sync_logs_db, log_id, run),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+    return await run()
+
+
+@router.get("/sync/{log_id}")
+async def get_sync(log_id: int, sync_logs_db: SyncLogsDBDep):
+    """Get the state of a notes sync started with background=True.
+
+    Args:
+        log_id: Sync log ID returned by POST /sync
+
+    Returns:
+        Sync status, timing, stats and error message
+    """
+    return await get_sync_job(sync_logs_db, "notes", log_id)
+
+
+async def _run_notes_sync(
+    request: NotesSyncRequest,
+    config: AppConfig,
+    engine: NotesSyncEngine,
+    sync_logs_db: SyncLogsDB,
+    log_id: int | None,
+    db_path: Path,
+    markdown_base_path: Path,
+    prefer_shortcuts: bool,
+) -> dict:
+    """Run a notes sync and record the outcome in its sync log entry."""
     start_time = time.time()
 
     try:
@@ -194,7 +239,7 @@ async def sync_notes(
             # Check if folder mappings are configured
             if config.notes.folder_mappings:
                 # Use selective sync with mappings
-                logger.info(f"Using folder mappings for selective sync ({len(config.notes.folder_mappings)} mappings)")
+                logger.info("Using folder mappings for selective sync (%s mappings)", len(config.notes.folder_mappings))
 
                 # Convert FolderMapping objects to dict format expected by sync_with_mappings
                 folder_mappings_dict = {}
@@ -297,7 +342,7 @@ async def sync_notes(
                             "status": "error",
                             "error": str(e)
                         })
-                        logger.error(f"Failed to sync folder {folder_name}: {e}")
+                        logger.exception("Failed to sync folder %s", folder_name)
 
                 # Create aggregated result for automatic mode
                 result = total_stats.copy()
@@ -319,7 +364,7 @@ async def sync_notes(
                     result["metadata"] = {}
                 result["metadata"]["rich_notes_exported"] = True
             except Exception as e:
-                logger.error(f"Rich notes export failed: {e}")
+                logger.exception("Rich notes export failed")
                 if "metadata" not in result:
                     result["metadata"] = {}
                 result["metadata"]["rich_notes_export_error"] = str(e)
@@ -327,13 +372,14 @@ async def sync_notes(
         duration = time.time() - start_time
 
         # Update sync log with success (only if not dry run)
-        if sync_logs_db and log_id:
+        if log_id:
             await sync_logs_db.update_log(
                 log_id=log_id,
                 status="completed",
                 duration_seconds=round(duration, 0),
-                stats_json=json.dumps(result),
+                stats=result,
             )
+            invalidate_status()
 
         # Add pipeline info to metadata
         if "metadata" not in result:
@@ -354,16 +400,17 @@ async def sync_notes(
         duration = time.time() - start_time
         error_msg = str(e)
 
-        logger.error(f"Notes sync failed: {error_msg}")
+        logger.exception("Notes sync failed")
 
         # Update sync log with error (only if not dry run)
-        if sync_logs_db and log_id:
+        if log_id:
             await sync_logs_db.update_log(
                 log_id=log_id,
                 status="failed",
                 duration_seconds=round(duration, 0),
                 error_message=error_msg,
             )
+            invalidate_status()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -372,17 +419,19 @@ async def sync_notes(
 
 
 @router.get("/status")
-async def get_status(notes_db: NotesDBDep, config: ConfigDep):
+async def get_status(notes_db: NotesDBDep, config: ConfigDep, sync_logs_db: SyncLogsDBDep):
     """Get notes sync status.
 
     Returns:
         Status information including last sync and mapping count
     """
+    cached = get_cached_status("notes")
+    if cached is not None:
+        return cached
+
     stats = await notes_db.get_stats()
 
     # Get last sync from logs
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
     logs = await sync_logs_db.get_logs(service="notes", limit=1)
 
     # Transform last sync log to match frontend expectations
@@ -420,40 +469,42 @@ async def get_status(notes_db: NotesDBDep, config: ConfigDep):
             "error_message": log.get("error_message"),
         }
 
-    return {
+    response = {
         "enabled": config.notes.enabled,
         "remote_folder": str(config.notes.remote_folder) if config.notes.remote_folder else None,
         "total_mappings": stats.get("total", 0),
         "last_sync": last_sync,
     }
+    cache_status("notes", response, config.general.status_cache_ttl)
+    return response
 
 
 @router.get("/history")
 async def get_history(
-    config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
     limit: int = 10,
     offset: int = 0,
+    before_id: int | None = None,
 ):
     """Get notes sync history.
 
     Args:
         limit: Maximum number of logs to return
-        offset: Number of logs to skip
+        offset: Number of logs to skip (legacy; prefer before_id)
+        before_id: Return logs older than this log ID (use next_cursor)
 
     Returns:
         List of sync log entries
     """
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-
     logs = await sync_logs_db.get_logs(
         service="notes",
         limit=limit,
         offset=offset,
+        before_id=before_id,
     )
 
     # Transform logs to match frontend expectations
-    transformed_logs = []
+    transformed_logs: list[SyncLogEntry] = []
     for log in logs:
         # Parse stats from JSON
         stats = {}
@@ -487,15 +538,22 @@ async def get_history(
             "error_message": log.get("error_message"),
         })
 
-    return {
+    # Rows are plain str/int/float/dict values, so skip jsonable_encoder
+    return ORJSONResponse({
         "logs": transformed_logs,
         "limit": limit,
         "offset": offset,
-    }
+        "next_cursor": logs[-1]["id"] if len(logs) == limit else None,
+    })
 
 
 @router.post("/reset")
-async def reset_database(notes_db: NotesDBDep, engine: NotesSyncEngineDep, config: ConfigDep):
+async def reset_database(
+    notes_db: NotesDBDep,
+    engine: NotesSyncEngineDep,
+    config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
+):
     """Reset notes sync database and history.
 
     Clears all note mappings from the database and deletes sync history.
@@ -510,9 +568,8 @@ async def reset_database(notes_db: NotesDBDep, engine: NotesSyncEngineDep, confi
         logger.info("Notes database reset successfully")
 
         # Clear sync history for notes service
-        sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-        await sync_logs_db.initialize()
         await sync_logs_db.clear_service_logs("notes")
+        invalidate_status()
         logger.info("Notes sync history cleared")
 
         # Clear manual folder mappings so UI returns to auto mode
@@ -525,18 +582,18 @@ async def reset_database(notes_db: NotesDBDep, engine: NotesSyncEngineDep, confi
                 config_path = config.default_config_path
             try:
                 config.save_to_file(config_path)
-                from icloudbridge.api.dependencies import get_config
-                get_config.cache_clear()
+                from icloudbridge.api.dependencies import invalidate_config
+                invalidate_config()
                 logger.info("Cleared notes folder mappings during reset")
             except Exception as e:
-                logger.warning(f"Failed to persist cleared folder mappings: {e}")
+                logger.warning("Failed to persist cleared folder mappings: %s", e)
 
         return {
             "status": "success",
             "message": "Notes database and history reset successfully. All mappings and sync logs cleared.",
         }
     except Exception as e:
-        logger.error(f"Failed to reset notes: {e}")
+        logger.exception("Failed to reset notes")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset notes: {str(e)}"
@@ -8,11 +8,22 @@ from datetime import datetime
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse
-
-from icloudbridge.api.dependencies import ConfigDep, PasswordsDBDep, PasswordsSyncEngineDep
+from fastapi.responses import FileResponse, ORJSONResponse
+
+from icloudbridge.api.dependencies import (
+    ConfigDep,
+    PasswordsDBDep,
+    PasswordsSyncEngineDep,
+    SyncLogsDBDep,
+    get_sync_logs_db,
+    invalidate_status,
+)
 from icloudbridge.api.downloads import download_manager
-from icloudbridge.api.models import NextcloudCredentialRequest, VaultwardenCredentialRequest
+from icloudbridge.api.models import (
+    NextcloudCredentialRequest,
+    SyncLogEntry,
+    VaultwardenCredentialRequest,
+)
 from icloudbridge.sources.passwords.providers import NextcloudPasswordsProvider, VaultwardenProvider
 from icloudbridge.sources.passwords.vaultwarden_api import VaultwardenAPIClient
 from icloudbridge.utils.credentials import CredentialStore
@@ -153,8 +164,7 @@ async def _run_passwords_sync(
         provider = await _build_password_provider(config)
 
         if log_sync_type and not simulate:
-            sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-            await sync_logs_db.initialize()
+            sync_logs_db = await get_sync_logs_db(config)
             log_id = await sync_logs_db.create_log(
                 service="passwords",
                 sync_type=log_sync_type,
@@ -178,8 +188,9 @@ async def _run_passwords_sync(
                 log_id=log_id,
                 status="completed",
                 duration_seconds=round(result.get("total_time", 0), 0),
-                stats_json=json.dumps(result),
+                stats=result,
             )
+            invalidate_status()
 
         response = {
             "status": "success",
@@ -199,6 +210,7 @@ async def _run_passwords_sync(
                 duration_seconds=0,
                 error_message=http_exc.detail if isinstance(http_exc.detail, str) else str(http_exc.detail),
             )
+            invalidate_status()
         raise
     except Exception as exc:
         if log_id and sync_logs_db:
@@ -208,6 +220,7 @@ async def _run_passwords_sync(
                 duration_seconds=0,
                 error_message=str(exc),
             )
+            invalidate_status()
         logger.error("Passwords sync failed: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -251,7 +264,7 @@ async def import_apple_csv(
         # Clean up temporary file
         Path(tmp_path).unlink()
 
-        logger.info(f"Apple CSV import complete: {result}")
+        logger.info("Apple CSV import complete: %s", result)
 
         return {
             "status": "success",
@@ -259,7 +272,7 @@ async def import_apple_csv(
         }
 
     except Exception as e:
-        logger.error(f"Failed to import Apple CSV: {e}")
+        logger.exception("Failed to import Apple CSV")
         # Clean up on error
         if 'tmp_path' in locals():
             Path(tmp_path).unlink(missing_ok=True)
@@ -295,7 +308,7 @@ async def import_bitwarden_csv(
         # Clean up temporary file
         Path(tmp_path).unlink()
 
-        logger.info(f"Bitwarden CSV import complete: {result}")
+        logger.info("Bitwarden CSV import complete: %s", result)
 
         return {
             "status": "success",
@@ -303,7 +316,7 @@ async def import_bitwarden_csv(
         }
 
     except Exception as e:
-        logger.error(f"Failed to import Bitwarden CSV: {e}")
+        logger.exception("Failed to import Bitwarden CSV")
         # Clean up on error
         if 'tmp_path' in locals():
             Path(tmp_path).unlink(missing_ok=True)
@@ -328,7 +341,7 @@ async def export_bitwarden_csv(
 
         await engine.export_bitwarden_csv(str(output_path))
 
-        logger.info(f"Bitwarden CSV export generated: {output_path}")
+        logger.info("Bitwarden CSV export generated: %s", output_path)
 
         return {
             "status": "success",
@@ -337,7 +350,7 @@ async def export_bitwarden_csv(
         }
 
     except Exception as e:
-        logger.error(f"Failed to export Bitwarden CSV: {e}")
+        logger.exception("Failed to export Bitwarden CSV")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Export failed: {str(e)}"
@@ -359,7 +372,7 @@ async def export_apple_csv(
 
         await engine.export_apple_csv(str(output_path))
 
-        logger.info(f"Apple CSV export generated: {output_path}")
+        logger.info("Apple CSV export generated: %s", output_path)
 
         return {
             "status": "success",
@@ -368,7 +381,7 @@ async def export_apple_csv(
         }
 
     except Exception as e:
-        logger.error(f"Failed to export Apple CSV: {e}")
+        logger.exception("Failed to export Apple CSV")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Export failed: {str(e)}"
@@ -454,7 +467,7 @@ async def download_passwords_csv(token: str, background_tasks: BackgroundTasks):
 
 
 @router.get("/status")
-async def get_status(passwords_db: PasswordsDBDep, config: ConfigDep):
+async def get_status(passwords_db: PasswordsDBDep, config: ConfigDep, sync_logs_db: SyncLogsDBDep):
     """Get passwords sync status.
 
     Returns:
@@ -463,8 +476,6 @@ async def get_status(passwords_db: PasswordsDBDep, config: ConfigDep):
     stats = await passwords_db.get_stats()
 
     # Get last sync from logs
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
     logs = await sync_logs_db.get_logs(service="passwords", limit=1)
 
     provider_name = (config.passwords.provider or "vaultwarden").lower()
@@ -557,6 +568,7 @@ async def get_status(passwords_db: PasswordsDBDep, config: ConfigDep):
 @router.get("/history")
 async def get_history(
     config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
     limit: int = 10,
     offset: int = 0,
 ):
@@ -572,9 +584,6 @@ async def get_history(
     provider_name = (config.passwords.provider or "vaultwarden").lower()
     provider_label = "Nextcloud Passwords" if provider_name == "nextcloud" else "VaultWarden"
 
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-
     logs = await sync_logs_db.get_logs(
         service="passwords",
         limit=limit,
@@ -582,7 +591,7 @@ async def get_history(
     )
 
     # Transform logs to match frontend expectations
-    transformed_logs = []
+    transformed_logs: list[SyncLogEntry] = []
     for log in logs:
         # Parse stats from JSON
         stats = {}
@@ -631,15 +640,16 @@ async def get_history(
             "error_message": log.get("error_message"),
         })
 
-    return {
+    # Rows are plain str/int/float/dict values, so skip jsonable_encoder
+    return ORJSONResponse({
         "logs": transformed_logs,
         "limit": limit,
         "offset": offset,
-    }
+    })
 
 
 @router.post("/reset")
-async def reset_database(passwords_db: PasswordsDBDep, config: ConfigDep):
+async def reset_database(passwords_db: PasswordsDBDep, config: ConfigDep, sync_logs_db: SyncLogsDBDep):
     """Reset passwords sync database, history, and keychain credentials.
 
     Clears all password entries from the database, deletes sync history,
@@ -654,9 +664,8 @@ async def reset_database(passwords_db: PasswordsDBDep, config: ConfigDep):
         logger.info("Passwords database reset successfully")
 
         # Clear sync history for passwords service
-        sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-        await sync_logs_db.initialize()
         await sync_logs_db.clear_service_logs("passwords")
+        invalidate_status()
         logger.info("Passwords sync history cleared")
 
         credential_store = CredentialStore()
@@ -665,24 +674,24 @@ async def reset_database(passwords_db: PasswordsDBDep, config: ConfigDep):
         if config.passwords.vaultwarden_email:
             try:
                 credential_store.delete_vaultwarden_credentials(config.passwords.vaultwarden_email)
-                logger.info(f"Deleted Vaultwarden credentials for: {config.passwords.vaultwarden_email}")
+                logger.info("Deleted Vaultwarden credentials for: %s", config.passwords.vaultwarden_email)
             except Exception as e:
-                logger.warning(f"Failed to delete Vaultwarden credentials: {e}")
+                logger.warning("Failed to delete Vaultwarden credentials: %s", e)
 
         # Delete Nextcloud credentials if username exists
         if config.passwords.nextcloud_username:
             try:
                 credential_store.delete_nextcloud_credentials(config.passwords.nextcloud_username)
-                logger.info(f"Deleted Nextcloud credentials for: {config.passwords.nextcloud_username}")
+                logger.info("Deleted Nextcloud credentials for: %s", config.passwords.nextcloud_username)
             except Exception as e:
-                logger.warning(f"Failed to delete Nextcloud credentials: {e}")
+                logger.warning("Failed to delete Nextcloud credentials: %s", e)
 
         return {
             "status": "success",
             "message": "Passwords database, history, and keychain credentials reset successfully.",
         }
     except Exception as e:
-        logger.error(f"Failed to reset passwords: {e}")
+        logger.exception("Failed to reset passwords")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset passwords: {str(e)}"
@@ -714,7 +723,7 @@ async def set_vaultwarden_credentials(
             client_secret=payload.client_secret,
         )
 
-        logger.info(f"VaultWarden credentials stored for: {payload.email}")
+        logger.info("VaultWarden credentials stored for: %s", payload.email)
 
         updated = False
         if not config.passwords.enabled:
@@ -733,9 +742,9 @@ async def set_vaultwarden_credentials(
         if updated:
             try:
                 config.save_to_file(config.default_config_path)
-                from icloudbridge.api.dependencies import get_config
+                from icloudbridge.api.dependencies import invalidate_config
 
-                get_config.cache_clear()
+                invalidate_config()
                 logger.info("Passwords configuration updated with VaultWarden email")
             except Exception as exc:
                 logger.warning("Failed to persist VaultWarden email in config: %s", exc)
@@ -745,7 +754,7 @@ async def set_vaultwarden_credentials(
             "message": f"Credentials stored securely for {payload.email}",
         }
     except Exception as e:
-        logger.error(f"Failed to store VaultWarden credentials: {e}")
+        logger.exception("Failed to store VaultWarden credentials")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to store credentials: {str(e)}"
@@ -766,15 +775,15 @@ async def delete_vaultwarden_credentials(email: str, config: ConfigDep):
         credential_store = CredentialStore()
         credential_store.delete_vaultwarden_credentials(email)
 
-        logger.info(f"VaultWarden credentials deleted for: {email}")
+        logger.info("VaultWarden credentials deleted for: %s", email)
 
         if config.passwords.vaultwarden_email == email:
             config.passwords.vaultwarden_email = None
             try:
                 config.save_to_file(config.default_config_path)
-                from icloudbridge.api.dependencies import get_config
+                from icloudbridge.api.dependencies import invalidate_config
 
-                get_config.cache_clear()
+                invalidate_config()
             except Exception as exc:
                 logger.warning("Failed to persist VaultWarden email removal: %s", exc)
 
@@ -783,7 +792,7 @@ async def delete_vaultwarden_credentials(email: str, config: ConfigDep):
             "message": f"Credentials deleted for {email}",
         }
     except Exception as e:
-        logger.error(f"Failed to delete VaultWarden credentials: {e}")
+        logger.exception("Failed to delete VaultWarden credentials")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete credentials: {str(e)}"
@@ -801,7 +810,7 @@ async def set_nextcloud_credentials(
         credential_store = CredentialStore()
         credential_store.set_nextcloud_credentials(payload.username, payload.app_password)
 
-        logger.info(f"Nextcloud credentials stored for: {payload.username}")
+        logger.info("Nextcloud credentials stored for: %s", payload.username)
 
         updated = False
         if not config.passwords.enabled:
@@ -820,9 +829,9 @@ async def set_nextcloud_credentials(
         if updated:
             try:
                 config.save_to_file(config.default_config_path)
-                from icloudbridge.api.dependencies import get_config
+                from icloudbridge.api.dependencies import invalidate_config
 
-                get_config.cache_clear()
+                invalidate_config()
                 logger.info("Passwords configuration updated with Nextcloud settings")
             except Exception as exc:
                 logger.warning("Failed to persist Nextcloud configuration: %s", exc)
@@ -832,7 +841,7 @@ async def set_nextcloud_credentials(
             "message": f"Credentials stored securely for {payload.username}",
         }
     except Exception as e:
-        logger.error(f"Failed to store Nextcloud credentials: {e}")
+        logger.exception("Failed to store Nextcloud credentials")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to store credentials: {str(e)}"
@@ -851,9 +860,9 @@ async def delete_nextcloud_credentials(username: str, config: ConfigDep):
             config.passwords.nextcloud_username = None
             try:
                 config.save_to_file(config.default_config_path)
-                from icloudbridge.api.dependencies import get_config
+                from icloudbridge.api.dependencies import invalidate_config
 
-                get_config.cache_clear()
+                invalidate_config()
             except Exception as exc:
                 logger.warning("Failed to persist Nextcloud username removal: %s", exc)
 
@@ -869,7 +878,7 @@ async def delete_nextcloud_credentials(username: str, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete Nextcloud credentials: {e}")
+        logger.exception("Failed to delete Nextcloud credentials")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete credentials: {str(e)}"
@@ -5,10 +5,19 @@ import logging
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, status
-
-from icloudbridge.api.dependencies import ConfigDep, PhotosDBDep, PhotosSyncEngineDep
+from fastapi.responses import ORJSONResponse
+
+from icloudbridge.api.background import get_sync_job, start_background_sync
+from icloudbridge.api.dependencies import (
+    ConfigDep,
+    PhotosDBDep,
+    PhotosSyncEngineDep,
+    SyncLogsDBDep,
+    invalidate_status,
+)
 from icloudbridge.api.models import PhotoSyncRequest
 from icloudbridge.api.websocket import send_sync_progress
+from icloudbridge.core.photos_sync import PhotoSyncEngine
 from icloudbridge.utils.db import SyncLogsDB
 
 logger = logging.getLogger(__name__)
@@ -21,6 +30,7 @@ async def sync_photos(
     request: PhotoSyncRequest,
     config: ConfigDep,
     engine: PhotosSyncEngineDep,
+    sync_logs_db: SyncLogsDBDep,
 ):
     """Trigger a photo synchronization run."""
 
@@ -31,16 +41,41 @@ async def sync_photos(
         )
 
     # Create sync log only for real runs. Dry-run simulations shouldn't clutter history.
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-
     log_id = None
-    if not request.dry_run and not request.initial_scan:
+    real_run = not request.dry_run and not request.initial_scan
+    run_in_background = request.background and real_run
+    if real_run:
         log_id = await sync_logs_db.create_log(
             service="photos",
             sync_type="manual",
-            status="running",
+            status="queued" if run_in_background else "running",
+        )
+
+    async def run() -> dict:
+        return await _run_photos_sync(request, engine, sync_logs_db, log_id)
+
+    if run_in_background:
+        return ORJSONResponse(
+            start_background_sync(sync_logs_db, log_id, run, failed_status="error"),
+            status_code=status.HTTP_202_ACCEPTED,
         )
+    return await run()
+
+
+@router.get("/sync/{log_id}")
+async def get_sync(log_id: int, sync_logs_db: SyncLogsDBDep):
+    """Get the state of a photo sync started with background=True."""
+
+    return await get_sync_job(sync_logs_db, "photos", log_id)
+
+
+async def _run_photos_sync(
+    request: PhotoSyncRequest,
+    engine: PhotoSyncEngine,
+    sync_logs_db: SyncLogsDB,
+    log_id: int | None,
+) -> dict:
+    """Run a photo sync and record the outcome in its sync log entry."""
 
     # Send initial progress update
     await send_sync_progress(
@@ -77,8 +112,9 @@ async def sync_photos(
                 log_id=log_id,
                 status="success",
                 duration_seconds=duration,
-                stats_json=json.dumps(stats),
+                stats=stats,
             )
+            invalidate_status()
 
         # Send success progress update
         await send_sync_progress(
@@ -103,6 +139,7 @@ async def sync_photos(
                 duration_seconds=duration,
                 error_message=str(exc),
             )
+            invalidate_status()
 
         # Send error progress update
         await send_sync_progress(
@@ -119,7 +156,7 @@ async def sync_photos(
 
 
 @router.get("/status")
-async def get_status(photos_db: PhotosDBDep, config: ConfigDep):
+async def get_status(photos_db: PhotosDBDep, config: ConfigDep, sync_logs_db: SyncLogsDBDep):
     """Get photo sync status and statistics."""
 
     if not config.photos.enabled:
@@ -128,9 +165,6 @@ async def get_status(photos_db: PhotosDBDep, config: ConfigDep):
             "message": "Photo sync is disabled",
         }
 
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-
     photos_success_logs = await sync_logs_db.get_logs(service="photos", status="success", limit=1)
     if not photos_success_logs:
         photos_success_logs = await sync_logs_db.get_logs(service="photos", status="completed", limit=1)
@@ -176,21 +210,19 @@ async def get_status(photos_db: PhotosDBDep, config: ConfigDep):
 
 @router.get("/history")
 async def get_history(
-    config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
     limit: int = 10,
 ):
     """Get photo sync history."""
 
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-
     logs = await sync_logs_db.get_logs(service="photos", limit=limit)
 
-    return {"logs": logs}
+    # Raw rows hold only str/int/float/None values, so skip jsonable_encoder
+    return ORJSONResponse({"logs": logs})
 
 
 @router.post("/reset")
-async def reset_database(photos_db: PhotosDBDep, config: ConfigDep):
+async def reset_database(photos_db: PhotosDBDep, config: ConfigDep, sync_logs_db: SyncLogsDBDep):
     """Reset photo sync state by clearing the database."""
 
     if not config.photos.enabled:
@@ -212,9 +244,8 @@ async def reset_database(photos_db: PhotosDBDep, config: ConfigDep):
     await photos_db.initialize()
 
     # Clear sync history for photos service
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
     await sync_logs_db.clear_service_logs("photos")
+    invalidate_status()
 
     return {
         "status": "success",
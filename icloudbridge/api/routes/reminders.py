@@ -1,15 +1,31 @@
 """Reminders synchronization endpoints."""
 
+import asyncio
 import json
 import logging
 import time
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, status
-
-from icloudbridge.api.dependencies import ConfigDep, RemindersDBDep, RemindersSyncEngineDep
-from icloudbridge.api.models import RemindersSyncRequest
-from icloudbridge.utils.credentials import CredentialStore
+from fastapi.responses import ORJSONResponse
+
+from icloudbridge.api.background import get_sync_job, start_background_sync
+from icloudbridge.api.dependencies import (
+    ConfigDep,
+    CredentialStoreDep,
+    RemindersAdapterDep,
+    RemindersDBDep,
+    RemindersSyncEngineDep,
+    SyncLogsDBDep,
+    cache_status,
+    forget_caldav_password,
+    get_cached_status,
+    has_caldav_password,
+    invalidate_status,
+)
+from icloudbridge.api.models import ReminderListEntry, RemindersSyncRequest, SyncLogEntry
+from icloudbridge.core.config import AppConfig
+from icloudbridge.core.reminders_sync import RemindersSyncEngine
 from icloudbridge.utils.datetime_utils import safe_fromtimestamp
 from icloudbridge.utils.db import SyncLogsDB
 
@@ -43,32 +59,34 @@ def _reminder_stats_message(stats: dict) -> str:
 
 
 @router.get("/calendars")
-async def list_calendars(engine: RemindersSyncEngineDep):
+async def list_calendars(adapter: RemindersAdapterDep):
     """List all Apple Reminders lists.
 
     Returns:
         List of reminder list names with reminder counts
     """
-    try:
-        # Get Apple Reminders lists
-        from icloudbridge.sources.reminders.eventkit import RemindersAdapter
+    if adapter is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Apple Reminders is not available on this system",
+        )
 
-        adapter = RemindersAdapter()
+    try:
         await adapter.request_access()
-        calendars = await adapter.list_calendars()  # Fixed: added await
-
-        # Count reminders for each list
-        result = []
-        for cal in calendars:
-            reminders = await adapter.get_reminders(calendar_id=cal.uuid)
-            result.append({
-                "name": cal.title,  # Fixed: use 'name' to match frontend
-                "reminder_count": len(reminders),  # Fixed: actually count reminders
-            })
-
-        return {"calendars": result}
+        calendars = await adapter.list_calendars()
+
+        # Count reminders for each list; the EventKit fetches are independent
+        reminder_lists = await asyncio.gather(
+            *(adapter.get_reminders(calendar_id=cal.uuid) for cal in calendars)
+        )
+
+        entries: list[ReminderListEntry] = [
+            {"name": cal.title, "reminder_count": len(reminders)}
+            for cal, reminders in zip(calendars, reminder_lists, strict=True)
+        ]
+        return ORJSONResponse({"calendars": entries})
     except Exception as e:
-        logger.error(f"Failed to list reminder lists: {e}")
+        logger.exception("Failed to list reminder lists")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list reminder lists: {str(e)}"
@@ -107,7 +125,7 @@ async def list_caldav_calendars(config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list CalDAV calendars: {e}")
+        logger.exception("Failed to list CalDAV calendars")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list CalDAV calendars: {str(e)}"
@@ -119,6 +137,7 @@ async def sync_reminders(
     request: RemindersSyncRequest,
     engine: RemindersSyncEngineDep,
     config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
 ):
     """Trigger reminders synchronization.
 
@@ -130,17 +149,46 @@ async def sync_reminders(
     """
     # Create sync log entry ONLY if not a dry run
     log_id = None
-    sync_logs_db = None
+    run_in_background = request.background and not request.dry_run
     if not request.dry_run:
-        sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-        await sync_logs_db.initialize()
-
         log_id = await sync_logs_db.create_log(
             service="reminders",
             sync_type="manual",
-            status="running",
+            status="queued" if run_in_background else "running",
+        )
+
+    async def run() -> dict:
+        return await _run_reminders_sync(request, engine, config, sync_logs_db, log_id)
+
+    if run_in_background:
+        return ORJSONResponse(
+            start_background_sync(sync_logs_db, log_id, run),
+            status_code=status.HTTP_202_ACCEPTED,
         )
+    return await run()
+
 
+@router.get("/sync/{log_id}")
+async def get_sync(log_id: int, sync_logs_db: SyncLogsDBDep):
+    """Get the state of a reminders sync started with background=True.
+
+    Args:
+        log_id: Sync log ID returned by POST /sync
+
+    Returns:
+        Sync status, timing, stats and error message
+    """
+    return await get_sync_job(sync_logs_db, "reminders", log_id)
+
+
+async def _run_reminders_sync(
+    request: RemindersSyncRequest,
+    engine: RemindersSyncEngine,
+    config: AppConfig,
+    sync_logs_db: SyncLogsDB,
+    log_id: int | None,
+) -> dict:
+    """Run a reminders sync and record the outcome in its sync log entry."""
     start_time = time.time()
 
     try:
@@ -226,7 +274,7 @@ async def sync_reminders(
                     all_stats["per_calendar"][f"{apple_calendar} → {caldav_calendar}"] = result
 
                 except Exception as e:
-                    logger.error(f"Failed to sync {apple_calendar} → {caldav_calendar}: {e}")
+                    logger.exception("Failed to sync %s → %s", apple_calendar, caldav_calendar)
                     all_stats["total_errors"] += 1
                     all_stats["error_messages"].append(str(e))
                     # Continue with other calendars even if one fails
@@ -249,13 +297,14 @@ async def sync_reminders(
             sync_status = "completed"
 
         # Update sync log (only if not dry run)
-        if sync_logs_db and log_id:
+        if log_id:
             await sync_logs_db.update_log(
                 log_id=log_id,
                 status=sync_status,
                 duration_seconds=round(duration, 0),
-                stats_json=json.dumps(result),
+                stats=result,
             )
+            invalidate_status()
 
         # Create a descriptive message based on the sync results
         calendars_count = result.get("calendars_synced", 0)
@@ -284,16 +333,17 @@ async def sync_reminders(
         duration = time.time() - start_time
         error_msg = str(e)
 
-        logger.error(f"Reminders sync failed: {error_msg}")
+        logger.exception("Reminders sync failed")
 
         # Update sync log with error (only if not dry run)
-        if sync_logs_db and log_id:
+        if log_id:
             await sync_logs_db.update_log(
                 log_id=log_id,
                 status="failed",
                 duration_seconds=round(duration, 0),
                 error_message=error_msg,
             )
+            invalidate_status()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -302,17 +352,24 @@ async def sync_reminders(
 
 
 @router.get("/status")
-async def get_status(reminders_db: RemindersDBDep, config: ConfigDep):
+async def get_status(
+    reminders_db: RemindersDBDep,
+    config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
+    credential_store: CredentialStoreDep,
+):
     """Get reminders sync status.
 
     Returns:
         Status information including last sync and mapping count
     """
+    cached = get_cached_status("reminders")
+    if cached is not None:
+        return cached
+
     stats = await reminders_db.get_stats()
 
     # Get last sync from logs
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
     logs = await sync_logs_db.get_logs(service="reminders", limit=1)
 
     # Transform last sync log to match frontend expectations
@@ -359,10 +416,9 @@ async def get_status(reminders_db: RemindersDBDep, config: ConfigDep):
         }
 
     # Check if password is available
-    credential_store = CredentialStore()
-    has_password = credential_store.has_caldav_password(config.reminders.caldav_username or "")
+    has_password = await has_caldav_password(credential_store, config.reminders.caldav_username or "")
 
-    return {
+    response = {
         "enabled": config.reminders.enabled,
         "caldav_url": config.reminders.caldav_url,
         "caldav_username": config.reminders.caldav_username,
@@ -371,34 +427,36 @@ async def get_status(reminders_db: RemindersDBDep, config: ConfigDep):
         "total_mappings": stats.get("total", 0),
         "last_sync": last_sync,
     }
+    cache_status("reminders", response, config.general.status_cache_ttl)
+    return response
 
 
 @router.get("/history")
 async def get_history(
-    config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
     limit: int = 10,
     offset: int = 0,
+    before_id: int | None = None,
 ):
     """Get reminders sync history.
 
     Args:
         limit: Maximum number of logs to return
-        offset: Number of logs to skip
+        offset: Number of logs to skip (legacy; prefer before_id)
+        before_id: Return logs older than this log ID (use next_cursor)
 
     Returns:
         List of sync log entries
     """
-    sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-    await sync_logs_db.initialize()
-
     logs = await sync_logs_db.get_logs(
         service="reminders",
         limit=limit,
         offset=offset,
+        before_id=before_id,
     )
 
     # Transform logs to match frontend expectations
-    transformed_logs = []
+    transformed_logs: list[SyncLogEntry] = []
     for log in logs:
         # Parse stats from JSON
         stats = {}
@@ -438,15 +496,22 @@ async def get_history(
             "error_message": log.get("error_message"),
         })
 
-    return {
+    # Rows are plain str/int/float/dict values, so skip jsonable_encoder
+    return ORJSONResponse({
         "logs": transformed_logs,
         "limit": limit,
         "offset": offset,
-    }
+        "next_cursor": logs[-1]["id"] if len(logs) == limit else None,
+    })
 
 
 @router.post("/reset")
-async def reset_database(engine: RemindersSyncEngineDep, config: ConfigDep):
+async def reset_database(
+    engine: RemindersSyncEngineDep,
+    config: ConfigDep,
+    sync_logs_db: SyncLogsDBDep,
+    credential_store: CredentialStoreDep,
+):
     """Reset reminders sync database, history, and keychain password.
 
     Clears all reminder mappings from the database, deletes sync history,
@@ -462,26 +527,25 @@ async def reset_database(engine: RemindersSyncEngineDep, config: ConfigDep):
         logger.info("Reminders database reset successfully")
 
         # Clear sync history for reminders service
-        sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
-        await sync_logs_db.initialize()
         await sync_logs_db.clear_service_logs("reminders")
+        invalidate_status()
         logger.info("Reminders sync history cleared")
 
         # Delete CalDAV password from keychain if username exists
         if config.reminders.caldav_username:
             try:
-                credential_store = CredentialStore()
                 credential_store.delete_caldav_password(config.reminders.caldav_username)
-                logger.info(f"Deleted CalDAV password for: {config.reminders.caldav_username}")
+                forget_caldav_password(config.reminders.caldav_username)
+                logger.info("Deleted CalDAV password for: %s", config.reminders.caldav_username)
             except Exception as e:
-                logger.warning(f"Failed to delete CalDAV password: {e}")
+                logger.warning("Failed to delete CalDAV password: %s", e)
 
         return {
             "status": "success",
             "message": "Reminders database, history, and keychain password reset successfully.",
         }
     except Exception as e:
-        logger.error(f"Failed to reset reminders: {e}")
+        logger.exception("Failed to reset reminders")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset reminders: {str(e)}"
@@ -489,7 +553,7 @@ async def reset_database(engine: RemindersSyncEngineDep, config: ConfigDep):
 
 
 @router.post("/password")
-async def set_password(username: str, password: str):
+async def set_password(username: str, password: str, credential_store: CredentialStoreDep):
     """Store CalDAV password in system keyring.
 
     Args:
@@ -500,17 +564,18 @@ async def set_password(username: str, password: str):
         Success message
     """
     try:
-        credential_store = CredentialStore()
         credential_store.set_caldav_password(username, password)
+        forget_caldav_password(username)
+        invalidate_status()
 
-        logger.info(f"CalDAV password stored for user: {username}")
+        logger.info("CalDAV password stored for user: %s", username)
 
         return {
             "status": "success",
             "message": f"Password stored securely for {username}",
         }
     except Exception as e:
-        logger.error(f"Failed to store CalDAV password: {e}")
+        logger.exception("Failed to store CalDAV password")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to store password: {str(e)}"
@@ -518,7 +583,7 @@ async def set_password(username: str, password: str):
 
 
 @router.delete("/password")
-async def delete_password(username: str):
+async def delete_password(username: str, credential_store: CredentialStoreDep):
     """Delete CalDAV password from system keyring.
 
     Args:
@@ -528,17 +593,18 @@ async def delete_password(username: str):
         Success message
     """
     try:
-        credential_store = CredentialStore()
         credential_store.delete_caldav_password(username)
+        forget_caldav_password(username)
+        invalidate_status()
 
-        logger.info(f"CalDAV password deleted for user: {username}")
+        logger.info("CalDAV password deleted for user: %s", username)
 
         return {
             "status": "success",
             "message": f"Password deleted for {username}",
         }
     except Exception as e:
-        logger.error(f"Failed to delete CalDAV password: {e}")
+        logger.exception("Failed to delete CalDAV password")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete password: {str(e)}"
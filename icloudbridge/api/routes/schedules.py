@@ -6,9 +6,8 @@ from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, status
 
-from icloudbridge.api.dependencies import ConfigDep
+from icloudbridge.api.dependencies import SchedulerDep, SchedulesDBDep
 from icloudbridge.api.models import ScheduleCreate, ScheduleResponse, ScheduleUpdate
-from icloudbridge.utils.db import SchedulesDB
 
 ALLOWED_SCHEDULE_SERVICES = {"notes", "reminders", "photos"}
 
@@ -78,7 +77,14 @@ def _prepare_schedule_response(schedule: dict | None) -> ScheduleResponse:
             detail="Schedule not found",
         )
 
+    return ScheduleResponse(**_schedule_payload(schedule))
+
+
+def _schedule_payload(schedule: dict) -> dict:
+    """Shape a trusted schedule row into the ScheduleResponse layout without validation."""
+
     schedule_data = dict(schedule)
+    schedule_data["enabled"] = bool(schedule_data.get("enabled"))
     services_value = schedule_data.get("services")
 
     if isinstance(services_value, str):
@@ -93,16 +99,16 @@ def _prepare_schedule_response(schedule: dict | None) -> ScheduleResponse:
     for field in ("created_at", "updated_at", "last_run", "next_run"):
         schedule_data[field] = _format_timestamp(schedule_data.get(field))
 
-    return ScheduleResponse(**schedule_data)
+    return schedule_data
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[ScheduleResponse])
+@router.get("", response_model=None, responses={200: {"model": list[ScheduleResponse]}})
 async def list_schedules(
-    config: ConfigDep,
+    schedules_db: SchedulesDBDep,
     service: str | None = None,
     enabled: bool | None = None,
 ):
@@ -116,15 +122,13 @@ async def list_schedules(
         List of schedules
     """
     try:
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
         schedules = await schedules_db.get_schedules(service=service, enabled=enabled)
 
-        return [_prepare_schedule_response(schedule) for schedule in schedules]
+        # Rows come from our own DB, so skip per-item Pydantic validation
+        return [_schedule_payload(schedule) for schedule in schedules]
 
     except Exception as e:
-        logger.error(f"Failed to list schedules: {e}")
+        logger.exception("Failed to list schedules")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list schedules: {str(e)}"
@@ -132,7 +136,9 @@ async def list_schedules(
 
 
 @router.post("", response_model=ScheduleResponse)
-async def create_schedule(schedule: ScheduleCreate, config: ConfigDep):
+async def create_schedule(
+    schedule: ScheduleCreate, schedules_db: SchedulesDBDep, scheduler: SchedulerDep
+):
     """Create a new schedule.
 
     Args:
@@ -142,30 +148,9 @@ async def create_schedule(schedule: ScheduleCreate, config: ConfigDep):
         Created schedule with ID
     """
     try:
+        # schedule_type and its trigger field are validated by ScheduleCreate
         services = _normalize_services(schedule.services, schedule.service)
 
-        # Validate schedule type
-        if schedule.schedule_type not in ["interval", "datetime"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="schedule_type must be 'interval' or 'datetime'"
-            )
-
-        # Validate interval or cron expression
-        if schedule.schedule_type == "interval" and not schedule.interval_minutes:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="interval_minutes required for interval type"
-            )
-        if schedule.schedule_type == "datetime" and not schedule.cron_expression:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="cron_expression required for datetime type"
-            )
-
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
         schedule_id = await schedules_db.create_schedule(
             service=services[0],
             name=schedule.name,
@@ -180,10 +165,9 @@ async def create_schedule(schedule: ScheduleCreate, config: ConfigDep):
         # Get the created schedule
         created = await schedules_db.get_schedule(schedule_id)
 
-        logger.info(f"Schedule created: {schedule.name} (ID: {schedule_id})")
+        logger.info("Schedule created: %s (ID: %s)", schedule.name, schedule_id)
 
         # Register schedule with APScheduler
-        from icloudbridge.api.app import scheduler
         if scheduler:
             await scheduler.add_schedule(schedule_id)
 
@@ -192,7 +176,7 @@ async def create_schedule(schedule: ScheduleCreate, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create schedule: {e}")
+        logger.exception("Failed to create schedule")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create schedule: {str(e)}"
@@ -200,7 +184,7 @@ async def create_schedule(schedule: ScheduleCreate, config: ConfigDep):
 
 
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
-async def get_schedule(schedule_id: int, config: ConfigDep):
+async def get_schedule(schedule_id: int, schedules_db: SchedulesDBDep):
     """Get a schedule by ID.
 
     Args:
@@ -210,9 +194,6 @@ async def get_schedule(schedule_id: int, config: ConfigDep):
         Schedule details
     """
     try:
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
         schedule = await schedules_db.get_schedule(schedule_id)
 
         return _prepare_schedule_response(schedule)
@@ -220,7 +201,7 @@ async def get_schedule(schedule_id: int, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get schedule: {e}")
+        logger.exception("Failed to get schedule")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get schedule: {str(e)}"
@@ -231,7 +212,8 @@ async def get_schedule(schedule_id: int, config: ConfigDep):
 async def update_schedule(
     schedule_id: int,
     update: ScheduleUpdate,
-    config: ConfigDep,
+    schedules_db: SchedulesDBDep,
+    scheduler: SchedulerDep,
 ):
     """Update a schedule.
 
@@ -243,23 +225,17 @@ async def update_schedule(
         Updated schedule
     """
     try:
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
-        # Check if schedule exists
-        schedule = await schedules_db.get_schedule(schedule_id)
-        if not schedule:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Schedule {schedule_id} not found"
-            )
-
         services = None
-        if update.services is not None:
-            services = _normalize_services(update.services, schedule.get("service"))
-
-        # Update schedule
-        await schedules_db.update_schedule(
+        if update.services:
+            services = _normalize_services(update.services, None)
+        elif update.services is not None:
+            # An empty selection falls back to the schedule's primary service
+            existing = await schedules_db.get_schedule(schedule_id)
+            if existing:
+                services = _normalize_services(None, existing.get("service"))
+
+        # Update schedule; RETURNING gives us the new row, or None if it doesn't exist
+        updated = await schedules_db.update_schedule(
             schedule_id=schedule_id,
             name=update.name,
             enabled=update.enabled,
@@ -269,14 +245,15 @@ async def update_schedule(
             config_json=_serialize_config_json(update.config_json),
             services=services,
         )
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Schedule {schedule_id} not found"
+            )
 
-        # Get updated schedule
-        updated = await schedules_db.get_schedule(schedule_id)
-
-        logger.info(f"Schedule updated: {schedule_id}")
+        logger.info("Schedule updated: %s", schedule_id)
 
         # Update schedule in APScheduler
-        from icloudbridge.api.app import scheduler
         if scheduler:
             await scheduler.update_schedule(schedule_id)
 
@@ -285,7 +262,7 @@ async def update_schedule(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update schedule: {e}")
+        logger.exception("Failed to update schedule")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update schedule: {str(e)}"
@@ -293,7 +270,7 @@ async def update_schedule(
 
 
 @router.delete("/{schedule_id}")
-async def delete_schedule(schedule_id: int, config: ConfigDep):
+async def delete_schedule(schedule_id: int, schedules_db: SchedulesDBDep, scheduler: SchedulerDep):
     """Delete a schedule.
 
     Args:
@@ -303,23 +280,15 @@ async def delete_schedule(schedule_id: int, config: ConfigDep):
         Success message
     """
     try:
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
-        # Check if schedule exists
-        schedule = await schedules_db.get_schedule(schedule_id)
-        if not schedule:
+        if await schedules_db.delete_schedule(schedule_id) is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Schedule {schedule_id} not found"
             )
 
-        await schedules_db.delete_schedule(schedule_id)
-
-        logger.info(f"Schedule deleted: {schedule_id}")
+        logger.info("Schedule deleted: %s", schedule_id)
 
         # Remove schedule from APScheduler
-        from icloudbridge.api.app import scheduler
         if scheduler:
             await scheduler.remove_schedule(schedule_id)
 
@@ -331,7 +300,7 @@ async def delete_schedule(schedule_id: int, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete schedule: {e}")
+        logger.exception("Failed to delete schedule")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete schedule: {str(e)}"
@@ -339,7 +308,7 @@ async def delete_schedule(schedule_id: int, config: ConfigDep):
 
 
 @router.post("/{schedule_id}/run")
-async def run_schedule(schedule_id: int, config: ConfigDep):
+async def run_schedule(schedule_id: int, schedules_db: SchedulesDBDep, scheduler: SchedulerDep):
     """Manually trigger a schedule to run immediately.
 
     Args:
@@ -349,9 +318,6 @@ async def run_schedule(schedule_id: int, config: ConfigDep):
         Success message
     """
     try:
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
         # Check if schedule exists
         schedule = await schedules_db.get_schedule(schedule_id)
         if not schedule:
@@ -360,10 +326,9 @@ async def run_schedule(schedule_id: int, config: ConfigDep):
                 detail=f"Schedule {schedule_id} not found"
             )
 
-        logger.info(f"Manual run requested for schedule: {schedule_id}")
+        logger.info("Manual run requested for schedule: %s", schedule_id)
 
         # Trigger schedule execution in APScheduler
-        from icloudbridge.api.app import scheduler
         if scheduler:
             await scheduler.trigger_schedule(schedule_id)
 
@@ -375,7 +340,7 @@ async def run_schedule(schedule_id: int, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to run schedule: {e}")
+        logger.exception("Failed to run schedule")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to run schedule: {str(e)}"
@@ -383,7 +348,7 @@ async def run_schedule(schedule_id: int, config: ConfigDep):
 
 
 @router.put("/{schedule_id}/toggle")
-async def toggle_schedule(schedule_id: int, config: ConfigDep):
+async def toggle_schedule(schedule_id: int, schedules_db: SchedulesDBDep, scheduler: SchedulerDep):
     """Toggle a schedule's enabled status.
 
     Args:
@@ -393,31 +358,18 @@ async def toggle_schedule(schedule_id: int, config: ConfigDep):
         Updated schedule
     """
     try:
-        schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        await schedules_db.initialize()
-
-        # Get current schedule
-        schedule = await schedules_db.get_schedule(schedule_id)
-        if not schedule:
+        # Toggle enabled status atomically
+        updated = await schedules_db.toggle_schedule(schedule_id)
+        if not updated:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Schedule {schedule_id} not found"
             )
+        new_enabled = bool(updated["enabled"])
 
-        # Toggle enabled status
-        new_enabled = not schedule["enabled"]
-        await schedules_db.update_schedule(
-            schedule_id=schedule_id,
-            enabled=new_enabled,
-        )
-
-        # Get updated schedule
-        updated = await schedules_db.get_schedule(schedule_id)
-
-        logger.info(f"Schedule {schedule_id} {'enabled' if new_enabled else 'disabled'}")
+        logger.info("Schedule %s %s", schedule_id, "enabled" if new_enabled else "disabled")
 
         # Enable/disable schedule in APScheduler
-        from icloudbridge.api.app import scheduler
         if scheduler:
             if new_enabled:
                 await scheduler.add_schedule(schedule_id)
@@ -429,7 +381,7 @@ async def toggle_schedule(schedule_id: int, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to toggle schedule: {e}")
+        logger.exception("Failed to toggle schedule")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to toggle schedule: {str(e)}"
@@ -4,9 +4,8 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
-from icloudbridge.api.dependencies import ConfigDep
+from icloudbridge.api.dependencies import SettingsDBDep
 from icloudbridge.api.models import SettingUpdate
-from icloudbridge.utils.db import SettingsDB
 
 logger = logging.getLogger(__name__)
 
@@ -14,22 +13,19 @@ router = APIRouter()
 
 
 @router.get("")
-async def get_all_settings(config: ConfigDep):
+async def get_all_settings(settings_db: SettingsDBDep):
     """Get all settings.
 
     Returns:
         Dictionary of all settings
     """
     try:
-        settings_db = SettingsDB(config.general.data_dir / "settings.db")
-        await settings_db.initialize()
-
         settings = await settings_db.get_all_settings()
 
         return {"settings": settings}
 
     except Exception as e:
-        logger.error(f"Failed to get settings: {e}")
+        logger.exception("Failed to get settings")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get settings: {str(e)}"
@@ -37,7 +33,7 @@ async def get_all_settings(config: ConfigDep):
 
 
 @router.get("/{key}")
-async def get_setting(key: str, config: ConfigDep):
+async def get_setting(key: str, settings_db: SettingsDBDep):
     """Get a specific setting.
 
     Args:
@@ -47,9 +43,6 @@ async def get_setting(key: str, config: ConfigDep):
         Setting value
     """
     try:
-        settings_db = SettingsDB(config.general.data_dir / "settings.db")
-        await settings_db.initialize()
-
         value = await settings_db.get_setting(key)
 
         if value is None:
@@ -63,7 +56,7 @@ async def get_setting(key: str, config: ConfigDep):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get setting: {e}")
+        logger.exception("Failed to get setting")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get setting: {str(e)}"
@@ -71,7 +64,7 @@ async def get_setting(key: str, config: ConfigDep):
 
 
 @router.put("")
-async def update_settings(updates: list[SettingUpdate], config: ConfigDep):
+async def update_settings(updates: list[SettingUpdate], settings_db: SettingsDBDep):
     """Update multiple settings.
 
     Args:
@@ -81,13 +74,9 @@ async def update_settings(updates: list[SettingUpdate], config: ConfigDep):
         Success message
     """
     try:
-        settings_db = SettingsDB(config.general.data_dir / "settings.db")
-        await settings_db.initialize()
-
-        for update in updates:
-            await settings_db.set_setting(update.key, update.value)
+        await settings_db.set_settings([(update.key, update.value) for update in updates])
 
-        logger.info(f"Updated {len(updates)} settings")
+        logger.info("Updated %s settings", len(updates))
 
         return {
             "status": "success",
@@ -95,7 +84,7 @@ async def update_settings(updates: list[SettingUpdate], config: ConfigDep):
         }
 
     except Exception as e:
-        logger.error(f"Failed to update settings: {e}")
+        logger.exception("Failed to update settings")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update settings: {str(e)}"
@@ -103,7 +92,7 @@ async def update_settings(updates: list[SettingUpdate], config: ConfigDep):
 
 
 @router.put("/{key}")
-async def update_setting(key: str, value: str, config: ConfigDep):
+async def update_setting(key: str, value: str, settings_db: SettingsDBDep):
     """Update a single setting.
 
     Args:
@@ -114,17 +103,14 @@ async def update_setting(key: str, value: str, config: ConfigDep):
         Updated setting
     """
     try:
-        settings_db = SettingsDB(config.general.data_dir / "settings.db")
-        await settings_db.initialize()
-
         await settings_db.set_setting(key, value)
 
-        logger.info(f"Setting updated: {key} = {value}")
+        logger.info("Setting updated: %s = %s", key, value)
 
         return {"key": key, "value": value}
 
     except Exception as e:
-        logger.error(f"Failed to update setting: {e}")
+        logger.exception("Failed to update setting")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update setting: {str(e)}"
@@ -132,7 +118,7 @@ async def update_setting(key: str, value: str, config: ConfigDep):
 
 
 @router.delete("/{key}")
-async def delete_setting(key: str, config: ConfigDep):
+async def delete_setting(key: str, settings_db: SettingsDBDep):
     """Delete a setting.
 
     Args:
@@ -142,12 +128,9 @@ async def delete_setting(key: str, config: ConfigDep):
         Success message
     """
     try:
-        settings_db = SettingsDB(config.general.data_dir / "settings.db")
-        await settings_db.initialize()
-
         await settings_db.delete_setting(key)
 
-        logger.info(f"Setting deleted: {key}")
+        logger.info("Setting deleted: %s", key)
 
         return {
             "status": "success",
@@ -155,7 +138,7 @@ async def delete_setting(key: str, config: ConfigDep):
         }
 
     except Exception as e:
-        logger.error(f"Failed to delete setting: {e}")
+        logger.exception("Failed to delete setting")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete setting: {str(e)}"
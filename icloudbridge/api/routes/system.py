@@ -1,5 +1,6 @@
 """System and utility endpoints."""
 
+import asyncio
 import logging
 import os
 import platform
@@ -12,14 +13,13 @@ from fastapi import APIRouter, Request, HTTPException, status
 from pydantic import BaseModel
 
 from icloudbridge import __version__
-from icloudbridge.api.dependencies import ConfigDep
+from icloudbridge.api.dependencies import ConfigDep, SettingsDBDep
 from icloudbridge.api.models import (
     SetupVerificationResponse,
     ShortcutStatus,
     FullDiskAccessStatus,
     NotesFolderStatus,
 )
-from icloudbridge.utils.db import SettingsDB
 from icloudbridge.utils.logging import set_logging_level
 
 logger = logging.getLogger(__name__)
@@ -39,20 +39,25 @@ async def get_database_paths(config: ConfigDep) -> dict:
         Dictionary with database paths for notes, reminders, and passwords,
         including existence status for each.
     """
-    config.ensure_data_dir()
-
     notes_db = config.general.data_dir / "notes.db"
     reminders_db = config.general.data_dir / "reminders.db"
     passwords_db = config.general.data_dir / "passwords.db"
 
+    def check_paths() -> tuple[bool, bool, bool]:
+        config.ensure_data_dir()
+        return notes_db.exists(), reminders_db.exists(), passwords_db.exists()
+
+    # One worker-thread hop for the mkdir and stat calls instead of blocking the loop
+    notes_exists, reminders_exists, passwords_exists = await asyncio.to_thread(check_paths)
+
     return {
         "notes_db": str(notes_db),
         "reminders_db": str(reminders_db),
         "passwords_db": str(passwords_db),
         "metadata": {
-            "notes_exists": notes_db.exists(),
-            "reminders_exists": reminders_db.exists(),
-            "passwords_exists": passwords_db.exists(),
+            "notes_exists": notes_exists,
+            "reminders_exists": reminders_exists,
+            "passwords_exists": passwords_exists,
         }
     }
 
@@ -75,28 +80,24 @@ async def get_system_info(config: ConfigDep) -> dict:
 
 
 @router.get("/log-level")
-async def get_log_level(config: ConfigDep) -> dict:
+async def get_log_level(config: ConfigDep, settings_db: SettingsDBDep) -> dict:
     """Return the current runtime log level."""
 
-    settings_db = SettingsDB(config.general.data_dir / "settings.db")
-    await settings_db.initialize()
     level = await settings_db.get_setting("log_level")
     return {"log_level": level or config.general.log_level}
 
 
 @router.put("/log-level")
-async def update_log_level(payload: LogLevelPayload, config: ConfigDep) -> dict:
+async def update_log_level(payload: LogLevelPayload, settings_db: SettingsDBDep) -> dict:
     """Update the runtime log level and persist the preference."""
 
     try:
-        settings_db = SettingsDB(config.general.data_dir / "settings.db")
-        await settings_db.initialize()
         await settings_db.set_setting("log_level", payload.level)
         set_logging_level(payload.level)
-        logger.info(f"Log level changed to {payload.level}")
+        logger.info("Log level changed to %s", payload.level)
         return {"log_level": payload.level}
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error(f"Failed to update log level: {exc}")
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Failed to update log level")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update log level",
@@ -148,9 +149,9 @@ async def verify_setup(request: Request, config: ConfigDep) -> SetupVerification
         )
         if result.returncode == 0:
             installed_shortcuts = set(line.strip() for line in result.stdout.splitlines())
-            logger.info(f"Found {len(installed_shortcuts)} installed shortcuts")
+            logger.info("Found %s installed shortcuts", len(installed_shortcuts))
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        logger.warning(f"Failed to list shortcuts: {e}")
+        logger.warning("Failed to list shortcuts: %s", e)
 
     shortcut_statuses = [
         ShortcutStatus(
@@ -174,9 +175,9 @@ async def verify_setup(request: Request, config: ConfigDep) -> SetupVerification
             has_fda = True
             logger.info("Full Disk Access verified - can read Notes database")
         else:
-            logger.warning(f"Notes database not found at: {notes_db_path}")
+            logger.warning("Notes database not found at: %s", notes_db_path)
     except (PermissionError, OSError) as e:
-        logger.warning(f"No Full Disk Access - cannot read Notes database: {e}")
+        logger.warning("No Full Disk Access - cannot read Notes database: %s", e)
         has_fda = False
 
     fda_status = FullDiskAccessStatus(
@@ -201,9 +202,9 @@ async def verify_setup(request: Request, config: ConfigDep) -> SetupVerification
                 test_file.touch()
                 test_file.unlink()
                 folder_writable = True
-                logger.info(f"Notes folder is writable: {notes_folder_path}")
+                logger.info("Notes folder is writable: %s", notes_folder_path)
             except (PermissionError, OSError) as e:
-                logger.warning(f"Notes folder not writable: {e}")
+                logger.warning("Notes folder not writable: %s", e)
                 folder_writable = False
 
     notes_folder_status = NotesFolderStatus(
@@ -276,7 +277,7 @@ async def browse_folders(path: str = "~") -> dict:
                         "path": str(item),
                     })
         except PermissionError:
-            logger.warning(f"Permission denied browsing: {browse_path}")
+            logger.warning("Permission denied browsing: %s", browse_path)
 
         return {
             "current_path": str(browse_path),
@@ -286,7 +287,7 @@ async def browse_folders(path: str = "~") -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Error browsing folders: {e}")
+        logger.exception("Error browsing folders")
         # Return home directory as fallback
         home_path = Path.home()
         return {
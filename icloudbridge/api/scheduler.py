@@ -14,6 +14,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from icloudbridge.api.dependencies import invalidate_status
 from icloudbridge.api.websocket import send_schedule_run, send_sync_progress
 from icloudbridge.core.config import AppConfig, load_config
 from icloudbridge.core.passwords_sync import PasswordsSyncEngine
@@ -45,8 +46,8 @@ class SchedulerManager:
         """
         self.config = config
         self.scheduler = AsyncIOScheduler()
-        self.schedules_db = SchedulesDB(config.general.data_dir / "schedules.db")
-        self.sync_logs_db = SyncLogsDB(config.general.data_dir / "sync_logs.db")
+        self.schedules_db = SchedulesDB(config.state_db_path)
+        self.sync_logs_db = SyncLogsDB(config.state_db_path)
         self._running = False
 
     @property
@@ -86,7 +87,7 @@ class SchedulerManager:
         self.scheduler.start()
         self._running = True
 
-        logger.info(f"Scheduler started with {len(schedules)} active schedules")
+        logger.info("Scheduler started with %s active schedules", len(schedules))
 
     async def stop(self) -> None:
         """Stop the scheduler and cleanup."""
@@ -117,10 +118,10 @@ class SchedulerManager:
             try:
                 trigger = CronTrigger.from_crontab(schedule["cron_expression"])
             except Exception as e:
-                logger.error(f"Invalid cron expression for schedule {schedule_id}: {e}")
+                logger.error("Invalid cron expression for schedule %s: %s", schedule_id, e)
                 return
         else:
-            logger.error(f"Unknown schedule type: {schedule_type}")
+            logger.error("Unknown schedule type: %s", schedule_type)
             return
 
         # Add job to scheduler
@@ -133,7 +134,7 @@ class SchedulerManager:
             name=schedule["name"],
         )
 
-        logger.info(f"Schedule {schedule_id} ({schedule['name']}) added to scheduler")
+        logger.info("Schedule %s (%s) added to scheduler", schedule_id, schedule["name"])
 
         next_run_timestamp = self._get_next_run_timestamp(job)
         if next_run_timestamp:
@@ -152,13 +153,13 @@ class SchedulerManager:
 
         schedule = await self.schedules_db.get_schedule(schedule_id)
         if not schedule:
-            logger.error(f"Schedule {schedule_id} not found")
+            logger.error("Schedule %s not found", schedule_id)
             return
 
         schedule_name = schedule["name"]
         services = schedule.get("services") or []
         if not services:
-            logger.warning(f"Schedule {schedule_id} has no services configured")
+            logger.warning("Schedule %s has no services configured", schedule_id)
             return
 
         logger.info(
@@ -175,7 +176,7 @@ class SchedulerManager:
                 if isinstance(parsed, dict):
                     config_dict = parsed
             except json.JSONDecodeError:
-                logger.warning(f"Invalid config JSON for schedule {schedule_id}")
+                logger.warning("Invalid config JSON for schedule %s", schedule_id)
 
         # Track whether any service failed
         schedule_failed = False
@@ -200,8 +201,9 @@ class SchedulerManager:
                     log_id=log_id,
                     status="success",
                     duration_seconds=duration,
-                    stats_json=json.dumps(result),
+                    stats=result,
                 )
+                invalidate_status()
 
                 await send_schedule_run(service, schedule_id, schedule_name, "completed")
                 await send_sync_progress(
@@ -237,6 +239,7 @@ class SchedulerManager:
                     duration_seconds=duration,
                     error_message=error_msg,
                 )
+                invalidate_status()
 
                 await send_schedule_run(service, schedule_id, schedule_name, "failed")
                 await send_sync_progress(
@@ -522,7 +525,7 @@ class SchedulerManager:
         job_id = f"schedule_{schedule_id}"
         if self.scheduler.get_job(job_id):
             self.scheduler.remove_job(job_id)
-            logger.info(f"Schedule {schedule_id} removed from scheduler")
+            logger.info("Schedule %s removed from scheduler", schedule_id)
 
     async def update_schedule(self, schedule_id: int) -> None:
         """Update a schedule in the scheduler.
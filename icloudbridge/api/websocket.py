@@ -37,7 +37,7 @@ class ConnectionManager:
         """
         await websocket.accept()
         self.active_connections.append(websocket)
-        logger.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
+        logger.info("WebSocket client connected. Total connections: %s", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection from active connections.
@@ -47,7 +47,7 @@ class ConnectionManager:
         """
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-            logger.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
+            logger.info("WebSocket client disconnected. Total connections: %s", len(self.active_connections))
 
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket) -> None:
         """Send a message to a specific client.
@@ -59,7 +59,7 @@ class ConnectionManager:
         try:
             await websocket.send_json(message)
         except Exception as e:
-            logger.error(f"Failed to send personal message: {e}")
+            logger.error("Failed to send personal message: %s", e)
             self.disconnect(websocket)
 
     async def broadcast(self, message: Dict[str, Any]) -> None:
@@ -74,7 +74,7 @@ class ConnectionManager:
             try:
                 await connection.send_json(message)
             except Exception as e:
-                logger.error(f"Failed to broadcast to client: {e}")
+                logger.error("Failed to broadcast to client: %s", e)
                 disconnected.append(connection)
 
         # Clean up disconnected clients
@@ -340,7 +340,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             except WebSocketDisconnect:
                 break
             except Exception as e:
-                logger.error(f"Error handling WebSocket message: {e}")
+                logger.exception("Error handling WebSocket message")
                 await manager.send_personal_message(
                     {
                         "type": "error",
@@ -352,6 +352,6 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+    except Exception:
+        logger.exception("WebSocket error")
         manager.disconnect(websocket)
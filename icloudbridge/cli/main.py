@@ -13,10 +13,6 @@ from rich.table import Table
 
 from icloudbridge import __version__
 from icloudbridge.core.config import load_config
-from icloudbridge.core.photos_sync import PhotoSyncEngine
-from icloudbridge.core.reminders_sync import RemindersSyncEngine
-from icloudbridge.core.rich_notes_export import RichNotesExporter
-from icloudbridge.core.sync import NotesSyncEngine
 from icloudbridge.utils.logging import setup_logging
 from icloudbridge.utils.settings_db import get_config_path, set_config_path
 
@@ -206,6 +202,8 @@ def photos(
         console.print("[red]Photos sync is disabled in the configuration.[/red]")
         raise typer.Exit(1)
 
+    from icloudbridge.core.photos_sync import PhotoSyncEngine
+
     engine = PhotoSyncEngine(cfg.photos, cfg.general.data_dir)
     stats = asyncio.run(engine.sync(sources=source or None, dry_run=dry_run, initial_scan=initial_scan))
 
@@ -387,6 +385,8 @@ def notes_sync(
         # Initialize sync engine
         prefer_shortcuts = shortcut_push if shortcut_push is not None else cfg.notes.use_shortcuts_for_push
 
+        from icloudbridge.core.sync import NotesSyncEngine
+
         sync_engine = NotesSyncEngine(
             markdown_base_path=cfg.notes.remote_folder,
             db_path=cfg.notes_db_path,
@@ -652,6 +652,8 @@ def notes_sync(
 
     if rich_notes:
         try:
+            from icloudbridge.core.rich_notes_export import RichNotesExporter
+
             exporter = RichNotesExporter(cfg.notes_db_path, cfg.notes.remote_folder)
             exporter.export(dry_run=dry_run)
             if dry_run:
@@ -671,6 +673,8 @@ def notes_list(ctx: typer.Context) -> None:
     cfg = ctx.obj["config"]
 
     async def run_list():
+        from icloudbridge.core.sync import NotesSyncEngine
+
         # Initialize sync engine
         sync_engine = NotesSyncEngine(
             markdown_base_path=cfg.notes.remote_folder or Path("/tmp"),
@@ -717,6 +721,8 @@ def notes_status(ctx: typer.Context) -> None:
         return
 
     async def run_status():
+        from icloudbridge.core.sync import NotesSyncEngine
+
         # Initialize sync engine
         sync_engine = NotesSyncEngine(
             markdown_base_path=cfg.notes.remote_folder or Path("/tmp"),
@@ -776,6 +782,8 @@ def notes_reset(
             raise typer.Exit(0)
 
     async def run_reset():
+        from icloudbridge.core.sync import NotesSyncEngine
+
         # Initialize sync engine
         sync_engine = NotesSyncEngine(
             markdown_base_path=cfg.notes.remote_folder or Path("/tmp"),
@@ -883,6 +891,8 @@ def reminders_sync(
         console.print("[cyan]DRY RUN MODE: Previewing changes only[/cyan]\n")
 
     async def run_sync():
+        from icloudbridge.core.reminders_sync import RemindersSyncEngine
+
         # Initialize sync engine
         sync_engine = RemindersSyncEngine(
             caldav_url=cfg.reminders.caldav_url,
@@ -1098,6 +1108,8 @@ def reminders_reset(
             raise typer.Exit(0)
 
     async def reset_db():
+        from icloudbridge.core.reminders_sync import RemindersSyncEngine
+
         sync_engine = RemindersSyncEngine(
             caldav_url=cfg.reminders.caldav_url or "http://dummy.url",
             caldav_username=cfg.reminders.caldav_username or "dummy",
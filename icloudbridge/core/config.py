@@ -1,5 +1,6 @@
 """Configuration management using Pydantic Settings."""
 
+import importlib.util
 import logging
 from pathlib import Path
 
@@ -170,6 +171,9 @@ class PhotosConfig(BaseSettings):
     """Configuration for Photos synchronization."""
 
     enabled: bool = False
+    # "blake3" is faster on large libraries (needs the optional blake3 package).
+    # Switching algorithms invalidates stored hashes, so existing files are
+    # re-checked against the Photos library on the next sync.
     hash_algorithm: str = "sha256"
     default_album: str = "iCloudBridge Imports"
     sources: dict[str, PhotoSourceConfig] = Field(default_factory=dict)
@@ -179,9 +183,11 @@ class PhotosConfig(BaseSettings):
     def validate_hash_algorithm(cls, v: str) -> str:
         """Validate supported hash algorithms."""
         normalized = v.lower()
-        supported = {"sha256"}
+        supported = {"sha256", "blake3"}
         if normalized not in supported:
             raise ValueError(f"Unsupported hash algorithm '{v}'. Supported: {', '.join(sorted(supported))}")
+        if normalized == "blake3" and importlib.util.find_spec("blake3") is None:
+            raise ValueError("Hash algorithm 'blake3' requires the blake3 package (pip install blake3)")
         return normalized
 
     def model_dump(self, **kwargs) -> dict:
@@ -320,6 +326,7 @@ class GeneralConfig(BaseSettings):
     data_dir: Path = Field(
         default_factory=lambda: Path.home() / ".icloudbridge"
     )
+    status_cache_ttl: float = 1.0  # seconds; 0 disables status caching
     # Runtime metadata - not serialized to config file (stored in settings DB instead)
     config_file: Path | None = Field(default=None, exclude=True)
 
@@ -466,6 +473,11 @@ class AppConfig(BaseSettings):
         """Path to the Photos sync database."""
         return self.general.data_dir / "photos.db"
 
+    @property
+    def state_db_path(self) -> Path:
+        """Path to the shared state database (sync logs and schedules)."""
+        return self.general.data_dir / "state.db"
+
     @property
     def default_config_path(self) -> Path:
         """Get default configuration file path."""
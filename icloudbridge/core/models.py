@@ -3,7 +3,26 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
+from typing import ClassVar
+
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"})
+
+
+def _as_datetime(value):
+    """Convert an ISO string or epoch seconds to a datetime; other values pass through."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value)
+    return value
+
+
+def _convert_dates(obj) -> None:
+    """Convert the fields named in ``obj._DATE_FIELDS`` in place, skipping datetimes and empty values."""
+    for name in obj._DATE_FIELDS:
+        value = getattr(obj, name)
+        if value and not isinstance(value, datetime):
+            setattr(obj, name, _as_datetime(value))
 
 
 class SyncStatus(str, Enum):
@@ -23,7 +42,7 @@ class SyncDirection(str, Enum):
     REMOTE_TO_LOCAL = "remote_to_local"
 
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     """Represents an attachment in a note."""
 
@@ -37,13 +56,15 @@ class Attachment:
         """Check if attachment is an image."""
         if self.mime_type:
             return self.mime_type.startswith("image/")
-        if self.filename:
-            ext = Path(self.filename).suffix.lower()
-            return ext in {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
+        name = self.filename
+        if name:
+            # Same rule as Path.suffix for a bare filename, without building a Path
+            i = name.rfind(".")
+            return i > 0 and name[i:].lower() in _IMAGE_EXTS
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """Represents a note from Apple Notes or remote storage."""
 
@@ -57,15 +78,14 @@ class Note:
     folder_uuid: str | None = None
     folder_name: str | None = None
 
+    _DATE_FIELDS: ClassVar[tuple[str, ...]] = ("created_date", "modified_date")
+
     def __post_init__(self):
         """Ensure dates are datetime objects."""
-        if isinstance(self.created_date, str):
-            self.created_date = datetime.fromisoformat(self.created_date)
-        if isinstance(self.modified_date, str):
-            self.modified_date = datetime.fromisoformat(self.modified_date)
+        _convert_dates(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteFolder:
     """Represents a folder containing notes."""
 
@@ -76,7 +96,7 @@ class NoteFolder:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Reminder:
     """Represents a reminder from Apple Reminders or CalDAV."""
 
@@ -94,21 +114,20 @@ class Reminder:
     list_uuid: str | None = None
     list_name: str | None = None
 
+    _DATE_FIELDS: ClassVar[tuple[str, ...]] = (
+        "created_date",
+        "modified_date",
+        "completion_date",
+        "due_date",
+        "remind_me_date",
+    )
+
     def __post_init__(self):
         """Ensure dates are datetime objects."""
-        if isinstance(self.created_date, str):
-            self.created_date = datetime.fromisoformat(self.created_date)
-        if isinstance(self.modified_date, str):
-            self.modified_date = datetime.fromisoformat(self.modified_date)
-        if self.completion_date and isinstance(self.completion_date, str):
-            self.completion_date = datetime.fromisoformat(self.completion_date)
-        if self.due_date and isinstance(self.due_date, str):
-            self.due_date = datetime.fromisoformat(self.due_date)
-        if self.remind_me_date and isinstance(self.remind_me_date, str):
-            self.remind_me_date = datetime.fromisoformat(self.remind_me_date)
-
-
-@dataclass
+        _convert_dates(self)
+
+
+@dataclass(slots=True)
 class ReminderList:
     """Represents a list of reminders."""
 
@@ -119,7 +138,7 @@ class ReminderList:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a synchronization operation."""
 
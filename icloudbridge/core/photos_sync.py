@@ -4,16 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
+import os
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Iterable
 from uuid import uuid4
 
+import orjson
+
 from icloudbridge.core.config import PhotoSourceConfig, PhotosConfig
 from icloudbridge.sources.photos import (
     PhotoCandidate,
@@ -28,6 +30,12 @@ logger = logging.getLogger(__name__)
 # Type alias for progress callback
 ProgressCallback = Callable[[int, str], Awaitable[None]]
 
+# Files hashed concurrently during a scan
+HASH_CONCURRENCY = min(8, os.cpu_count() or 1)
+
+# Albums imported into Photos concurrently; osascript calls are bound by AppleEvent round-trips
+ALBUM_IMPORT_CONCURRENCY = 2
+
 
 @dataclass(slots=True)
 class PhotoImportRecord:
@@ -47,14 +55,24 @@ class PhotoSyncEngine:
         self.apple = PhotosAppleScriptAdapter()
         self.temp_dir = data_dir / "photos" / "tmp"
         self.meta_dir = data_dir / "photos" / "meta"
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-        self.meta_dir.mkdir(parents=True, exist_ok=True)
         self._name_exists_cache: dict[str, bool] = {}
         self._original_name_cache: dict[Path, str | None] = {}
         self._existing_live_stems: set[str] = set()
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
 
     async def initialize(self) -> None:
-        await self.db.initialize()
+        """Prepare the working directories and photos database (once per engine)."""
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await asyncio.to_thread(self._create_dirs)
+            await self.db.initialize()
+            self._initialized = True
+
+    def _create_dirs(self) -> None:
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.meta_dir.mkdir(parents=True, exist_ok=True)
 
     async def sync(
         self,
@@ -87,24 +105,28 @@ class PhotoSyncEngine:
 
         new_records: list[PhotoImportRecord] = []
         skipped_existing = 0
-        total_candidates = len(candidates)
 
-        for idx, candidate in enumerate(candidates):
+        # Progress scaling depends on whether we'll import or not
+        # Dry-run/initial_scan: 10% to 95% while analyzing (no import phase)
+        # Normal sync: 10% to 50% while analyzing (import phase is 55-95%)
+        # Hashing takes the first half of that range, per-file checks the second.
+        analysis_span = 85 if dry_run or initial_scan else 40
+        hash_span = analysis_span // 2
+
+        unseen = await self._hash_unseen(candidates, progress_callback, hash_span)
+        seen_hashes: set[str] = set()
+        total_unseen = len(unseen)
+
+        for idx, (candidate, file_hash) in enumerate(unseen):
             # Report progress every 10 files or at milestones
-            if progress_callback and (idx % 10 == 0 or idx == total_candidates - 1):
-                # Progress scaling depends on whether we'll import or not
-                # Dry-run/initial_scan: 10% to 95% during hashing (no import phase)
-                # Normal sync: 10% to 50% during hashing (import phase is 55-95%)
-                if dry_run or initial_scan:
-                    progress = 10 + int((idx / total_candidates) * 85)
-                else:
-                    progress = 10 + int((idx / total_candidates) * 40)
-                await progress_callback(progress, f"Analyzing file {idx + 1} of {total_candidates}...")
+            if progress_callback and (idx % 10 == 0 or idx == total_unseen - 1):
+                progress = 10 + hash_span + int((idx / total_unseen) * (analysis_span - hash_span))
+                await progress_callback(progress, f"Analyzing file {idx + 1} of {total_unseen}...")
 
-            file_hash = await self._hash_file(candidate.path)
-            existing = await self.db.get_by_hash(file_hash)
-            if existing:
+            # Identical files within one scan hash the same; handle the first only
+            if file_hash in seen_hashes:
                 continue
+            seen_hashes.add(file_hash)
 
             if (
                 not initial_scan
@@ -138,24 +160,27 @@ class PhotoSyncEngine:
                     skipped_existing += 1
                     continue
 
-            # Only persist discoveries when we're preparing for a real import.
-            # The simulator (dry-run) must stay read-only so running it doesn't
-            # permanently suppress pending imports once hashes are cached.
-            if not dry_run:
-                await self.db.record_discovery(
-                    content_hash=file_hash,
-                    path=candidate.path,
-                    size=candidate.size,
-                    media_type=candidate.media_type,
-                    source_name=candidate.source_name,
-                    album=candidate.album,
-                    captured_at=captured_at,
-                )
-
             new_records.append(
                 PhotoImportRecord(candidate=candidate, content_hash=file_hash, captured_at=captured_at)
             )
 
+        # Only persist discoveries when we're preparing for a real import.
+        # The simulator (dry-run) must stay read-only so running it doesn't
+        # permanently suppress pending imports once hashes are cached.
+        if not dry_run:
+            await self.db.record_discoveries(
+                (
+                    record.content_hash,
+                    record.candidate.path,
+                    record.candidate.size,
+                    record.candidate.media_type,
+                    record.candidate.source_name,
+                    record.candidate.album,
+                    record.captured_at,
+                )
+                for record in new_records
+            )
+
         if not new_records:
             if progress_callback:
                 await progress_callback(100, "No new files to import")
@@ -186,45 +211,69 @@ class PhotoSyncEngine:
                 "sources": scanned_sources,
             }
 
+        # Records per album, plus the encoded manifest paths in the same order
         grouped: dict[str, list[PhotoImportRecord]] = defaultdict(list)
+        grouped_paths: dict[str, list[bytes]] = defaultdict(list)
         for record in new_records:
             # Use source album, fall back to config default, then hard-coded default
             album = (record.candidate.album or self.config.default_album or "iCloudBridge Imports").strip()
             if not album:
                 album = "iCloudBridge Imports"
             grouped[album].append(record)
+            grouped_paths[album].append(str(record.candidate.path).encode())
 
         if progress_callback:
             await progress_callback(55, f"Importing {len(new_records)} files to Apple Photos...")
 
         total_imported = 0
         total_albums = len(grouped)
-        for album_idx, (album, records) in enumerate(grouped.items()):
-            # Progress from 55% to 95% during import phase
-            base_progress = 55 + int((album_idx / total_albums) * 40)
-            if progress_callback:
-                await progress_callback(
-                    base_progress,
-                    f"Importing {len(records)} files to album '{album}'..."
-                )
-            await self.apple.ensure_album(album)
-            manifest_path = await self._write_manifest(records)
-            try:
-                # Import files and get back their Apple local identifiers
-                local_identifiers = await self.apple.import_files(manifest_path, album)
-            finally:
-                manifest_path.unlink(missing_ok=True)
+        albums_done = 0
+        slots = asyncio.Semaphore(ALBUM_IMPORT_CONCURRENCY)
+
+        async def import_album(album: str, records: list[PhotoImportRecord]) -> None:
+            nonlocal total_imported, albums_done
+            async with slots:
+                if progress_callback:
+                    # Progress from 55% to 95% during import phase
+                    base_progress = 55 + int((albums_done / total_albums) * 40)
+                    await progress_callback(
+                        base_progress,
+                        f"Importing {len(records)} files to album '{album}'..."
+                    )
+                await self.apple.ensure_album(album)
+                manifest_path = await self._write_manifest(grouped_paths[album])
+                try:
+                    # Import files and get back their Apple local identifiers
+                    local_identifiers = await self.apple.import_files(manifest_path, album)
+                finally:
+                    manifest_path.unlink(missing_ok=True)
+            # Naive UTC, matching sidecars written before utcnow() was retired
+            imported_at = datetime.now(UTC).replace(tzinfo=None).isoformat()
 
             # Match identifiers to records (they should be in the same order)
+            imported: list[tuple[str, str | None]] = []
+            sidecars: list[tuple[Path, bytes]] = []
             for idx, record in enumerate(records):
                 local_id = local_identifiers[idx] if idx < len(local_identifiers) else None
-                await self.db.mark_imported(
-                    content_hash=record.content_hash,
-                    album=album,
-                    apple_local_identifier=local_id,
-                )
-                self._write_sidecar(record, album, local_id)
+                imported.append((record.content_hash, local_id))
+                sidecar = self._build_sidecar(record, album, imported_at, local_id)
+                if sidecar:
+                    sidecars.append(sidecar)
+            await asyncio.gather(
+                *(asyncio.to_thread(path.write_bytes, blob) for path, blob in sidecars)
+            )
+            await self.db.mark_imported_bulk(imported, album)
             total_imported += len(records)
+            albums_done += 1
+
+        # Let every album finish (and record what it imported) before surfacing a failure
+        results = await asyncio.gather(
+            *(import_album(album, records) for album, records in grouped.items()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
         if progress_callback:
             await progress_callback(100, f"Import complete - {total_imported} files imported")
@@ -239,15 +288,48 @@ class PhotoSyncEngine:
             "sources": scanned_sources,
         }
 
+    async def _hash_unseen(
+        self,
+        candidates: list[PhotoCandidate],
+        progress_callback: ProgressCallback | None,
+        progress_span: int,
+    ) -> list[tuple[PhotoCandidate, str]]:
+        """Hash candidates concurrently and keep those not yet in the database.
+
+        Returns (candidate, hash) pairs in the original candidate order.
+        """
+        slots = asyncio.Semaphore(HASH_CONCURRENCY)
+        total = len(candidates)
+        done = 0
+
+        async def process(candidate: PhotoCandidate) -> tuple[PhotoCandidate, str]:
+            nonlocal done
+            async with slots:
+                file_hash = await self._hash_file(candidate.path)
+            done += 1
+            if progress_callback and (done % 10 == 0 or done == total):
+                progress = 10 + int((done / total) * progress_span)
+                await progress_callback(progress, f"Hashing file {done} of {total}...")
+            return candidate, file_hash
+
+        hashed = await asyncio.gather(*(process(candidate) for candidate in candidates))
+        known = await self.db.known_hashes(file_hash for _, file_hash in hashed)
+        return [(candidate, file_hash) for candidate, file_hash in hashed if file_hash not in known]
+
     async def _hash_file(self, path: Path) -> str:
         algorithm = self.config.hash_algorithm
 
         def _reader() -> str:
-            h = hashlib.new(algorithm)
-            with path.open("rb") as handle:
-                while chunk := handle.read(1024 * 1024):
-                    h.update(chunk)
-            return h.hexdigest()
+            if algorithm == "blake3":
+                import blake3
+
+                # Memory-maps the file and hashes it across threads with SIMD
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                return hasher.update_mmap(path).hexdigest()
+
+            # file_digest reads the unbuffered file straight into the hash in C
+            with path.open("rb", buffering=0) as handle:
+                return hashlib.file_digest(handle, algorithm).hexdigest()
 
         return await asyncio.to_thread(_reader)
 
@@ -277,15 +359,31 @@ class PhotoSyncEngine:
         self._name_exists_cache[filename] = exists_by_name
         return exists_by_name
 
-    async def _write_manifest(self, records: list[PhotoImportRecord]) -> Path:
+    async def _write_manifest(self, paths: list[bytes]) -> Path:
+        """Write encoded file paths, newline-separated, to a temporary manifest."""
         manifest = self.temp_dir / f"import_{uuid4().hex}.txt"
-        contents = "\n".join(str(record.candidate.path) for record in records)
-        await asyncio.to_thread(manifest.write_text, contents)
+
+        def _write() -> None:
+            with manifest.open("wb") as handle:
+                # No trailing newline
+                for idx, path in enumerate(paths):
+                    if idx:
+                        handle.write(b"\n")
+                    handle.write(path)
+
+        await asyncio.to_thread(_write)
         return manifest
 
-    def _write_sidecar(self, record: PhotoImportRecord, album: str, local_identifier: str | None = None) -> None:
+    def _build_sidecar(
+        self,
+        record: PhotoImportRecord,
+        album: str,
+        imported_at: str,
+        local_identifier: str | None = None,
+    ) -> tuple[Path, bytes] | None:
+        """Return the sidecar path and JSON body for an imported record, if enabled."""
         if not self._source_config(record.candidate.source_name).metadata_sidecars:
-            return
+            return None
 
         payload = {
             "hash": record.content_hash,
@@ -294,11 +392,11 @@ class PhotoSyncEngine:
             "media_type": record.candidate.media_type,
             "album": album,
             "captured_at": record.captured_at.isoformat() if record.captured_at else None,
-            "imported_at": datetime.utcnow().isoformat(),
+            "imported_at": imported_at,
             "apple_local_identifier": local_identifier,
         }
         sidecar = self.meta_dir / f"{record.content_hash}.json"
-        sidecar.write_text(json.dumps(payload, indent=2))
+        return sidecar, orjson.dumps(payload, option=orjson.OPT_INDENT_2)
 
     def _source_config(self, name: str) -> PhotoSourceConfig:
         cfg = self.config.sources.get(name)
@@ -1,16 +1,19 @@
 """Shared helpers for capturing rich Apple Notes data via the ripper pipeline."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import shutil
 import os
 import subprocess
 import tempfile
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+import ijson
+
 from icloudbridge.scripts.rich_notes import run_rich_ripper
 
 logger = logging.getLogger(__name__)
@@ -26,25 +29,40 @@ class RichNotesCapture:
         self._workspaces: list[Path] = []
         self._container_dir: Path | None = None
 
-    def capture_indexes(self) -> dict[str, dict[str, Any]]:
-        """Return lookup indexes for all rich notes currently on disk."""
-        tmp_dir = Path(tempfile.mkdtemp(prefix="icloudbridge_notes_rip_"))
-        self._active_dir = tmp_dir
-        self._workspaces.append(tmp_dir)
-
-        ripper_output = tmp_dir / "ripper_output"
-        ripper_output.mkdir(parents=True, exist_ok=True)
-        self._output_dir = ripper_output
-
-        container_dir = tmp_dir / "notes_container"
-        self._container_dir = container_dir
-        note_store = self._copy_notes_container(container_dir)
-        self._run_ripper(note_store, ripper_output)
-
-        json_file = self._find_json(ripper_output)
-        data = json.loads(json_file.read_text(encoding="utf-8"))
+    def capture_indexes(self, wanted: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Return lookup indexes for the rich notes currently on disk.
+
+        Args:
+            wanted: Optional CoreData UUIDs/identifiers to keep; other notes are
+                dropped while the ripper output is parsed. Defaults to all notes.
+        """
+        note_store = self._copy_notes_container(self._new_workspace())
+        return self.index_note_store(note_store, wanted)
+
+    async def copy_note_store(self) -> Path:
+        """Copy the Notes container into a fresh workspace without blocking the event loop.
+
+        Returns:
+            Path to the copied NoteStore.sqlite, ready for ``index_note_store``
+        """
+        destination = self._new_workspace()
+        cmd, env = self._copy_command(destination)
+        process = await asyncio.create_subprocess_exec(*cmd, env=env)
+        try:
+            returncode = await process.wait()
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+        if returncode:
+            logger.error("copy_note_db failed with exit code %s", returncode)
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return self._copied_note_store(destination)
 
-        return build_note_indexes(data.get("notes", {}))
+    def index_note_store(self, note_store: Path, wanted: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Run the ripper over a copied NoteStore and index the rich notes it finds."""
+        self._run_ripper(note_store, self._output_dir)
+        json_file = self._find_json(self._output_dir)
+        return load_note_indexes(json_file, wanted)
 
     def capture_entry_map(self) -> dict[str, dict[str, Any]]:
         """Convenience accessor returning a UUID -> entry mapping."""
@@ -85,7 +103,21 @@ class RichNotesCapture:
         self._output_dir = None
         self._container_dir = None
 
-    def _copy_notes_container(self, destination: Path) -> Path:
+    def _new_workspace(self) -> Path:
+        """Create a temp workspace for one capture and return its container directory."""
+        tmp_dir = Path(tempfile.mkdtemp(prefix="icloudbridge_notes_rip_"))
+        self._active_dir = tmp_dir
+        self._workspaces.append(tmp_dir)
+
+        ripper_output = tmp_dir / "ripper_output"
+        ripper_output.mkdir(parents=True, exist_ok=True)
+        self._output_dir = ripper_output
+
+        container_dir = tmp_dir / "notes_container"
+        self._container_dir = container_dir
+        return container_dir
+
+    def _copy_command(self, destination: Path) -> tuple[list[str], dict[str, str]]:
         script = self.repo_root / "tools" / "note_db_copy" / "copy_note_db.py"
         python = self._preferred_python()
         cmd = [
@@ -111,11 +143,19 @@ class RichNotesCapture:
             env.get("PYTHONPATH", ""),
             env.get("VIRTUAL_ENV", ""),
         )
+        return cmd, env
+
+    def _copy_notes_container(self, destination: Path) -> Path:
+        cmd, env = self._copy_command(destination)
         try:
             subprocess.run(cmd, check=True, env=env)
         except Exception as exc:  # pragma: no cover - runtime logging
             logger.exception("copy_note_db failed: %s", exc)
             raise
+        return self._copied_note_store(destination)
+
+    @staticmethod
+    def _copied_note_store(destination: Path) -> Path:
         note_store = destination / "NoteStore.sqlite"
         if not note_store.exists():
             raise FileNotFoundError(f"NoteStore.sqlite not found in copied container {destination}")
@@ -152,10 +192,13 @@ class RichNotesCapture:
 
     @staticmethod
     def _find_json(output_dir: Path) -> Path:
-        candidates = list(output_dir.rglob("json/all_notes_*.json"))
-        if not candidates:
+        # The ripper writes <output>/<run folder>/json/; only fall back to a full walk if that moves
+        json_file = next(output_dir.glob("*/json/all_notes_*.json"), None) or next(
+            output_dir.rglob("json/all_notes_*.json"), None
+        )
+        if json_file is None:
             raise FileNotFoundError(f"Could not find all_notes_*.json under ripper output {output_dir}")
-        return candidates[0]
+        return json_file
 
 
 def build_note_indexes(notes_section: Any) -> dict[str, dict[str, Any]]:
@@ -187,25 +230,54 @@ def build_note_indexes(notes_section: Any) -> dict[str, dict[str, Any]]:
     }
 
 
-def lookup_note_entry(local_uuid: str, indexes: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
-    """Resolve a CoreData UUID/primary key/ICNote id into a ripper entry."""
-    entry = indexes.get("by_uuid", {}).get(local_uuid)
-    if entry:
-        return entry
+def load_note_indexes(json_file: Path, wanted: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+    """Stream the ripper's ``notes`` section from disk into lookup tables.
+
+    Entries are parsed one at a time, so the JSON text is never held in memory
+    and notes outside ``wanted`` are discarded as soon as they are read.
+    """
+    if wanted is None:
+        keep = None
+    else:
+        wanted_uuids: set[str] = set()
+        wanted_pks: set[int] = set()
+        wanted_note_ids: set[int] = set()
+        for local_uuid in wanted:
+            wanted_uuids.add(local_uuid)
+            pk, note_id = _parse_coredata_id(local_uuid)
+            if pk is not None:
+                wanted_pks.add(pk)
+            if note_id is not None:
+                wanted_note_ids.add(note_id)
+
+        def keep(key: str, entry: dict[str, Any]) -> bool:
+            if str(entry.get("uuid") or key) in wanted_uuids:
+                return True
+            pk = entry.get("primary_key")
+            if isinstance(pk, int) and pk in wanted_pks:
+                return True
+            note_id = entry.get("note_id")
+            return isinstance(note_id, int) and note_id in wanted_note_ids
+
+    notes_section: dict[str, Any] = {}
+    with json_file.open("rb") as handle:
+        for key, entry in ijson.kvitems(handle, "notes", use_float=True):
+            if not isinstance(entry, dict):
+                continue
+            if keep is None or keep(key, entry):
+                notes_section[key] = entry
 
-    pk = _extract_primary_key(local_uuid)
-    if pk is not None:
-        entry = indexes.get("by_primary", {}).get(pk)
-        if entry:
-            return entry
+    return build_note_indexes(notes_section)
 
-    note_id = _extract_note_id(local_uuid)
-    if note_id is not None:
-        entry = indexes.get("by_note_id", {}).get(note_id)
-        if entry:
-            return entry
 
-    return None
+def lookup_note_entry(local_uuid: str, indexes: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
+    """Resolve a CoreData UUID/primary key/ICNote id into a ripper entry."""
+    pk, note_id = _parse_coredata_id(local_uuid)
+    return (
+        indexes.get("by_uuid", {}).get(local_uuid)
+        or indexes.get("by_primary", {}).get(pk)
+        or indexes.get("by_note_id", {}).get(note_id)
+    )
 
 
 def extract_note_content(note_entry: dict[str, Any]) -> str:
@@ -221,21 +293,17 @@ def extract_note_content(note_entry: dict[str, Any]) -> str:
     return body
 
 
-def _extract_primary_key(coredata_id: str) -> int | None:
-    if "/p" not in coredata_id:
-        return None
-    suffix = coredata_id.rsplit("/p", 1)[-1]
-    try:
-        return int(suffix)
-    except ValueError:
-        return None
-
+def _parse_coredata_id(coredata_id: str) -> tuple[int | None, int | None]:
+    """Split a CoreData id into its (primary key, ICNote id) from the last path segment.
 
-def _extract_note_id(coredata_id: str) -> int | None:
-    suffix = coredata_id.rsplit("/", 1)[-1]
-    if suffix.startswith("p"):
+    ``.../p42`` yields ``(42, 42)``, a bare numeric segment yields ``(None, 42)``.
+    """
+    suffix = coredata_id[coredata_id.rfind("/") + 1:]
+    is_primary = suffix.startswith("p")
+    if is_primary:
         suffix = suffix[1:]
     try:
-        return int(suffix)
+        value = int(suffix)
     except ValueError:
-        return None
+        return None, None
+    return (value if is_primary and "/" in coredata_id else None), value
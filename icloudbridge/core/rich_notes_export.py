@@ -5,21 +5,42 @@ import asyncio
 import json
 import logging
 import os
+import re
 import shutil
-import sys
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
 from pathlib import Path
 from typing import Any
 
+import aiofiles
+
 from icloudbridge.core.rich_notes_capture import (
     RichNotesCapture,
     extract_note_content,
     lookup_note_entry,
 )
 from icloudbridge.utils.converters import html_to_markdown, normalize_checklists_html
-from icloudbridge.utils.db import NotesDB
+from icloudbridge.utils.db import AsyncSQLitePool, NotesDB
 
 logger = logging.getLogger(__name__)
 
+# Below this many notes, converting inline beats starting worker processes
+PARALLEL_MIN_NOTES = 32
+# Notes sent to a worker process per task
+CONVERT_BATCH_SIZE = 16
+# Markdown files written concurrently
+WRITE_CONCURRENCY = 32
+# Written to RichNotes/README.md on every export
+_README_BYTES = (
+    "# Rich Notes Export\n\n"
+    "This directory contains a read-only snapshot of your Apple Notes, exported using "
+    "iCloudBridge's rich-notes mode. Every time you run `icloudbridge notes sync --rich-notes`, "
+    "this folder is regenerated from scratch.\n\n"
+    "- ✔️ Feel free to read or copy these Markdown files.\n"
+    "- ⚠️ Changes made here will **NOT** sync back to Apple Notes.\n"
+    "- ♻️ Any edits inside `RichNotes/` will be overwritten on the next export.\n"
+).encode()
+
 
 class RichNotesExporter:
     """Exports rich Apple Notes markup into a read-only RichNotes folder."""
@@ -31,100 +52,33 @@ class RichNotesExporter:
         self._capture = RichNotesCapture(repo_root=self.repo_root)
 
     async def _load_mappings(self) -> list[dict[str, Any]]:
-        db = NotesDB(self.notes_db_path)
-        await db.initialize()
-        return await db.get_all_mappings()
-
-    def _gather_mappings(self) -> list[dict[str, Any]]:
-        return asyncio.run(self._load_mappings())
-
-    def _copy_note_store(self, destination: Path) -> None:
-        script = self.repo_root / "tools" / "note_db_copy" / "copy_note_db.py"
-        python = self._preferred_python()
-        cmd = [
-            python,
-            str(script),
-            "--dest",
-            str(destination),
-        ]
-        env = os.environ.copy()
-        env["PYTHONHOME"] = ""
-        env["PYTHONPATH"] = ""
-        env["VIRTUAL_ENV"] = ""
-        env["ICLOUDBRIDGE_VENV_PYTHON"] = python
-        logger.error(
-            "copy_note_db (export): python=%s cmd=%s env_pythonhome=%s env_pythonpath=%s env_virtual_env=%s",
-            str(python),
-            " ".join(cmd),
-            env.get("PYTHONHOME", ""),
-            env.get("PYTHONPATH", ""),
-            env.get("VIRTUAL_ENV", ""),
-        )
+        # Own pool: export runs on its own event loop, often in a worker thread
+        pool = AsyncSQLitePool(self.notes_db_path)
         try:
-            subprocess.run(cmd, check=True, env=env)
-        except Exception as exc:  # pragma: no cover - runtime logging
-            logger.exception("copy_note_db export failed: %s", exc)
-            raise
+            db = NotesDB(self.notes_db_path, pool=pool)
+            await db.initialize()
+            return await db.get_all_mappings()
+        finally:
+            await pool.close()
 
     @staticmethod
-    def _preferred_python() -> str:
-        env_python = os.environ.get("ICLOUDBRIDGE_VENV_PYTHON")
-        if env_python and Path(env_python).is_file():
-            return env_python
-
-        app_support = Path.home() / "Library" / "Application Support" / "iCloudBridge" / "venv" / "bin" / "python3"
-        if app_support.is_file():
-            return str(app_support)
-
-        logger.error(
-            "No managed python found. Checked ICLOUDBRIDGE_VENV_PYTHON=%s and %s; falling back to %s",
-            env_python,
-            app_support,
-            sys.executable,
-        )
-        return sys.executable
-
-    def _run_ripper(self, db_path: Path, output_dir: Path) -> None:
-        args = ["--file", str(db_path), "--output-dir", str(output_dir)]
-        logger.info("Running rich notes ripper (output=%s)", output_dir)
-        run_rich_ripper(args, log_stream=logger, log_category="notes_ripper", log_level="DEBUG")
-
-    def _find_json(self, output_dir: Path) -> Path:
-        candidates = list(output_dir.rglob("json/all_notes_*.json"))
-        if not candidates:
-            raise FileNotFoundError(
-                f"Could not find all_notes_*.json under ripper output {output_dir}"
-            )
-        return candidates[0]
-
-    def _extract_note_content(self, note_entry: dict[str, Any]) -> str:
-        html = note_entry.get("html") or ""
-        marker = '<div class="note-content">'
-        if marker in html:
-            body = html.split(marker, 1)[1]
-            # Remove closing </div> that wraps the content block
-            if body.endswith("</div>"):
-                body = body.rsplit("</div>", 1)[0]
-        else:
-            body = html
-        return body
-
-    def _convert_to_markdown(self, html: str, note_entry: dict[str, Any], original_path: Path) -> str:
+    def _convert_to_markdown(html: str, note_entry: dict[str, Any], original_path: Path) -> str:
         html = normalize_checklists_html(html)
         markdown = html_to_markdown(html)
-        checkbox_items = self._extract_checklist_items(note_entry)
+        checkbox_items = RichNotesExporter._extract_checklist_items(note_entry)
 
-        if not checkbox_items or self._looks_truncated(checkbox_items):
-            fallback = self._extract_checklists_from_markdown(original_path)
+        if not checkbox_items or RichNotesExporter._looks_truncated(checkbox_items):
+            fallback = RichNotesExporter._extract_checklists_from_markdown(original_path)
             if fallback:
                 checkbox_items = fallback
 
         if checkbox_items:
-            return self._merge_checklists(markdown, checkbox_items)
+            return RichNotesExporter._merge_checklists(markdown, checkbox_items)
 
         return markdown
 
-    def _merge_checklists(self, markdown: str, checkbox_items: list[tuple[str, str]]) -> str:
+    @staticmethod
+    def _merge_checklists(markdown: str, checkbox_items: list[tuple[str, str]]) -> str:
         if not checkbox_items:
             return markdown
 
@@ -142,7 +96,8 @@ class RichNotesExporter:
 
         return "\n".join(new_lines)
 
-    def _extract_checklist_items(self, note_entry: dict[str, Any]) -> list[tuple[str, str]]:
+    @staticmethod
+    def _extract_checklist_items(note_entry: dict[str, Any]) -> list[tuple[str, str]]:
         html = note_entry.get("html") or ""
         if "class=\"checklist\"" not in html:
             return []
@@ -174,7 +129,8 @@ class RichNotesExporter:
         longest = max(len(label.strip()) for _, label in checkbox_items)
         return longest <= 2
 
-    def _extract_checklists_from_markdown(self, original_path: Path) -> list[tuple[str, str]]:
+    @staticmethod
+    def _extract_checklists_from_markdown(original_path: Path) -> list[tuple[str, str]]:
         if not original_path.exists():
             return []
 
@@ -206,15 +162,30 @@ class RichNotesExporter:
         return items
 
     def export(self, *, dry_run: bool = False) -> None:
+        """Run ``export_async`` to completion for synchronous callers (CLI, worker threads)."""
+        asyncio.run(self.export_async(dry_run=dry_run))
+
+    async def export_async(self, *, dry_run: bool = False) -> None:
         if not self.remote_folder:
             raise ValueError("Remote notes folder is not configured")
 
-        mappings = self._gather_mappings()
-        if not mappings:
-            logger.warning("No note mappings exist; skipping rich notes export")
-            return
-
-        indexes = self._capture.capture_indexes()
+        # Copy the Notes container while the mappings load
+        copy_task = asyncio.create_task(self._capture.copy_note_store())
+        try:
+            mappings = await self._load_mappings()
+            if not mappings:
+                logger.warning("No note mappings exist; skipping rich notes export")
+                return
+            note_store = await copy_task
+        finally:
+            if not copy_task.done():
+                copy_task.cancel()
+
+        indexes = await asyncio.to_thread(
+            self._capture.index_note_store,
+            note_store,
+            [mapping["local_uuid"] for mapping in mappings],
+        )
 
         rich_root = self.remote_folder / "RichNotes"
         selected_notes: list[tuple[Path, dict[str, Any]]] = []
@@ -241,17 +212,56 @@ class RichNotesExporter:
             logger.info("Dry run: skipping filesystem changes for RichNotes export")
             return
 
+        await self._write_export(rich_root, selected_notes)
+
+    async def _write_export(self, rich_root: Path, selected_notes: list[tuple[Path, dict[str, Any]]]) -> None:
+        targets, jobs = await asyncio.to_thread(self._prepare_export, rich_root, selected_notes)
+        slots = asyncio.Semaphore(WRITE_CONCURRENCY)
+
+        async def write_batch(batch_targets: list[Path], markdowns: list[str]) -> None:
+            async def write(target: Path, markdown: str) -> None:
+                async with slots:
+                    async with aiofiles.open(target, "w", encoding="utf-8") as handle:
+                        await handle.write(markdown)
+
+            await asyncio.gather(
+                *(write(t, m) for t, m in zip(batch_targets, markdowns, strict=True))
+            )
+
+        if len(jobs) < PARALLEL_MIN_NOTES:
+            markdowns = await asyncio.to_thread(_convert_notes, jobs)
+            await write_batch(targets, markdowns)
+        else:
+            # Conversion is CPU-bound and independent per note; each batch is written as soon as it is converted
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+
+                async def convert_batch(start: int) -> None:
+                    end = start + CONVERT_BATCH_SIZE
+                    markdowns = await loop.run_in_executor(executor, _convert_notes, jobs[start:end])
+                    await write_batch(targets[start:end], markdowns)
+
+                await asyncio.gather(
+                    *(convert_batch(start) for start in range(0, len(jobs), CONVERT_BATCH_SIZE))
+                )
+
+        logger.info("RichNotes export complete: %s", rich_root)
+
+    def _prepare_export(
+        self, rich_root: Path, selected_notes: list[tuple[Path, dict[str, Any]]]
+    ) -> tuple[list[Path], list[tuple[str, Path]]]:
+        """Reset the RichNotes folder and return (target, conversion job) lists in matching order."""
         if rich_root.exists():
             shutil.rmtree(rich_root)
         rich_root.mkdir(parents=True, exist_ok=True)
 
         self._write_readme(rich_root)
 
+        targets: list[Path] = []
+        jobs: list[tuple[str, Path]] = []
         for relative_path, note_entry in selected_notes:
-            folder = rich_root / relative_path.parent
-            folder.mkdir(parents=True, exist_ok=True)
-            target = folder / f"{relative_path.stem}_rich.md"
-            html = extract_note_content(note_entry)
+            targets.append(rich_root / relative_path.parent / f"{relative_path.stem}_rich.md")
+            jobs.append((note_entry.get("html") or "", self.remote_folder / relative_path))
             logger.info("Exporting rich note: %s", relative_path)
             logger.debug("Relative path stem: %s", relative_path.stem)
             if relative_path.stem.lower() == "scratch":
@@ -262,20 +272,26 @@ class RichNotesExporter:
                 debug_path.write_text(json.dumps(note_entry, indent=2), encoding="utf-8")
                 logger.info("Scratch entry snapshot: %s", note_entry)
                 logger.info("Scratch plaintext: %s", note_entry.get("plaintext"))
-            original_path = self.remote_folder / relative_path
-            markdown = self._convert_to_markdown(html, note_entry, original_path)
-            target.write_text(markdown, encoding="utf-8")
 
-        logger.info("RichNotes export complete: %s", rich_root)
+        # Create each output folder once rather than once per note
+        for folder in {target.parent for target in targets}:
+            folder.mkdir(parents=True, exist_ok=True)
+
+        return targets, jobs
 
     def _write_readme(self, rich_root: Path) -> None:
-        content = """# Rich Notes Export\n\n"""
-        content += (
-            "This directory contains a read-only snapshot of your Apple Notes, exported using "
-            "iCloudBridge's rich-notes mode. Every time you run `icloudbridge notes sync --rich-notes`, "
-            "this folder is regenerated from scratch.\n\n"
-            "- ✔️ Feel free to read or copy these Markdown files.\n"
-            "- ⚠️ Changes made here will **NOT** sync back to Apple Notes.\n"
-            "- ♻️ Any edits inside `RichNotes/` will be overwritten on the next export.\n"
-        )
-        (rich_root / "README.md").write_text(content, encoding="utf-8")
+        (rich_root / "README.md").write_bytes(_README_BYTES)
+
+
+def _convert_note(job: tuple[str, Path]) -> str:
+    """Convert one ripper note's HTML to Markdown."""
+    raw_html, original_path = job
+    note_entry = {"html": raw_html}
+    return RichNotesExporter._convert_to_markdown(
+        extract_note_content(note_entry), note_entry, original_path
+    )
+
+
+def _convert_notes(jobs: list[tuple[str, Path]]) -> list[str]:
+    """Convert a batch of notes (picklable for the worker pool)."""
+    return [_convert_note(job) for job in jobs]
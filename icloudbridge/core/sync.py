@@ -311,6 +311,7 @@ class NotesSyncEngine:
             paired_keys = set(apple_candidates).intersection(markdown_candidates)
             mtime_skew_seconds = 2  # small tolerance for FS/Notes clock skew
 
+            bootstrap_rows = []
             for key in paired_keys:
                 apple_note = apple_candidates[key]
                 md_note = markdown_candidates[key]
@@ -321,13 +322,15 @@ class NotesSyncEngine:
                 else:
                     last_sync_dt = max(apple_mtime, md_mtime)
 
-                await self.db.upsert_mapping(
-                    local_uuid=apple_note.uuid,
-                    local_name=apple_note.name,
-                    local_folder_uuid="",
-                    remote_path=md_note.file_path,
-                    timestamp=last_sync_dt.timestamp(),
-                    attachment_slug=md_note.metadata.get("attachment_slug"),
+                bootstrap_rows.append(
+                    (
+                        apple_note.uuid,
+                        apple_note.name,
+                        "",
+                        md_note.file_path,
+                        last_sync_dt.timestamp(),
+                        md_note.metadata.get("attachment_slug"),
+                    )
                 )
 
                 mapping_row = {
@@ -350,6 +353,7 @@ class NotesSyncEngine:
                     apple_note.name,
                     folder_name,
                 )
+            await self.db.upsert_mappings(bootstrap_rows)
 
             # Step 4: Check deletion threshold (if not disabled and not skipping deletions)
             if deletion_threshold > 0 and not skip_deletions and not dry_run:
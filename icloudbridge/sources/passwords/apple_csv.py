@@ -3,6 +3,7 @@
 import csv
 import logging
 import re
+import sys
 from pathlib import Path
 
 from .models import PasswordEntry
@@ -39,27 +40,44 @@ class ApplePasswordsCSVParser:
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        entries = []
+        # Insertion-ordered, so the values double as the result list
         account_index: dict[tuple[str, str, str], PasswordEntry] = {}
         duplicates = 0
         errors = 0
 
         with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
 
             # Validate headers
             expected_headers = {"Title", "URL", "Username", "Password", "Notes", "OTPAuth"}
-            if not expected_headers.issubset(set(reader.fieldnames or [])):
+            header = next(reader, [])
+            if not expected_headers.issubset(header):
                 raise ValueError(
                     f"Invalid Apple Passwords CSV format. Expected headers: {expected_headers}"
                 )
 
+            # Index columns once and read rows positionally instead of building a dict per row
+            columns = {name: idx for idx, name in enumerate(header)}
+            title_col = columns["Title"]
+            url_col = columns["URL"]
+            username_col = columns["Username"]
+            password_col = columns["Password"]
+            notes_col = columns["Notes"]
+            otp_col = columns["OTPAuth"]
+            width = max(columns[name] for name in expected_headers) + 1
+            search_folder_tag = _ICB_FOLDER_TAG.search
+
             for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
+                if not row:
+                    continue
                 try:
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+
                     # Required fields
-                    title = row.get("Title", "").strip()
-                    username = row.get("Username", "").strip()
-                    password = row.get("Password", "").strip()
+                    title = row[title_col].strip()
+                    username = row[username_col].strip()
+                    password = row[password_col].strip()
 
                     if not title or not username or not password:
                         logger.warning(
@@ -69,20 +87,22 @@ class ApplePasswordsCSVParser:
                         continue
 
                     # Optional fields
-                    url = row.get("URL", "").strip() or None
-                    notes_raw = row.get("Notes", "").strip()
+                    url = row[url_col].strip() or None
+                    notes_raw = row[notes_col].strip()
                     notes = notes_raw or None
-                    otp_auth = row.get("OTPAuth", "").strip() or None
+                    otp_auth = row[otp_col].strip() or None
 
                     folder = None
-                    if notes_raw:
-                        tag_match = _ICB_FOLDER_TAG.search(notes_raw)
+                    # Substring check first; most notes carry no folder tag
+                    if "#icb_" in notes_raw:
+                        tag_match = search_folder_tag(notes_raw)
                         if tag_match:
                             folder = tag_match.group(1)
 
-                    account_key = (title.lower(), username.lower(), password)
+                    # Interned so index keys share one object per repeated title/username
+                    account_key = (sys.intern(title.lower()), sys.intern(username.lower()), password)
                     entry = account_index.get(account_key)
-                    if entry:
+                    if entry is not None:
                         duplicates += 1
                         if notes and not entry.notes:
                             entry.notes = notes
@@ -105,13 +125,12 @@ class ApplePasswordsCSVParser:
                         if url:
                             entry.add_url(url)
                         account_index[account_key] = entry
-                        entries.append(entry)
-
 
                 except Exception as e:
                     logger.error(f"Row {row_num}: Error parsing entry: {e}")
                     errors += 1
 
+        entries = list(account_index.values())
         logger.info(
             f"Parsed Apple Passwords CSV: {len(entries)} entries "
             f"({duplicates} duplicates skipped, {errors} errors)"
@@ -133,27 +152,32 @@ class ApplePasswordsCSVParser:
         """
         import os
 
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["Title", "URL", "Username", "Password", "Notes", "OTPAuth"]
+        # Create the file owner-only from the start so passwords are never world-readable
+        with open(
+            output_path,
+            "w",
+            encoding="utf-8",
+            newline="",
+            opener=lambda path, flags: os.open(path, flags, 0o600),
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(["Title", "URL", "Username", "Password", "Notes", "OTPAuth"])
+
+            # Rows are plain tuples in header order, mirroring the positional reader
+            writer.writerows(
+                (
+                    entry.title,
+                    url or "",
+                    entry.username,
+                    entry.password,
+                    entry.notes or "",
+                    entry.otp_auth or "",
+                )
+                for entry in entries
+                for url in (entry.get_all_urls() or [None])
             )
-            writer.writeheader()
-
-            for entry in entries:
-                urls = entry.get_all_urls() or [None]
-                for url in urls:
-                    writer.writerow(
-                        {
-                            "Title": entry.title,
-                            "URL": url or "",
-                            "Username": entry.username,
-                            "Password": entry.password,
-                            "Notes": entry.notes or "",
-                            "OTPAuth": entry.otp_auth or "",
-                        }
-                    )
-
-        # Set secure permissions (owner read/write only)
+
+        # Also tighten a pre-existing file, whose mode open() leaves untouched
         os.chmod(output_path, 0o600)
 
         logger.info(f"Wrote {len(entries)} entries to Apple Passwords CSV: {output_path}")
@@ -5,14 +5,14 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import math
 from dataclasses import dataclass
 from enum import IntEnum
 from secrets import token_bytes
 from typing import Iterable
 
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.padding import PKCS7
+from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
 
 
 class EncryptionType(IntEnum):
@@ -30,13 +30,13 @@ class CipherComponents:
     mac: bytes | None = None
 
     def encode(self) -> str:
-        pieces: list[str] = []
+        pieces: list[bytes] = []
         if self.iv is not None:
-            pieces.append(_b64e(self.iv))
-        pieces.append(_b64e(self.data))
+            pieces.append(base64.b64encode(self.iv))
+        pieces.append(base64.b64encode(self.data))
         if self.mac is not None:
-            pieces.append(_b64e(self.mac))
-        payload = "|".join(pieces)
+            pieces.append(base64.b64encode(self.mac))
+        payload = b"|".join(pieces).decode("ascii")
         return f"{int(self.enc_type)}.{payload}"
 
     @staticmethod
@@ -52,39 +52,23 @@ class CipherComponents:
         if enc_type == EncryptionType.AES_CBC_256_B64:
             if len(parts) != 2:
                 raise ValueError("Invalid AES payload")
-            iv = _b64d(parts[0])
-            data = _b64d(parts[1])
+            iv = base64.b64decode(parts[0])
+            data = base64.b64decode(parts[1])
             return CipherComponents(enc_type, iv=iv, data=data)
         if enc_type == EncryptionType.AES_CBC_256_HMAC_SHA256_B64:
             if len(parts) != 3:
                 raise ValueError("Invalid AES-HMAC payload")
-            iv = _b64d(parts[0])
-            data = _b64d(parts[1])
-            mac = _b64d(parts[2])
+            iv = base64.b64decode(parts[0])
+            data = base64.b64decode(parts[1])
+            mac = base64.b64decode(parts[2])
             return CipherComponents(enc_type, iv=iv, data=data, mac=mac)
         raise ValueError(f"Unsupported encryption type: {enc_type}")
 
 
-def _b64e(data: bytes) -> str:
-    return base64.b64encode(data).decode("utf-8")
-
-
-def _b64d(value: str) -> bytes:
-    return base64.b64decode(value.encode("utf-8"))
-
-
 def _hkdf_expand(prk: bytes, info: bytes, length: int) -> bytes:
-    hash_len = hashlib.sha256().digest_size
-    if len(prk) < hash_len:
+    if len(prk) < hashlib.sha256().digest_size:
         raise ValueError("PRK is too short for HKDF expand")
-    n = math.ceil(length / hash_len)
-    okm = b""
-    previous = b""
-    for counter in range(1, n + 1):
-        data = previous + info + bytes([counter])
-        previous = hmac.new(prk, data, hashlib.sha256).digest()
-        okm += previous
-    return okm[:length]
+    return HKDFExpand(algorithm=hashes.SHA256(), length=length, info=info).derive(prk)
 
 
 def stretch_key(key: bytes) -> bytes:
@@ -102,20 +86,29 @@ def ensure_stretched(key: bytes) -> bytes:
     return stretch_key(key)
 
 
+def _split_key(key: bytes) -> tuple[bytes, bytes]:
+    """Return the (enc_key, mac_key) pair for a key, stretching 32-byte keys first."""
+    stretched = ensure_stretched(key)
+    return stretched[:32], stretched[32:]
+
+
 def _aes_cbc_encrypt(key: bytes, iv: bytes, plaintext: bytes) -> bytes:
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
     encryptor = cipher.encryptor()
-    padder = PKCS7(128).padder()
-    padded = padder.update(plaintext) + padder.finalize()
-    return encryptor.update(padded) + encryptor.finalize()
+    # PKCS7 padding to the 16-byte AES block
+    pad = 16 - (len(plaintext) & 15)
+    return encryptor.update(plaintext + bytes((pad,)) * pad) + encryptor.finalize()
 
 
 def _aes_cbc_decrypt(key: bytes, iv: bytes, ciphertext: bytes) -> bytes:
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
     decryptor = cipher.decryptor()
     padded = decryptor.update(ciphertext) + decryptor.finalize()
-    unpadder = PKCS7(128).unpadder()
-    return unpadder.update(padded) + unpadder.finalize()
+    pad = padded[-1] if padded else 0
+    # Compare the whole padding run in constant time, as the PKCS7 unpadder does
+    if not 1 <= pad <= 16 or not hmac.compare_digest(padded[-pad:], bytes((pad,)) * pad):
+        raise ValueError("Invalid padding bytes.")
+    return padded[:-pad]
 
 
 def decrypt_cipher_string(cipher_string: str, key: bytes) -> bytes:
@@ -126,9 +119,7 @@ def decrypt_cipher_string(cipher_string: str, key: bytes) -> bytes:
         assert components.iv is not None
         return _aes_cbc_decrypt(key, components.iv, components.data)
     if components.enc_type == EncryptionType.AES_CBC_256_HMAC_SHA256_B64:
-        stretched = ensure_stretched(key)
-        enc_key = stretched[:32]
-        mac_key = stretched[32:]
+        enc_key, mac_key = _split_key(key)
         assert components.mac is not None and components.iv is not None
         mac_check = hmac.new(mac_key, components.iv + components.data, hashlib.sha256).digest()
         if not hmac.compare_digest(mac_check, components.mac):
@@ -143,9 +134,7 @@ def encrypt_string(value: str, key: bytes, *, use_mac: bool = True) -> str:
     plaintext = value.encode("utf-8")
     iv = token_bytes(16)
     if use_mac:
-        stretched = ensure_stretched(key)
-        enc_key = stretched[:32]
-        mac_key = stretched[32:]
+        enc_key, mac_key = _split_key(key)
         ciphertext = _aes_cbc_encrypt(enc_key, iv, plaintext)
         mac = hmac.new(mac_key, iv + ciphertext, hashlib.sha256).digest()
         components = CipherComponents(
@@ -166,11 +155,26 @@ def encrypt_string(value: str, key: bytes, *, use_mac: bool = True) -> str:
     return components.encode()
 
 
+def _encrypt_many(values: Iterable[str], key: bytes) -> list[str]:
+    """MAC-encrypt several strings with one key, as encrypt_string(value, key) would."""
+    enc_key, mac_key = _split_key(key)
+    base_mac = hmac.new(mac_key, digestmod=hashlib.sha256)
+    prefix = int(EncryptionType.AES_CBC_256_HMAC_SHA256_B64)
+    b64encode = base64.b64encode
+    encrypted = []
+    for value in values:
+        iv = token_bytes(16)
+        ciphertext = _aes_cbc_encrypt(enc_key, iv, value.encode("utf-8"))
+        mac = base_mac.copy()
+        mac.update(iv)
+        mac.update(ciphertext)
+        payload = b"|".join((b64encode(iv), b64encode(ciphertext), b64encode(mac.digest())))
+        encrypted.append(f"{prefix}.{payload.decode('ascii')}")
+    return encrypted
+
+
 def encrypt_optional_list(values: Iterable[str] | None, key: bytes) -> list[dict[str, str]] | None:
-    if not values:
+    present = [value for value in values or () if value]
+    if not present:
         return None
-    uris = []
-    for value in values:
-        if value:
-            uris.append({"uri": encrypt_string(value, key), "match": None})
-    return uris or None
+    return [{"uri": uri, "match": None} for uri in _encrypt_many(present, key)]
@@ -1,6 +1,6 @@
 """Common constants shared across the photo sync pipeline."""
 
-IMAGE_EXTENSIONS = {
+IMAGE_EXTENSIONS = frozenset({
     ".jpg",
     ".jpeg",
     ".png",
@@ -13,9 +13,9 @@ IMAGE_EXTENSIONS = {
     ".heic",
     ".cr2",
     ".nef",
-}
+})
 
-VIDEO_EXTENSIONS = {
+VIDEO_EXTENSIONS = frozenset({
     ".mp4",
     ".mkv",
     ".avi",
@@ -25,4 +25,4 @@ VIDEO_EXTENSIONS = {
     ".webm",
     ".m4v",
     ".3gp",
-}
+})
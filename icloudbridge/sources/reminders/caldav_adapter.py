@@ -109,8 +109,7 @@ class CalDAVAdapter:
         if not self.client:
             await self.connect()
 
-        result = []
-        for cal in self.calendars:
+        async def probe(cal) -> dict[str, str] | None:
             # Check if this calendar supports VTODO (tasks/reminders)
             # We only want todo-capable calendars for reminders sync
             try:
@@ -123,18 +122,22 @@ class CalDAVAdapter:
                 if supported_components is None:
                     # Try to fetch todos to see if this is a todo-capable calendar
                     # Some servers don't advertise component types properly
-                    todos = await asyncio.to_thread(lambda: cal.todos(include_completed=True))
+                    await asyncio.to_thread(cal.todos, include_completed=True)
                     # If we can fetch todos without error, assume it's todo-capable
-                    result.append({"name": cal.name, "url": str(cal.url)})
-                elif "VTODO" in supported_components or "vtodo" in str(supported_components).lower():
+                    return {"name": cal.name, "url": str(cal.url)}
+                if "VTODO" in supported_components or "vtodo" in str(supported_components).lower():
                     # Calendar explicitly supports todos
-                    result.append({"name": cal.name, "url": str(cal.url)})
+                    return {"name": cal.name, "url": str(cal.url)}
                 # else: skip this calendar as it doesn't support todos
 
             except Exception as e:
                 # If we can't determine, log and skip
                 logger.debug(f"Skipping calendar '{cal.name}': {e}")
-                continue
+            return None
+
+        # Probe all calendars concurrently; each probe is a blocking HTTP round-trip
+        probed = await asyncio.gather(*(probe(cal) for cal in self.calendars))
+        result = [entry for entry in probed if entry is not None]
 
         logger.info(f"Found {len(result)} todo-capable calendars out of {len(self.calendars)} total")
         return result
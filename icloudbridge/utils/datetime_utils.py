@@ -20,11 +20,10 @@ def safe_fromtimestamp(timestamp: float | None, tz=None) -> datetime | None:
         datetime object if conversion successful, None if timestamp is
         None, out of bounds, or conversion fails
     """
-    if timestamp is None:
+    if timestamp is None or timestamp < MIN_TIMESTAMP or timestamp > MAX_TIMESTAMP:
         return None
     try:
-        if not (MIN_TIMESTAMP <= timestamp <= MAX_TIMESTAMP):
-            return None
-        return datetime.fromtimestamp(timestamp, tz=tz) if tz else datetime.fromtimestamp(timestamp)
+        # tz=None already means local time, so no branch is needed
+        return datetime.fromtimestamp(timestamp, tz)
     except (OSError, OverflowError, ValueError):
         return None
@@ -1,15 +1,273 @@
 """Database utilities for tracking note synchronization state."""
 
+import asyncio
 import json
 import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
 import aiosqlite
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+# Connection tuning shared by every database file. journal_mode=WAL persists in
+# the file; the rest apply to the connection that runs them.
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Rows fetched per worker-thread hop when iterating a cursor (aiosqlite defaults to 64)
+_ITER_CHUNK_SIZE = 500
+
+# Longest the event loop may block on a locked database during an inline read
+_INLINE_BUSY_TIMEOUT = 0.05  # seconds
+
+
+class AsyncSQLitePool:
+    """
+    Pool of long-lived aiosqlite connections for a single database file.
+
+    SQLite allows one writer and many readers under WAL, so the pool keeps a
+    single writer connection behind a lock plus up to ``readers`` reader
+    connections. Connections are opened lazily and reused, which avoids
+    spawning a new aiosqlite worker thread for every query.
+    """
+
+    def __init__(self, db_path: Path, readers: int | None = None):
+        """
+        Initialize the pool.
+
+        Args:
+            db_path: Path to SQLite database file
+            readers: Maximum number of reader connections (default: CPU count)
+        """
+        self.db_path = db_path
+        self._max_readers = readers or os.cpu_count() or 1
+        self._reader_slots = asyncio.Semaphore(self._max_readers)
+        self._idle_readers: list[aiosqlite.Connection] = []
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._inline: sqlite3.Connection | None = None
+        self._inline_lock = threading.Lock()
+
+    async def _connect(self, isolation_level: str = "") -> aiosqlite.Connection:
+        """Open a connection configured for concurrent WAL access.
+
+        Args:
+            isolation_level: sqlite3 isolation level for implicit transactions
+                (default: deferred)
+        """
+        db = aiosqlite.connect(
+            self.db_path, iter_chunk_size=_ITER_CHUNK_SIZE, isolation_level=isolation_level
+        )
+        # Pooled connections outlive a CLI command's event loop; don't let their threads block exit
+        db.daemon = True
+        await db
+        db.row_factory = aiosqlite.Row
+        await db.executescript(_CONNECTION_PRAGMAS)
+        await db.execute("PRAGMA busy_timeout=30000")
+        return db
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection for the duration of the block."""
+        async with self._reader_slots:
+            db = self._idle_readers.pop() if self._idle_readers else await self._connect()
+            try:
+                yield db
+            finally:
+                self._idle_readers.append(db)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection for the duration of the block.
+
+        Uncommitted changes are rolled back if the block raises.
+        """
+        async with self._write_lock:
+            if self._writer is None:
+                # BEGIN IMMEDIATE takes the write lock when a transaction opens, so a
+                # write racing another process waits in busy_timeout instead of failing
+                # with SQLITE_BUSY when a deferred transaction tries to upgrade
+                self._writer = await self._connect(isolation_level="IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                await self._writer.rollback()
+                raise
+
+    async def write(self, sql: str, params: Sequence = ()) -> list[sqlite3.Row]:
+        """Run one write statement and commit it.
+
+        The statement and its result rows share one worker-thread hop
+        (``execute_fetchall``) and the commit takes a second, instead of the
+        separate execute, fetch, close and commit round trips. The writer
+        rolls back if either step fails.
+
+        Args:
+            sql: Statement to run (may use RETURNING)
+            params: Bound parameters
+
+        Returns:
+            Rows produced by the statement, if any
+        """
+        async with self.writer() as db:
+            rows = await db.execute_fetchall(sql, params)
+            await db.commit()
+            return list(rows)
+
+    async def read_inline(self, sql: str, params: Sequence = ()) -> list[sqlite3.Row | tuple]:
+        """Run a point lookup on the calling thread with a plain sqlite3 connection.
+
+        Skips the aiosqlite queue and its thread hops. The caller's event loop is
+        blocked while the query runs, so use this only for indexed single-row
+        reads. The inline connection waits at most ``_INLINE_BUSY_TIMEOUT`` for a
+        lock; if it is busy, locked or in use by another thread, the query runs
+        on a pooled reader instead.
+
+        Args:
+            sql: SELECT statement to run
+            params: Bound parameters
+
+        Returns:
+            Result rows
+        """
+        if self._inline_lock.acquire(blocking=False):
+            try:
+                if self._inline is None:
+                    self._inline = self._connect_inline()
+                return self._inline.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Inline read on {self.db_path} failed ({e}); using a pooled reader")
+            finally:
+                self._inline_lock.release()
+
+        async with self.reader() as db:
+            return await db.execute_fetchall(sql, params)
+
+    def _connect_inline(self) -> sqlite3.Connection:
+        """Open the read-only connection used by read_inline."""
+        conn = sqlite3.connect(self.db_path, timeout=_INLINE_BUSY_TIMEOUT, check_same_thread=False)
+        try:
+            conn.executescript(_CONNECTION_PRAGMAS)
+            conn.execute("PRAGMA query_only=ON")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    async def close(self) -> None:
+        """Close the writer and all idle reader connections."""
+        async with self._write_lock:
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+        with self._inline_lock:
+            if self._inline is not None:
+                self._inline.close()
+                self._inline = None
+        while self._idle_readers:
+            await self._idle_readers.pop().close()
+
+
+# Sync log writes are grouped into one transaction per window to amortize commits
+_LOG_BATCH_WINDOW = 0.01  # seconds
+_LOG_BATCH_MAX = 64
+
+# note_mapping columns, selected explicitly so rows unpack into dicts by position
+_NOTE_MAPPING_FIELDS = (
+    "local_uuid",
+    "local_name",
+    "local_folder_uuid",
+    "remote_path",
+    "last_sync_timestamp",
+    "attachment_slug",
+)
+_NOTE_MAPPING_COLUMNS = ", ".join(_NOTE_MAPPING_FIELDS)
+_UUID_INDEX = _NOTE_MAPPING_FIELDS.index("local_uuid")
+_REMOTE_PATH_INDEX = _NOTE_MAPPING_FIELDS.index("remote_path")
+
+# Lookups go by UUID or path, never by a surrogate ID, so rows live directly in the
+# (local_uuid, remote_path) primary-key B-tree; the key also serves UUID lookups
+_NOTE_MAPPING_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        local_uuid TEXT NOT NULL,
+        local_name TEXT NOT NULL,
+        local_folder_uuid TEXT NOT NULL,
+        remote_path TEXT NOT NULL,
+        last_sync_timestamp REAL NOT NULL,
+        attachment_slug TEXT,
+        PRIMARY KEY (local_uuid, remote_path)
+    ) WITHOUT ROWID
+"""
+
+# Hot note_mapping statements, built once so every call passes sqlite3's statement
+# cache the same string
+_SQL_MAPPING_BY_UUID = f"SELECT {_NOTE_MAPPING_COLUMNS} FROM note_mapping WHERE local_uuid = ?"
+_SQL_MAPPING_BY_REMOTE_PATH = f"SELECT {_NOTE_MAPPING_COLUMNS} FROM note_mapping WHERE remote_path = ?"
+_SQL_MAPPINGS_BY_FOLDER = f"SELECT {_NOTE_MAPPING_COLUMNS} FROM note_mapping WHERE local_folder_uuid = ?"
+_SQL_ALL_MAPPINGS = f"SELECT {_NOTE_MAPPING_COLUMNS} FROM note_mapping"
+_SQL_UPSERT_MAPPING = """
+    INSERT INTO note_mapping
+    (local_uuid, local_name, local_folder_uuid, remote_path, last_sync_timestamp, attachment_slug)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(local_uuid, remote_path) DO UPDATE SET
+        local_name = excluded.local_name,
+        local_folder_uuid = excluded.local_folder_uuid,
+        last_sync_timestamp = excluded.last_sync_timestamp,
+        attachment_slug = excluded.attachment_slug
+    WHERE local_name IS NOT excluded.local_name
+        OR local_folder_uuid IS NOT excluded.local_folder_uuid
+        OR last_sync_timestamp IS NOT excluded.last_sync_timestamp
+        OR attachment_slug IS NOT excluded.attachment_slug
+"""
+_SQL_DELETE_MAPPING_BY_UUID = "DELETE FROM note_mapping WHERE local_uuid = ? RETURNING remote_path"
+_SQL_DELETE_MAPPING_BY_REMOTE_PATH = "DELETE FROM note_mapping WHERE remote_path = ? RETURNING local_uuid"
+
+# Note mapping lookups remembered per NotesDB instance (least recently used evicted first)
+_MAPPING_CACHE_SIZE = 10_000
+_MISSING = object()
+
+# Shared pools keyed by database path
+_pools: dict[Path, AsyncSQLitePool] = {}
+
+
+def get_pool(db_path: Path) -> AsyncSQLitePool:
+    """
+    Get the shared connection pool for a database file, creating it if needed.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        AsyncSQLitePool for the given path
+    """
+    pool = _pools.get(db_path)
+    if pool is None:
+        pool = _pools[db_path] = AsyncSQLitePool(db_path)
+    return pool
+
+
+async def close_pools() -> None:
+    """Close every shared connection pool (call on application shutdown)."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
 class NotesDB:
     """
     Manages SQLite database for tracking note synchronization state.
@@ -18,15 +276,46 @@ class NotesDB:
     This allows iCloudBridge to track which notes have been synced and when.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Connection pool to use (default: shared pool for db_path)
         """
         self.db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
+        self._pool = pool or get_pool(db_path)
+        # Lookup results keyed by local UUID and by remote path, kept as immutable row
+        # tuples (None for a miss) so callers always get a fresh dict they may modify.
+        # Writes made through this instance invalidate the keys they touch.
+        self._by_uuid: OrderedDict[str, tuple | None] = OrderedDict()
+        self._by_remote_path: OrderedDict[str, tuple | None] = OrderedDict()
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: str):
+        """Return a cached lookup result, or _MISSING if the key is not cached."""
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: str, value: tuple | None) -> None:
+        """Remember a lookup result, evicting the least recently used entry when full."""
+        cache[key] = value
+        if len(cache) > _MAPPING_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _invalidate(self, local_uuid: str, remote_path: str) -> None:
+        """Forget cached lookups for a mapping that was written."""
+        self._by_uuid.pop(local_uuid, None)
+        self._by_remote_path.pop(remote_path, None)
+
+    def _invalidate_all(self) -> None:
+        """Forget every cached lookup."""
+        self._by_uuid.clear()
+        self._by_remote_path.clear()
 
     async def initialize(self) -> None:
         """
@@ -37,49 +326,54 @@ class NotesDB:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS note_mapping (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    local_uuid TEXT NOT NULL,
-                    local_name TEXT NOT NULL,
-                    local_folder_uuid TEXT NOT NULL,
-                    remote_path TEXT NOT NULL,
-                    last_sync_timestamp REAL NOT NULL,
-                    attachment_slug TEXT,
-                    UNIQUE(local_uuid, remote_path)
+        async with self._pool.writer() as db:
+            await db.execute(_NOTE_MAPPING_TABLE.format(table="note_mapping"))
+
+            # Ensure attachment_slug column exists for pre-existing databases
+            async with db.execute("PRAGMA table_info(note_mapping)") as cursor:
+                columns = {row["name"] for row in await cursor.fetchall()}
+            if "attachment_slug" not in columns:
+                await db.execute("ALTER TABLE note_mapping ADD COLUMN attachment_slug TEXT")
+                await db.commit()
+                logger.debug("Added attachment_slug column to note_mapping table")
+
+            # Rebuild tables from before the WITHOUT ROWID layout, dropping the old id column
+            async with db.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'note_mapping'"
+            ) as cursor:
+                (table_sql,) = await cursor.fetchone()
+            if "WITHOUT ROWID" not in table_sql.upper():
+                await db.executescript(
+                    f"""
+                    BEGIN IMMEDIATE;
+                    {_NOTE_MAPPING_TABLE.format(table="note_mapping_rebuild")};
+                    INSERT INTO note_mapping_rebuild ({_NOTE_MAPPING_COLUMNS})
+                    SELECT {_NOTE_MAPPING_COLUMNS} FROM note_mapping;
+                    DROP TABLE note_mapping;
+                    ALTER TABLE note_mapping_rebuild RENAME TO note_mapping;
+                    COMMIT;
+                    """
                 )
-                """
-            )
+                logger.debug("Rebuilt note_mapping table as WITHOUT ROWID")
 
             # Create index for faster lookups
             await db.execute(
                 """
-                CREATE INDEX IF NOT EXISTS idx_local_uuid
-                ON note_mapping(local_uuid)
+                CREATE INDEX IF NOT EXISTS idx_remote_path
+                ON note_mapping(remote_path)
                 """
             )
 
             await db.execute(
                 """
-                CREATE INDEX IF NOT EXISTS idx_remote_path
-                ON note_mapping(remote_path)
+                CREATE INDEX IF NOT EXISTS idx_local_folder_uuid
+                ON note_mapping(local_folder_uuid)
                 """
             )
 
             await db.commit()
             logger.debug(f"Database initialized at {self.db_path}")
 
-            # Ensure attachment_slug column exists for pre-existing databases
-            db.row_factory = aiosqlite.Row
-            async with db.execute("PRAGMA table_info(note_mapping)") as cursor:
-                columns = {row["name"] for row in await cursor.fetchall()}
-            if "attachment_slug" not in columns:
-                await db.execute("ALTER TABLE note_mapping ADD COLUMN attachment_slug TEXT")
-                await db.commit()
-                logger.debug("Added attachment_slug column to note_mapping table")
-
     async def get_mapping(self, local_uuid: str) -> dict | None:
         """
         Get the remote mapping for a local note UUID.
@@ -89,20 +383,18 @@ class NotesDB:
 
         Returns:
             Dictionary with mapping details, or None if not found
-            Keys: id, local_uuid, local_name, local_folder_uuid,
-                  remote_path, last_sync_timestamp
+            Keys: local_uuid, local_name, local_folder_uuid,
+                  remote_path, last_sync_timestamp, attachment_slug
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM note_mapping
-                WHERE local_uuid = ?
-                """,
+        row = self._cache_get(self._by_uuid, local_uuid)
+        if row is _MISSING:
+            rows = await self._pool.read_inline(
+                _SQL_MAPPING_BY_UUID,
                 (local_uuid,),
-            ) as cursor:
-                row = await cursor.fetchone()
-                return dict(row) if row else None
+            )
+            row = tuple(rows[0]) if rows else None
+            self._cache_put(self._by_uuid, local_uuid, row)
+        return dict(zip(_NOTE_MAPPING_FIELDS, row, strict=True)) if row is not None else None
 
     async def get_mapping_by_remote_path(self, remote_path: str) -> dict | None:
         """
@@ -114,17 +406,16 @@ class NotesDB:
         Returns:
             Dictionary with mapping details, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM note_mapping
-                WHERE remote_path = ?
-                """,
-                (str(remote_path),),
-            ) as cursor:
-                row = await cursor.fetchone()
-                return dict(row) if row else None
+        remote_path = str(remote_path)
+        row = self._cache_get(self._by_remote_path, remote_path)
+        if row is _MISSING:
+            rows = await self._pool.read_inline(
+                _SQL_MAPPING_BY_REMOTE_PATH,
+                (remote_path,),
+            )
+            row = tuple(rows[0]) if rows else None
+            self._cache_put(self._by_remote_path, remote_path, row)
+        return dict(zip(_NOTE_MAPPING_FIELDS, row, strict=True)) if row is not None else None
 
     async def upsert_mapping(
         self,
@@ -145,22 +436,37 @@ class NotesDB:
             remote_path: Path to the remote markdown file
             timestamp: Last sync timestamp (Unix timestamp)
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO note_mapping
-                (local_uuid, local_name, local_folder_uuid, remote_path, last_sync_timestamp, attachment_slug)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(local_uuid, remote_path) DO UPDATE SET
-                    local_name = excluded.local_name,
-                    local_folder_uuid = excluded.local_folder_uuid,
-                    last_sync_timestamp = excluded.last_sync_timestamp,
-                    attachment_slug = excluded.attachment_slug
-                """,
-                (local_uuid, local_name, local_folder_uuid, str(remote_path), timestamp, attachment_slug),
-            )
+        remote_path = str(remote_path)
+        await self._pool.write(
+            _SQL_UPSERT_MAPPING,
+            (local_uuid, local_name, local_folder_uuid, remote_path, timestamp, attachment_slug),
+        )
+        self._invalidate(local_uuid, remote_path)
+        logger.debug(f"Upserted mapping: {local_uuid} -> {remote_path}")
+
+    async def upsert_mappings(
+        self, rows: Iterable[tuple[str, str, str, Path | str, float, str | None]]
+    ) -> None:
+        """
+        Create or update many note mappings in one transaction.
+
+        Args:
+            rows: (local_uuid, local_name, local_folder_uuid, remote_path,
+                timestamp, attachment_slug) tuples, as accepted by upsert_mapping
+        """
+        params = [
+            (local_uuid, local_name, local_folder_uuid, str(remote_path), timestamp, attachment_slug)
+            for local_uuid, local_name, local_folder_uuid, remote_path, timestamp, attachment_slug in rows
+        ]
+        if not params:
+            return
+
+        async with self._pool.writer() as db:
+            await db.executemany(_SQL_UPSERT_MAPPING, params)
             await db.commit()
-            logger.debug(f"Upserted mapping: {local_uuid} -> {remote_path}")
+            for local_uuid, _, _, remote_path, _, _ in params:
+                self._invalidate(local_uuid, remote_path)
+            logger.debug(f"Upserted {len(params)} mappings")
 
     async def delete_mapping(self, local_uuid: str) -> None:
         """
@@ -169,16 +475,11 @@ class NotesDB:
         Args:
             local_uuid: UUID of the local Apple Note
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                DELETE FROM note_mapping
-                WHERE local_uuid = ?
-                """,
-                (local_uuid,),
-            )
-            await db.commit()
-            logger.debug(f"Deleted mapping for: {local_uuid}")
+        rows = await self._pool.write(_SQL_DELETE_MAPPING_BY_UUID, (local_uuid,))
+        self._by_uuid.pop(local_uuid, None)
+        for (remote_path,) in rows:
+            self._by_remote_path.pop(remote_path, None)
+        logger.debug(f"Deleted mapping for: {local_uuid}")
 
     async def delete_mapping_by_remote_path(self, remote_path: str) -> None:
         """
@@ -187,16 +488,12 @@ class NotesDB:
         Args:
             remote_path: Path to the remote markdown file
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                DELETE FROM note_mapping
-                WHERE remote_path = ?
-                """,
-                (str(remote_path),),
-            )
-            await db.commit()
-            logger.debug(f"Deleted mapping for: {remote_path}")
+        remote_path = str(remote_path)
+        rows = await self._pool.write(_SQL_DELETE_MAPPING_BY_REMOTE_PATH, (remote_path,))
+        self._by_remote_path.pop(remote_path, None)
+        for (local_uuid,) in rows:
+            self._by_uuid.pop(local_uuid, None)
+        logger.debug(f"Deleted mapping for: {remote_path}")
 
     async def get_all_mappings(self) -> list[dict]:
         """
@@ -205,11 +502,17 @@ class NotesDB:
         Returns:
             List of dictionaries, each containing mapping details
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("SELECT * FROM note_mapping") as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+        async with self._pool.reader() as db:
+            rows = await db.execute_fetchall(_SQL_ALL_MAPPINGS)
+        rows = [tuple(row) for row in rows]
+
+        # Prime the lookup caches so per-note lookups later in the sync skip the database.
+        # Rows come back in primary-key order; walk them backwards so the first row per key wins,
+        # as it does for the indexed single-row lookups.
+        for row in reversed(rows):
+            self._cache_put(self._by_uuid, row[_UUID_INDEX], row)
+            self._cache_put(self._by_remote_path, row[_REMOTE_PATH_INDEX], row)
+        return [dict(zip(_NOTE_MAPPING_FIELDS, row, strict=True)) for row in rows]
 
     async def clear_all_mappings(self) -> None:
         """
@@ -217,10 +520,9 @@ class NotesDB:
 
         This does NOT delete any notes - it only clears the sync tracking.
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM note_mapping")
-            await db.commit()
-            logger.info("All note mappings cleared from database")
+        await self._pool.write("DELETE FROM note_mapping")
+        self._invalidate_all()
+        logger.info("All note mappings cleared from database")
 
     async def get_mappings_for_folder(self, folder_uuid: str) -> list[dict]:
         """
@@ -232,17 +534,12 @@ class NotesDB:
         Returns:
             List of dictionaries containing mapping details
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM note_mapping
-                WHERE local_folder_uuid = ?
-                """,
+        async with self._pool.reader() as db:
+            rows = await db.execute_fetchall(
+                _SQL_MAPPINGS_BY_FOLDER,
                 (folder_uuid,),
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+            )
+        return [dict(zip(_NOTE_MAPPING_FIELDS, row, strict=True)) for row in rows]
 
     async def cleanup_orphaned_mappings(
         self, existing_local_uuids: set[str], existing_remote_paths: set[str]
@@ -257,26 +554,35 @@ class NotesDB:
         Returns:
             Number of orphaned mappings cleaned up
         """
-        count = 0
-        mappings = await self.get_all_mappings()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            for mapping in mappings:
-                local_uuid = mapping["local_uuid"]
-                remote_path = mapping["remote_path"]
-
-                # If note doesn't exist on either side, remove mapping
-                if local_uuid not in existing_local_uuids and remote_path not in existing_remote_paths:
-                    await db.execute(
-                        "DELETE FROM note_mapping WHERE id = ?",
-                        (mapping["id"],),
-                    )
-                    count += 1
-                    logger.debug(f"Cleaned up orphaned mapping: {local_uuid} -> {remote_path}")
-
-            await db.commit()
+        # Load the live keys into temp tables so the orphan match runs entirely in SQL
+        async with self._pool.writer() as db:
+            await db.execute("CREATE TEMP TABLE IF NOT EXISTS live_local_uuid (uuid TEXT PRIMARY KEY)")
+            await db.execute("CREATE TEMP TABLE IF NOT EXISTS live_remote_path (path TEXT PRIMARY KEY)")
+            try:
+                await db.executemany(
+                    "INSERT INTO live_local_uuid (uuid) VALUES (?)",
+                    [(uuid,) for uuid in existing_local_uuids],
+                )
+                await db.executemany(
+                    "INSERT INTO live_remote_path (path) VALUES (?)",
+                    [(path,) for path in existing_remote_paths],
+                )
+                cursor = await db.execute(
+                    """
+                    DELETE FROM note_mapping
+                    WHERE local_uuid NOT IN (SELECT uuid FROM live_local_uuid)
+                    AND remote_path NOT IN (SELECT path FROM live_remote_path)
+                    """
+                )
+                count = cursor.rowcount
+                await cursor.close()
+                await db.commit()
+            finally:
+                await db.execute("DROP TABLE IF EXISTS temp.live_local_uuid")
+                await db.execute("DROP TABLE IF EXISTS temp.live_remote_path")
 
         if count > 0:
+            self._invalidate_all()
             logger.info(f"Cleaned up {count} orphaned note mappings")
 
         return count
@@ -288,7 +594,7 @@ class NotesDB:
         Returns:
             Dictionary with note counts and sync status
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.reader() as db:
             # Total notes
             async with db.execute("SELECT COUNT(*) FROM note_mapping") as cursor:
                 total = (await cursor.fetchone())[0]
@@ -298,11 +604,16 @@ class NotesDB:
                 "synced": total,  # All mappings are synced notes
             }
 
-    async def close(self) -> None:
-        """Close database connection if open."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+    async def liveness(self) -> bool:
+        """
+        Check that the database can be opened and queried without scanning tables.
+
+        Returns:
+            True if a trivial query succeeds
+        """
+        async with self._pool.reader() as db:
+            async with db.execute("SELECT 1") as cursor:
+                return (await cursor.fetchone())[0] == 1
 
 
 class RemindersDB:
@@ -313,15 +624,16 @@ class RemindersDB:
     This allows iCloudBridge to track which reminders have been synced and when.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Connection pool to use (default: shared pool for db_path)
         """
         self.db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
+        self._pool = pool or get_pool(db_path)
 
     async def initialize(self) -> None:
         """
@@ -332,7 +644,7 @@ class RemindersDB:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS reminder_mapping (
@@ -384,7 +696,7 @@ class RemindersDB:
             remote_caldav_url: CalDAV URL of the remote TODO
             last_sync: Timestamp of last sync
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 INSERT OR REPLACE INTO reminder_mapping
@@ -408,8 +720,7 @@ class RemindersDB:
             Keys: id, local_uuid, remote_uid, local_title,
                   remote_caldav_url, last_sync_timestamp
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM reminder_mapping
@@ -430,8 +741,7 @@ class RemindersDB:
         Returns:
             Dictionary with mapping details, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM reminder_mapping
@@ -449,8 +759,7 @@ class RemindersDB:
         Returns:
             List of dictionaries containing mapping details
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute("SELECT * FROM reminder_mapping") as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -471,7 +780,7 @@ class RemindersDB:
             remote_caldav_url: CalDAV URL of the remote TODO
             last_sync: New timestamp for last sync
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 UPDATE reminder_mapping
@@ -494,7 +803,7 @@ class RemindersDB:
         if not local_uuid and not remote_uid:
             raise ValueError("Must provide either local_uuid or remote_uid")
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             if local_uuid:
                 await db.execute(
                     "DELETE FROM reminder_mapping WHERE local_uuid = ?",
@@ -514,7 +823,7 @@ class RemindersDB:
 
         This does NOT delete any reminders - it only clears the sync tracking.
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute("DELETE FROM reminder_mapping")
             await db.commit()
             logger.info("All reminder mappings cleared from database")
@@ -526,7 +835,7 @@ class RemindersDB:
         Returns:
             Dictionary with reminder counts and sync status
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.reader() as db:
             # Total reminders
             async with db.execute("SELECT COUNT(*) FROM reminder_mapping") as cursor:
                 total = (await cursor.fetchone())[0]
@@ -536,11 +845,16 @@ class RemindersDB:
                 "synced": total,  # All mappings are synced reminders
             }
 
-    async def close(self) -> None:
-        """Close database connection if open."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+    async def liveness(self) -> bool:
+        """
+        Check that the database can be opened and queried without scanning tables.
+
+        Returns:
+            True if a trivial query succeeds
+        """
+        async with self._pool.reader() as db:
+            async with db.execute("SELECT 1") as cursor:
+                return (await cursor.fetchone())[0] == 1
 
 
 class PasswordsDB:
@@ -552,15 +866,16 @@ class PasswordsDB:
     model where plaintext passwords are never stored in the database.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Connection pool to use (default: shared pool for db_path)
         """
         self.db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
+        self._pool = pool or get_pool(db_path)
 
     async def initialize(self) -> None:
         """
@@ -571,7 +886,8 @@ class PasswordsDB:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
+
             # Password entries table
             await db.execute(
                 """
@@ -687,7 +1003,7 @@ class PasswordsDB:
         """
         now = datetime.now().timestamp()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             # Check if entry exists
             async with db.execute(
                 """
@@ -763,8 +1079,7 @@ class PasswordsDB:
         Returns:
             List of password entry dictionaries
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
 
             if source:
                 query = "SELECT * FROM password_entry WHERE source = ? ORDER BY title"
@@ -791,8 +1106,7 @@ class PasswordsDB:
         Returns:
             Password entry dictionary or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM password_entry
@@ -821,7 +1135,7 @@ class PasswordsDB:
         """
         now = datetime.now().timestamp()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 INSERT INTO sync_metadata
@@ -843,8 +1157,7 @@ class PasswordsDB:
         Returns:
             Sync metadata dictionary or None if no sync found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM sync_metadata
@@ -864,7 +1177,7 @@ class PasswordsDB:
         Returns:
             Dictionary with entry counts by source
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.reader() as db:
             # Total entries
             async with db.execute(
                 "SELECT COUNT(*) FROM password_entry"
@@ -885,7 +1198,7 @@ class PasswordsDB:
 
     async def clear_all_entries(self) -> None:
         """Clear all password entries from the database."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute("DELETE FROM password_entry")
             await db.commit()
             logger.info("All password entries cleared from database")
@@ -917,7 +1230,7 @@ class PasswordsDB:
         """
         now = datetime.now().timestamp()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 INSERT INTO password_mapping
@@ -960,8 +1273,7 @@ class PasswordsDB:
         Returns:
             List of mapping dictionaries
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             if provider_type:
                 async with db.execute(
                     """
@@ -994,8 +1306,7 @@ class PasswordsDB:
         Returns:
             Mapping dictionary or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM password_mapping
@@ -1018,7 +1329,7 @@ class PasswordsDB:
             provider_type: Provider type
             url: Optional URL
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 DELETE FROM password_mapping
@@ -1031,11 +1342,16 @@ class PasswordsDB:
                 f"Deleted password mapping: {title} ({username}) for {provider_type}"
             )
 
-    async def close(self) -> None:
-        """Close database connection if open."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+    async def liveness(self) -> bool:
+        """
+        Check that the database can be opened and queried without scanning tables.
+
+        Returns:
+            True if a trivial query succeeds
+        """
+        async with self._pool.reader() as db:
+            async with db.execute("SELECT 1") as cursor:
+                return (await cursor.fetchone())[0] == 1
 
 
 class SyncLogsDB:
@@ -1046,15 +1362,18 @@ class SyncLogsDB:
     Logs are automatically purged after the retention period (default 7 days).
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Connection pool to use (default: shared pool for db_path)
         """
         self.db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
+        self._pool = pool or get_pool(db_path)
+        self._write_queue: deque[tuple[str, Sequence, asyncio.Future]] = deque()
+        self._writer_task: asyncio.Task | None = None
 
     async def initialize(self) -> None:
         """
@@ -1065,7 +1384,7 @@ class SyncLogsDB:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sync_logs (
@@ -1098,6 +1417,13 @@ class SyncLogsDB:
                 """
             )
 
+            await db.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_sync_logs_service_id
+                ON sync_logs(service, id DESC)
+                """
+            )
+
             await db.commit()
             logger.debug(f"SyncLogsDB initialized at {self.db_path}")
 
@@ -1118,18 +1444,15 @@ class SyncLogsDB:
         Returns:
             int: Log entry ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                INSERT INTO sync_logs (
-                    service, sync_type, status, started_at
-                )
-                VALUES (?, ?, ?, ?)
-                """,
-                (service, sync_type, status, datetime.now().timestamp()),
+        return await self._submit_write(
+            """
+            INSERT INTO sync_logs (
+                service, sync_type, status, started_at
             )
-            await db.commit()
-            return cursor.lastrowid
+            VALUES (?, ?, ?, ?)
+            """,
+            (service, sync_type, status, datetime.now().timestamp()),
+        )
 
     async def update_log(
         self,
@@ -1139,6 +1462,7 @@ class SyncLogsDB:
         stats_json: str | None = None,
         error_message: str | None = None,
         log_entries: str | None = None,
+        stats: dict | None = None,
     ) -> None:
         """
         Update an existing sync log entry.
@@ -1150,6 +1474,8 @@ class SyncLogsDB:
             stats_json: JSON string of sync statistics
             error_message: Error message if sync failed
             log_entries: Newline-separated log entries
+            stats: Sync statistics dict; serialized by the batch writer
+                instead of stats_json
         """
         updates = []
         values = []
@@ -1164,7 +1490,10 @@ class SyncLogsDB:
             updates.append("duration_seconds = ?")
             values.append(duration_seconds)
 
-        if stats_json is not None:
+        if stats is not None:
+            updates.append("stats_json = ?")
+            values.append(stats)
+        elif stats_json is not None:
             updates.append("stats_json = ?")
             values.append(stats_json)
 
@@ -1182,16 +1511,90 @@ class SyncLogsDB:
 
         values.append(log_id)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                f"""
-                UPDATE sync_logs
-                SET {", ".join(updates)}
-                WHERE id = ?
-                """,
-                values,
-            )
+        await self._submit_write(
+            f"""
+            UPDATE sync_logs
+            SET {", ".join(updates)}
+            WHERE id = ?
+            """,
+            values,
+        )
+
+    async def _submit_write(self, sql: str, params: Sequence) -> int:
+        """
+        Queue a log write for the batch writer and wait until it is committed.
+
+        Args:
+            sql: INSERT or UPDATE statement
+            params: Statement parameters
+
+        Returns:
+            int: lastrowid of the statement
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._write_queue.append((sql, params, future))
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._drain_writes())
+        return await future
+
+    async def _drain_writes(self) -> None:
+        """Commit queued log writes in batched transactions until the queue is empty."""
+        batch: list[tuple[str, Sequence, asyncio.Future]] = []
+        try:
+            while self._write_queue:
+                # Give concurrent syncs a moment to queue their writes into this batch
+                await asyncio.sleep(_LOG_BATCH_WINDOW)
+                batch = [
+                    self._write_queue.popleft()
+                    for _ in range(min(len(self._write_queue), _LOG_BATCH_MAX))
+                ]
+                try:
+                    results: list = await self._commit_batch(batch)
+                except Exception as exc:
+                    if len(batch) == 1:
+                        results = [exc]
+                    else:
+                        # Retry one by one so a single bad write doesn't fail its neighbours
+                        results = []
+                        for item in batch:
+                            try:
+                                results.extend(await self._commit_batch([item]))
+                            except Exception as item_exc:
+                                results.append(item_exc)
+
+                for (_, _, future), result in zip(batch, results, strict=True):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            # Cancelled or interrupted: don't leave writers awaiting futures nobody will resolve
+            pending = [future for _, _, future in batch]
+            pending.extend(future for _, _, future in self._write_queue)
+            self._write_queue.clear()
+            for future in pending:
+                if not future.done():
+                    future.set_exception(RuntimeError("Sync log writer stopped before committing"))
+
+    async def _commit_batch(self, batch: list[tuple[str, Sequence, asyncio.Future]]) -> list[int]:
+        """Execute a batch of queued writes in a single transaction."""
+        async with self._pool.writer() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            rowids = []
+            for sql, params, _ in batch:
+                # Dict parameters are stats payloads queued unserialized by update_log
+                params = [
+                    orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+                    if isinstance(value, dict) else value
+                    for value in params
+                ]
+                cursor = await db.execute(sql, params)
+                rowids.append(cursor.lastrowid)
             await db.commit()
+        return rowids
 
     async def get_log(self, log_id: int) -> dict | None:
         """
@@ -1203,8 +1606,7 @@ class SyncLogsDB:
         Returns:
             Dictionary with log details, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM sync_logs
@@ -1221,6 +1623,7 @@ class SyncLogsDB:
         status: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        before_id: int | None = None,
     ) -> list[dict]:
         """
         Get sync logs with optional filtering.
@@ -1229,7 +1632,8 @@ class SyncLogsDB:
             service: Filter by service name ('notes', 'reminders', 'passwords')
             status: Filter by status ('running', 'success', 'error')
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            offset: Number of logs to skip (ignored when before_id is given)
+            before_id: Keyset cursor; only return logs with a smaller ID
 
         Returns:
             List of log dictionaries
@@ -1245,15 +1649,54 @@ class SyncLogsDB:
             query += " AND status = ?"
             params.append(status)
 
-        query += " ORDER BY started_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        # Both forms order by id so a before_id cursor continues exactly where the
+        # previous page ended
+        if before_id is not None:
+            # Seek via the (service, id) index instead of scanning past OFFSET rows
+            query += " AND id < ? ORDER BY id DESC LIMIT ?"
+            params.extend([before_id, limit])
+        else:
+            query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        async with self._pool.reader() as db:
             async with db.execute(query, params) as cursor:
-                rows = await cursor.fetchall()
+                return [dict(row) async for row in cursor]
+
+    async def get_latest_logs(self, services: Sequence[str]) -> dict[str, dict]:
+        """
+        Get the most recent sync log for each of several services in one query.
+
+        Args:
+            services: Service names to look up
+
+        Returns:
+            Dictionary mapping service name to its latest log; services with
+            no logs are omitted
+        """
+        if not services:
+            return {}
+
+        placeholders = ", ".join("?" for _ in services)
+        query = f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY service ORDER BY started_at DESC, id DESC
+                ) AS rn
+                FROM sync_logs
+                WHERE service IN ({placeholders})
+            )
+            WHERE rn = 1
+        """
 
-        return [dict(row) for row in rows]
+        latest = {}
+        async with self._pool.reader() as db:
+            async with db.execute(query, tuple(services)) as cursor:
+                async for row in cursor:
+                    log = dict(row)
+                    del log["rn"]
+                    latest[log["service"]] = log
+        return latest
 
     async def cleanup_old_logs(self, retention_days: int = 7) -> int:
         """
@@ -1267,7 +1710,7 @@ class SyncLogsDB:
         """
         cutoff_timestamp = (datetime.now().timestamp() - (retention_days * 24 * 60 * 60))
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             cursor = await db.execute(
                 """
                 DELETE FROM sync_logs
@@ -1282,7 +1725,7 @@ class SyncLogsDB:
 
     async def clear_service_logs(self, service: str) -> int:
         """Delete all logs for a given service (e.g. when resetting that feature)."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             cursor = await db.execute(
                 """
                 DELETE FROM sync_logs
@@ -1295,11 +1738,16 @@ class SyncLogsDB:
             logger.info(f"Cleared {removed} sync log(s) for service '{service}'")
             return removed
 
-    async def close(self) -> None:
-        """Close database connection if open."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+    async def liveness(self) -> bool:
+        """
+        Check that the database can be opened and queried without scanning tables.
+
+        Returns:
+            True if a trivial query succeeds
+        """
+        async with self._pool.reader() as db:
+            async with db.execute("SELECT 1") as cursor:
+                return (await cursor.fetchone())[0] == 1
 
 
 class SchedulesDB:
@@ -1310,15 +1758,16 @@ class SchedulesDB:
     Integrates with APScheduler for actual job execution.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Connection pool to use (default: shared pool for db_path)
         """
         self.db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
+        self._pool = pool or get_pool(db_path)
 
     async def initialize(self) -> None:
         """
@@ -1329,7 +1778,7 @@ class SchedulesDB:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS schedules (
@@ -1373,8 +1822,7 @@ class SchedulesDB:
     async def _ensure_services_column(self) -> None:
         """Add and populate the services column if it is missing or empty."""
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.writer() as db:
             async with db.execute("PRAGMA table_info(schedules)") as cursor:
                 columns = {row["name"] for row in await cursor.fetchall()}
 
@@ -1433,7 +1881,7 @@ class SchedulesDB:
         services_json = json.dumps(services)
         primary_service = services[0] if services else service
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             cursor = await db.execute(
                 """
                 INSERT INTO schedules (
@@ -1469,8 +1917,7 @@ class SchedulesDB:
         Returns:
             Dictionary with schedule details, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT * FROM schedules
@@ -1509,8 +1956,7 @@ class SchedulesDB:
 
         query += " ORDER BY created_at DESC"
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -1527,7 +1973,7 @@ class SchedulesDB:
         next_run: float | None = None,
         last_run: float | None = None,
         services: list[str] | None = None,
-    ) -> None:
+    ) -> dict | None:
         """
         Update an existing schedule.
 
@@ -1541,6 +1987,9 @@ class SchedulesDB:
             config_json: New configuration JSON
             next_run: Next run timestamp
             last_run: Last run timestamp
+
+        Returns:
+            The updated schedule, or None if no schedule has that ID
         """
         updates = []
         values = []
@@ -1591,16 +2040,43 @@ class SchedulesDB:
 
         values.append(schedule_id)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
+        async with self._pool.writer() as db:
+            async with db.execute(
                 f"""
                 UPDATE schedules
                 SET {", ".join(updates)}
                 WHERE id = ?
+                RETURNING *
                 """,
                 values,
-            )
+            ) as cursor:
+                row = await cursor.fetchone()
             await db.commit()
+            return self._row_to_schedule(row)
+
+    async def toggle_schedule(self, schedule_id: int) -> dict | None:
+        """
+        Flip a schedule's enabled flag in a single statement.
+
+        Args:
+            schedule_id: Schedule ID
+
+        Returns:
+            The updated schedule, or None if no schedule has that ID
+        """
+        async with self._pool.writer() as db:
+            async with db.execute(
+                """
+                UPDATE schedules
+                SET enabled = NOT enabled, updated_at = ?
+                WHERE id = ?
+                RETURNING *
+                """,
+                (datetime.now().timestamp(), schedule_id),
+            ) as cursor:
+                row = await cursor.fetchone()
+            await db.commit()
+            return self._row_to_schedule(row)
 
     def _row_to_schedule(self, row: aiosqlite.Row | None) -> dict | None:
         """Convert a SQLite row into a dictionary with parsed services."""
@@ -1630,29 +2106,84 @@ class SchedulesDB:
             schedule["service"] = services[0]
         return schedule
 
-    async def delete_schedule(self, schedule_id: int) -> None:
+    async def delete_schedule(self, schedule_id: int) -> int | None:
         """
         Delete a schedule.
 
         Args:
             schedule_id: Schedule ID
+
+        Returns:
+            The deleted schedule ID, or None if no schedule has that ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
+        async with self._pool.writer() as db:
+            async with db.execute(
                 """
                 DELETE FROM schedules
                 WHERE id = ?
+                RETURNING id
                 """,
                 (schedule_id,),
-            )
+            ) as cursor:
+                row = await cursor.fetchone()
             await db.commit()
-            logger.info(f"Schedule {schedule_id} deleted")
 
-    async def close(self) -> None:
-        """Close database connection if open."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
+        if row is None:
+            return None
+        logger.info(f"Schedule {schedule_id} deleted")
+        return row[0]
+
+
+async def import_legacy_state(state_db_path: Path) -> None:
+    """
+    Move sync logs and schedules from their old per-table files into state.db.
+
+    Earlier versions kept sync_logs.db and schedules.db as separate files next
+    to the state database. Rows are copied (keeping their IDs) only when the
+    corresponding table in state.db is still empty, and the legacy file is then
+    renamed to ``<name>.migrated`` so the import runs once.
+
+    Args:
+        state_db_path: Path to the shared state database
+    """
+    legacy = [
+        (state_db_path.with_name("sync_logs.db"), "sync_logs", SyncLogsDB),
+        (state_db_path.with_name("schedules.db"), "schedules", SchedulesDB),
+    ]
+    pool = get_pool(state_db_path)
+
+    for legacy_path, table, db_class in legacy:
+        if not legacy_path.exists():
+            continue
+
+        state_db = db_class(state_db_path, pool)
+        await state_db.initialize()
+
+        async with pool.writer() as db:
+            async with db.execute(f"SELECT EXISTS (SELECT 1 FROM {table})") as cursor:
+                already_populated = (await cursor.fetchone())[0]
+
+            if not already_populated:
+                await db.execute("ATTACH DATABASE ? AS legacy", (str(legacy_path),))
+                try:
+                    async with db.execute(f"PRAGMA legacy.table_info({table})") as cursor:
+                        legacy_columns = {row["name"] for row in await cursor.fetchall()}
+                    async with db.execute(f"PRAGMA main.table_info({table})") as cursor:
+                        columns = [row["name"] for row in await cursor.fetchall()]
+                    shared = ", ".join(c for c in columns if c in legacy_columns)
+                    if shared:
+                        await db.execute(
+                            f"INSERT INTO main.{table} ({shared}) SELECT {shared} FROM legacy.{table}"
+                        )
+                    await db.commit()
+                finally:
+                    await db.execute("DETACH DATABASE legacy")
+
+        # Backfill columns the legacy schema may have lacked (e.g. schedules.services)
+        await state_db.initialize()
+
+        legacy_path.rename(legacy_path.with_name(legacy_path.name + ".migrated"))
+        logger.info(f"Imported {table} from {legacy_path} into {state_db_path}")
 
 
 class SettingsDB:
@@ -1663,15 +2194,22 @@ class SettingsDB:
     modified through the web UI (e.g., log retention days, theme preferences).
     """
 
-    def __init__(self, db_path: Path):
+    _DEFAULTS = {
+        "log_retention_days": "7",
+        "theme": "system",
+        "log_level": "INFO",
+    }
+
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Connection pool to use (default: shared pool for db_path)
         """
         self.db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
+        self._pool = pool or get_pool(db_path)
 
     async def initialize(self) -> None:
         """
@@ -1682,7 +2220,7 @@ class SettingsDB:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS settings (
@@ -1693,14 +2231,19 @@ class SettingsDB:
                 """
             )
 
+            # Set default values if they don't exist
+            now = datetime.now().timestamp()
+            await db.executemany(
+                """
+                INSERT OR IGNORE INTO settings (key, value, updated_at)
+                VALUES (?, ?, ?)
+                """,
+                [(key, value, now) for key, value in self._DEFAULTS.items()],
+            )
+
             await db.commit()
             logger.debug(f"SettingsDB initialized at {self.db_path}")
 
-            # Set default values if they don't exist
-            await self.set_default("log_retention_days", "7")
-            await self.set_default("theme", "system")
-            await self.set_default("log_level", "INFO")
-
     async def set_default(self, key: str, value: str) -> None:
         """
         Set a default value for a setting if it doesn't exist.
@@ -1709,7 +2252,7 @@ class SettingsDB:
             key: Setting key
             value: Default value
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 INSERT OR IGNORE INTO settings (key, value, updated_at)
@@ -1729,7 +2272,7 @@ class SettingsDB:
         Returns:
             Setting value, or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.reader() as db:
             async with db.execute(
                 """
                 SELECT value FROM settings
@@ -1747,7 +2290,7 @@ class SettingsDB:
         Returns:
             Dictionary of all settings (key -> value)
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.reader() as db:
             async with db.execute("SELECT key, value FROM settings") as cursor:
                 rows = await cursor.fetchall()
                 return {row[0]: row[1] for row in rows}
@@ -1760,7 +2303,7 @@ class SettingsDB:
             key: Setting key
             value: Setting value
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 INSERT OR REPLACE INTO settings (key, value, updated_at)
@@ -1770,6 +2313,27 @@ class SettingsDB:
             )
             await db.commit()
 
+    async def set_settings(self, pairs: Sequence[tuple[str, str]]) -> None:
+        """
+        Set several setting values in one transaction.
+
+        Args:
+            pairs: (key, value) tuples to store
+        """
+        now = datetime.now().timestamp()
+        async with self._pool.writer() as db:
+            await db.executemany(
+                """
+                INSERT INTO settings (key, value, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    updated_at = excluded.updated_at
+                """,
+                [(key, value, now) for key, value in pairs],
+            )
+            await db.commit()
+
     async def delete_setting(self, key: str) -> None:
         """
         Delete a setting.
@@ -1777,7 +2341,7 @@ class SettingsDB:
         Args:
             key: Setting key
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 DELETE FROM settings
@@ -1786,9 +2350,3 @@ class SettingsDB:
                 (key,),
             )
             await db.commit()
-
-    async def close(self) -> None:
-        """Close database connection if open."""
-        if self._connection:
-            await self._connection.close()
-            self._connection = None
@@ -3,23 +3,27 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from pathlib import Path
 
 import aiosqlite
 
+from icloudbridge.utils.db import AsyncSQLitePool, get_pool
+
 logger = logging.getLogger(__name__)
 
 
 class PhotosDB:
     """Manage discovery/import state for photo sync."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool: AsyncSQLitePool | None = None):
         self.db_path = db_path
+        self._pool = pool or get_pool(db_path)
 
     async def initialize(self) -> None:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS photo_assets (
@@ -43,8 +47,7 @@ class PhotosDB:
             await db.commit()
 
     async def get_by_hash(self, content_hash: str) -> dict | None:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM photo_assets WHERE content_hash = ?",
                 (content_hash,),
@@ -52,6 +55,22 @@ class PhotosDB:
                 row = await cursor.fetchone()
                 return dict(row) if row else None
 
+    async def known_hashes(self, content_hashes: Iterable[str]) -> set[str]:
+        """Return the subset of the given content hashes already recorded."""
+        hashes = list(content_hashes)
+        known: set[str] = set()
+        async with self._pool.reader() as db:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(hashes), 900):
+                chunk = hashes[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                async with db.execute(
+                    f"SELECT content_hash FROM photo_assets WHERE content_hash IN ({placeholders})",
+                    chunk,
+                ) as cursor:
+                    known.update(row[0] for row in await cursor.fetchall())
+        return known
+
     async def record_discovery(
         self,
         *,
@@ -63,7 +82,7 @@ class PhotosDB:
         album: str | None,
         captured_at: datetime | None,
     ) -> None:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 INSERT OR IGNORE INTO photo_assets
@@ -78,11 +97,49 @@ class PhotosDB:
                     source_name,
                     album,
                     captured_at.isoformat() if captured_at else None,
-                    datetime.utcnow().timestamp(),
+                    datetime.now(UTC).timestamp(),
                 ),
             )
             await db.commit()
 
+    async def record_discoveries(
+        self,
+        rows: Iterable[tuple[str, Path, int, str, str, str | None, datetime | None]],
+    ) -> None:
+        """Record many discoveries in one transaction.
+
+        Args:
+            rows: (content_hash, path, size, media_type, source_name, album,
+                captured_at) tuples, as accepted by record_discovery
+        """
+        first_seen = datetime.now(UTC).timestamp()
+        params = [
+            (
+                content_hash,
+                str(path),
+                size,
+                media_type,
+                source_name,
+                album,
+                captured_at.isoformat() if captured_at else None,
+                first_seen,
+            )
+            for content_hash, path, size, media_type, source_name, album, captured_at in rows
+        ]
+        if not params:
+            return
+
+        async with self._pool.writer() as db:
+            await db.executemany(
+                """
+                INSERT OR IGNORE INTO photo_assets
+                (content_hash, source_path, file_size, media_type, source_name, album, captured_at, first_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                params,
+            )
+            await db.commit()
+
     async def mark_imported(
         self,
         *,
@@ -90,7 +147,7 @@ class PhotosDB:
         album: str | None,
         apple_local_identifier: str | None = None,
     ) -> None:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.writer() as db:
             await db.execute(
                 """
                 UPDATE photo_assets
@@ -100,7 +157,7 @@ class PhotosDB:
                 WHERE content_hash = ?
                 """,
                 (
-                    datetime.utcnow().timestamp(),
+                    datetime.now(UTC).timestamp(),
                     album,
                     apple_local_identifier,
                     content_hash,
@@ -108,6 +165,38 @@ class PhotosDB:
             )
             await db.commit()
 
+    async def mark_imported_bulk(
+        self,
+        entries: Iterable[tuple[str, str | None]],
+        album: str | None,
+    ) -> None:
+        """Mark many assets imported into one album in one transaction.
+
+        Args:
+            entries: (content_hash, apple_local_identifier) pairs
+            album: Album the assets were imported into
+        """
+        last_imported = datetime.now(UTC).timestamp()
+        params = [
+            (last_imported, album, apple_local_identifier, content_hash)
+            for content_hash, apple_local_identifier in entries
+        ]
+        if not params:
+            return
+
+        async with self._pool.writer() as db:
+            await db.executemany(
+                """
+                UPDATE photo_assets
+                SET last_imported = ?,
+                    album = COALESCE(?, album),
+                    apple_local_identifier = COALESCE(?, apple_local_identifier)
+                WHERE content_hash = ?
+                """,
+                params,
+            )
+            await db.commit()
+
     async def get_stats(self, pending_since: float | None = None) -> dict[str, int]:
         """Return aggregate counts for imported and pending assets.
 
@@ -123,9 +212,7 @@ class PhotosDB:
         stale_ids: list[int] = []
         pending_rows: list[aiosqlite.Row] = []
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-
+        async with self._pool.reader() as db:
             async with db.execute(
                 "SELECT COUNT(*) AS total FROM photo_assets WHERE last_imported IS NOT NULL"
             ) as cursor:
@@ -148,7 +235,7 @@ class PhotosDB:
                 stale_ids.append(row["id"])
 
         if stale_ids:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._pool.writer() as db:
                 await db.executemany(
                     "DELETE FROM photo_assets WHERE id = ?",
                     [(stale_id,) for stale_id in stale_ids],
@@ -4,6 +4,7 @@ The version is sourced from pyproject.toml (single source of truth) with a
 fallback to installed package metadata when available.
 """
 
+import functools
 from importlib.metadata import PackageNotFoundError, version as metadata_version
 from pathlib import Path
 from typing import Final
@@ -14,8 +15,9 @@ PYPROJECT_PATH: Final[Path] = Path(__file__).resolve().parents[1] / "pyproject.t
 PACKAGE_NAME: Final[str] = "icloudbridge"
 
 
+@functools.cache
 def get_version() -> str:
-    """Return the application version from pyproject.toml or package metadata."""
+    """Return the application version from pyproject.toml or package metadata (computed once)."""
     try:
         return metadata_version(PACKAGE_NAME)
     except PackageNotFoundError:
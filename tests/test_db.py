@@ -0,0 +1,195 @@
+"""Tests for the SQLite-backed state databases."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from icloudbridge.utils.db import AsyncSQLitePool, NotesDB, SyncLogsDB
+
+# note_mapping as created by releases before the WITHOUT ROWID layout
+_LEGACY_NOTE_MAPPING = """
+    CREATE TABLE note_mapping (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        local_uuid TEXT NOT NULL,
+        local_name TEXT NOT NULL,
+        local_folder_uuid TEXT NOT NULL,
+        remote_path TEXT NOT NULL,
+        last_sync_timestamp REAL NOT NULL,
+        {attachment_slug}
+        UNIQUE(local_uuid, remote_path)
+    );
+    CREATE INDEX idx_local_uuid ON note_mapping(local_uuid);
+    CREATE INDEX idx_remote_path ON note_mapping(remote_path);
+"""
+
+_LEGACY_ROWS = [
+    ("uuid-1", "Groceries", "folder-a", "/notes/a/Groceries.md", 100.0),
+    ("uuid-2", "Todo", "folder-a", "/notes/a/Todo.md", 200.0),
+    ("uuid-3", "Ideas", "folder-b", "/notes/b/Ideas.md", 300.0),
+]
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    """A private connection pool, closed after the test."""
+    pool = AsyncSQLitePool(tmp_path / "test.db")
+    yield pool
+    await pool.close()
+
+
+def _create_legacy_notes_db(db_path: Path, with_attachment_slug: bool) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        _LEGACY_NOTE_MAPPING.format(
+            attachment_slug="attachment_slug TEXT," if with_attachment_slug else ""
+        )
+    )
+    conn.executemany(
+        """
+        INSERT INTO note_mapping
+        (local_uuid, local_name, local_folder_uuid, remote_path, last_sync_timestamp)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        _LEGACY_ROWS,
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestNoteMappingMigration:
+    """Upgrading a note_mapping table created by an older release."""
+
+    @pytest.mark.parametrize("with_attachment_slug", [True, False])
+    async def test_rows_survive_migration(self, pool, with_attachment_slug):
+        _create_legacy_notes_db(pool.db_path, with_attachment_slug)
+
+        db = NotesDB(pool.db_path, pool=pool)
+        await db.initialize()
+
+        mappings = await db.get_all_mappings()
+        assert sorted(
+            (
+                m["local_uuid"],
+                m["local_name"],
+                m["local_folder_uuid"],
+                m["remote_path"],
+                m["last_sync_timestamp"],
+            )
+            for m in mappings
+        ) == _LEGACY_ROWS
+        assert all(m["attachment_slug"] is None for m in mappings)
+        assert all("id" not in m for m in mappings)
+
+    async def test_schema_uses_composite_primary_key(self, pool):
+        _create_legacy_notes_db(pool.db_path, with_attachment_slug=True)
+
+        await NotesDB(pool.db_path, pool=pool).initialize()
+        await pool.close()
+
+        conn = sqlite3.connect(pool.db_path)
+        try:
+            (table_sql,) = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'note_mapping'"
+            ).fetchone()
+            primary_key = [
+                name
+                for _, name, _, _, _, pk in sorted(
+                    conn.execute("PRAGMA table_info(note_mapping)"), key=lambda col: col[5]
+                )
+                if pk
+            ]
+            schema = conn.execute("SELECT type, name FROM sqlite_master").fetchall()
+            integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        finally:
+            conn.close()
+
+        assert "WITHOUT ROWID" in table_sql.upper()
+        assert primary_key == ["local_uuid", "remote_path"]
+        indexes = {name for kind, name in schema if kind == "index"}
+        assert {"idx_remote_path", "idx_local_folder_uuid"} <= indexes
+        assert "idx_local_uuid" not in indexes
+        assert integrity == "ok"
+
+    async def test_upsert_after_migration(self, pool):
+        _create_legacy_notes_db(pool.db_path, with_attachment_slug=True)
+
+        db = NotesDB(pool.db_path, pool=pool)
+        await db.initialize()
+
+        # Conflict on (local_uuid, remote_path) updates the migrated row in place
+        await db.upsert_mapping(
+            "uuid-1", "Groceries (week 2)", "folder-a", Path("/notes/a/Groceries.md"), 400.0, "groc"
+        )
+        # A new remote path for the same note is a separate mapping
+        await db.upsert_mapping("uuid-2", "Todo", "folder-c", Path("/notes/c/Todo.md"), 500.0)
+
+        updated = await db.get_mapping_by_remote_path("/notes/a/Groceries.md")
+        assert updated["local_name"] == "Groceries (week 2)"
+        assert updated["last_sync_timestamp"] == 400.0
+        assert updated["attachment_slug"] == "groc"
+
+        mappings = await db.get_all_mappings()
+        assert len(mappings) == len(_LEGACY_ROWS) + 1
+        assert sorted(m["remote_path"] for m in mappings if m["local_uuid"] == "uuid-2") == [
+            "/notes/a/Todo.md",
+            "/notes/c/Todo.md",
+        ]
+
+    async def test_initialize_is_idempotent(self, pool):
+        _create_legacy_notes_db(pool.db_path, with_attachment_slug=True)
+
+        db = NotesDB(pool.db_path, pool=pool)
+        await db.initialize()
+        await db.upsert_mapping("uuid-4", "New", "folder-a", Path("/notes/a/New.md"), 600.0)
+        await db.initialize()
+
+        assert len(await db.get_all_mappings()) == len(_LEGACY_ROWS) + 1
+
+
+class TestSyncLogsPagination:
+    """Keyset pagination of SyncLogsDB.get_logs."""
+
+    async def test_before_id_pages_cover_every_log_once(self, pool):
+        db = SyncLogsDB(pool.db_path, pool=pool)
+        await db.initialize()
+        ids = [await db.create_log("notes", "manual") for _ in range(7)]
+
+        seen = []
+        page = await db.get_logs(service="notes", limit=3)
+        while page:
+            seen.extend(log["id"] for log in page)
+            page = await db.get_logs(service="notes", limit=3, before_id=page[-1]["id"])
+
+        assert seen == sorted(ids, reverse=True)
+
+    async def test_pages_are_filtered_by_service(self, pool):
+        db = SyncLogsDB(pool.db_path, pool=pool)
+        await db.initialize()
+        notes_ids = []
+        for _ in range(4):
+            notes_ids.append(await db.create_log("notes", "manual"))
+            await db.create_log("reminders", "manual")
+
+        first = await db.get_logs(service="notes", limit=2)
+        second = await db.get_logs(service="notes", limit=2, before_id=first[-1]["id"])
+        rest = await db.get_logs(service="notes", limit=2, before_id=second[-1]["id"])
+
+        assert [log["id"] for log in first + second] == sorted(notes_ids, reverse=True)
+        assert rest == []
+        assert {log["service"] for log in first + second} == {"notes"}
+
+    async def test_first_page_orders_by_id(self, pool):
+        db = SyncLogsDB(pool.db_path, pool=pool)
+        await db.initialize()
+        ids = [await db.create_log("notes", "manual") for _ in range(3)]
+
+        # A later-created log with an earlier start time must not jump pages
+        async with pool.writer() as conn:
+            await conn.execute("UPDATE sync_logs SET started_at = 0 WHERE id = ?", (ids[-1],))
+            await conn.commit()
+
+        first = await db.get_logs(service="notes", limit=1)
+        rest = await db.get_logs(service="notes", limit=10, before_id=first[0]["id"])
+
+        assert [log["id"] for log in first + rest] == sorted(ids, reverse=True)